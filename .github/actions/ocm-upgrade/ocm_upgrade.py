@@ -1,6 +1,7 @@
 #!/usr/bin/env python
 
 import collections.abc
+import concurrent.futures
 import dataclasses
 import enum
 import logging
@@ -417,6 +418,113 @@ def upgrade_pullrequest_exists(
     return False
 
 
+class PrefetchedLookups:
+    '''
+    wraps the given version- and component-descriptor-lookups. Results for names / ids passed to
+    `prefetch` are retrieved concurrently, and served from memory afterwards. Lookups for other
+    names / ids are delegated to the wrapped lookups. Errors raised during prefetching are re-raised
+    upon lookup (as if the wrapped lookup had been called directly).
+    '''
+    def __init__(
+        self,
+        component_descriptor_lookup: ocm.ComponentDescriptorLookup,
+        version_lookup: ocm.VersionLookup,
+    ):
+        self._component_descriptor_lookup = component_descriptor_lookup
+        self._version_lookup = version_lookup
+        self._versions: dict[str, concurrent.futures.Future] = {}
+        self._component_descriptors: dict[ocm.ComponentIdentity, concurrent.futures.Future] = {}
+
+    def _retrieve_versions(self, component_name: str) -> list[str]:
+        return list(self._version_lookup(component_name))
+
+    def prefetch(
+        self,
+        component_names: collections.abc.Iterable[str],
+        upstream_component_names: collections.abc.Iterable[str],
+        ignore_prerelease_versions: bool=True,
+        max_workers: int=8,
+    ):
+        '''
+        retrieves versions for all given component-names, and component-descriptors of greatest
+        versions of upstream-components.
+        '''
+        upstream_component_names = set(upstream_component_names)
+        component_names = set(component_names) | upstream_component_names
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as pool:
+            for component_name in component_names:
+                self._versions[component_name] = pool.submit(
+                    self._retrieve_versions,
+                    component_name,
+                )
+
+            for component_name in upstream_component_names:
+                versions_future = self._versions[component_name]
+                if versions_future.exception():
+                    continue
+
+                upstream_version = version.greatest_version(
+                    versions=versions_future.result(),
+                    ignore_prerelease_versions=ignore_prerelease_versions,
+                )
+                if not upstream_version:
+                    continue
+
+                component_id = ocm.ComponentIdentity(
+                    name=component_name,
+                    version=upstream_version,
+                )
+                self._component_descriptors[component_id] = pool.submit(
+                    self._component_descriptor_lookup,
+                    component_id,
+                )
+
+        logger.info(
+            f'prefetched versions of {len(self._versions)} components, and '
+            f'{len(self._component_descriptors)} upstream component-descriptors'
+        )
+
+    def version_lookup(self, component_name: str, /) -> collections.abc.Sequence[str]:
+        if (future := self._versions.get(component_name)):
+            return future.result()
+
+        return self._version_lookup(component_name)
+
+    def component_descriptor_lookup(
+        self,
+        component_id: ocm.ComponentIdentity,
+        /,
+        **kwargs,
+    ) -> ocm.ComponentDescriptor | None:
+        if (future := self._component_descriptors.get(component_id)):
+            return future.result()
+
+        return self._component_descriptor_lookup(component_id, **kwargs)
+
+
+class OpenUpgradePullRequests:
+    '''
+    snapshot of open upgrade-pullrequests, shared for one run. Callers should `refresh` it after
+    creating pullrequests (instead of re-listing pullrequests for each check).
+    '''
+    def __init__(
+        self,
+        repository: github3.repos.Repository,
+        reference_component: ocm.Component,
+    ):
+        self.repository = repository
+        self.reference_component = reference_component
+        self.refresh()
+
+    def refresh(self):
+        self.upgrade_pullrequests = list(github.pullrequest.iter_upgrade_pullrequests(
+            repository=self.repository,
+            state='open',
+            reference_component=self.reference_component,
+        ))
+
+
 def create_upgrade_pullrequests(
     component: ocm.Component,
     component_descriptor_lookup: ocm.ComponentDescriptorLookup,
@@ -436,9 +544,47 @@ def create_upgrade_pullrequests(
     ignore_prerelease_versions: bool=True,
     component_policies: list[ComponentPolicy] | None=None,
 ) -> collections.abc.Iterable[github.pullrequest.UpgradePullRequest]:
-    for cref in ocm.gardener.iter_greatest_component_references(
+    crefs = list(ocm.gardener.iter_greatest_component_references(
         references=ocm.gardener.iter_component_references(component=component),
-    ):
+    ))
+
+    def effective_upstream(cref: ocm.ComponentReference) -> tuple[str | None, UpstreamUpdatePolicy]:
+        effective_upstream_component_name = upstream_component_name
+        effective_upstream_update_policy = upstream_update_policy
+        for component_policy in (component_policies or ()):
+            if component_policy.matches(cref.componentName):
+                if component_policy.upstream_component_name is not None:
+                    effective_upstream_component_name = component_policy.upstream_component_name
+                if component_policy.upstream_update_policy is not None:
+                    effective_upstream_update_policy = component_policy.upstream_update_policy
+                break
+
+        return effective_upstream_component_name, effective_upstream_update_policy
+
+    # planning-phase: retrieve versions and upstream component-descriptors for all crefs upfront
+    # (concurrently), so the (serial) processing below does not need to wait for each of them
+    prefetched_lookups = PrefetchedLookups(
+        component_descriptor_lookup=component_descriptor_lookup,
+        version_lookup=version_lookup,
+    )
+    prefetched_lookups.prefetch(
+        component_names={cref.componentName for cref in crefs},
+        upstream_component_names={
+            upstream_name
+            for cref in crefs
+            if (upstream_name := effective_upstream(cref)[0])
+        },
+        ignore_prerelease_versions=ignore_prerelease_versions,
+    )
+    planning_component_descriptor_lookup = prefetched_lookups.component_descriptor_lookup
+    planning_version_lookup = prefetched_lookups.version_lookup
+
+    open_upgrade_pullrequests = OpenUpgradePullRequests(
+        repository=repository,
+        reference_component=component,
+    )
+
+    for cref in crefs:
         logger.info(f'processing {cref=}')
         upgrade_vectors: list[ocm.gardener.UpgradeVector] = []
 
@@ -451,19 +597,13 @@ def create_upgrade_pullrequests(
             current_merge_policy = merge_policy
             current_merge_method = merge_method
 
-        effective_upstream_component_name = upstream_component_name
-        effective_upstream_update_policy = upstream_update_policy
-        for component_policy in (component_policies or ()):
-            if component_policy.matches(cref.componentName):
-                if component_policy.upstream_component_name is not None:
-                    effective_upstream_component_name = component_policy.upstream_component_name
-                if component_policy.upstream_update_policy is not None:
-                    effective_upstream_update_policy = component_policy.upstream_update_policy
-                break
+        effective_upstream_component_name, effective_upstream_update_policy = effective_upstream(
+            cref,
+        )
 
         if effective_upstream_component_name:
             upstream_version = version.greatest_version(
-                versions=version_lookup(effective_upstream_component_name),
+                versions=planning_version_lookup(effective_upstream_component_name),
                 ignore_prerelease_versions=ignore_prerelease_versions
             )
 
@@ -471,7 +611,7 @@ def create_upgrade_pullrequests(
                 logger.warning(f'no versions for upstream {effective_upstream_component_name=}')
                 continue
 
-            upstream_cd: ocm.ComponentDescriptor = component_descriptor_lookup(
+            upstream_cd: ocm.ComponentDescriptor = planning_component_descriptor_lookup(
                 ocm.ComponentIdentity(
                     name=effective_upstream_component_name,
                     version=upstream_version,
@@ -488,7 +628,7 @@ def create_upgrade_pullrequests(
             if effective_upstream_update_policy is UpstreamUpdatePolicy.STRICTLY_FOLLOW:
                 candidates = (upstream_target_version,)
             elif effective_upstream_update_policy is UpstreamUpdatePolicy.ACCEPT_HOTFIXES:
-                cref_versions = version_lookup(cref.componentName)
+                cref_versions = planning_version_lookup(cref.componentName)
                 hotfix = version.greatest_version_with_matching_minor(
                     reference_version=cref.version,
                     versions=cref_versions,
@@ -530,7 +670,7 @@ def create_upgrade_pullrequests(
         else:
             upgrade_vector = ocm.gardener.find_upgrade_vector(
                 component_id=cref.component_id,
-                version_lookup=version_lookup,
+                version_lookup=planning_version_lookup,
                 ignore_prerelease_versions=ignore_prerelease_versions,
                 ignore_invalid_semver_versions=True,
             )
@@ -558,11 +698,7 @@ def create_upgrade_pullrequests(
             # static check above before either had created a PR
             if upgrade_pullrequest_exists(
                 upgrade_vector=uv,
-                upgrade_pullrequests=github.pullrequest.iter_upgrade_pullrequests(
-                    repository=repository,
-                    state='open',
-                    reference_component=component,
-                ),
+                upgrade_pullrequests=open_upgrade_pullrequests.upgrade_pullrequests,
                 component_reference_name=component_reference_name,
             ):
                 logger.info(f'upgrade-pullrequest for {uv=} already exists (live-check, skipping)')
@@ -609,6 +745,13 @@ def create_upgrade_pullrequests(
                     )
                 )
 
+                # pick up pullrequests created in the meantime (by us, or by concurrent runs)
+                try:
+                    open_upgrade_pullrequests.refresh()
+                except Exception as e:
+                    # keep previously listed pullrequests; next refresh might succeed
+                    logger.error(f'failed to refresh upgrade-pullrequests: {e}')
+
 
 def main():
     pass
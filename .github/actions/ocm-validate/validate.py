@@ -43,6 +43,7 @@ def validate(
         nodes=nodes,
         oci_client=oci.client.client_with_dockerauth(),
         validation_cfg=validation_cfg,
+        max_workers=8,
     ):
         total += 1
         if not isinstance(result, ocm.validate.ValidationError):
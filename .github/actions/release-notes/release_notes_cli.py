@@ -26,10 +26,12 @@ except ImportError:
 
 import cnudie.retrieve
 import github
+import github.cache
 import gitutil
 import oci.auth
 import oci.client
 import ocm.iter
+import release_notes.cache as rnc
 import release_notes.fetch as rnf
 import release_notes.model as rnm
 import release_notes.ocm as rno
@@ -96,6 +98,22 @@ def main():
         default=False,
         help='if set, will fetch draft-release-notes',
     )
+    parser.add_argument(
+        '--source-block-cache',
+        default=None,
+        help='''\
+            path to a (sqlite) file used to cache parsed release-notes blocks across runs
+            (created if absent). if not passed, release-notes are always parsed.
+        ''',
+    )
+    parser.add_argument(
+        '--github-response-cache',
+        default=None,
+        help='''\
+            path to a (sqlite) file used to cache github-api responses across runs (created if
+            absent); cached responses are revalidated using conditional requests.
+        ''',
+    )
     parser.add_argument(
         '--full-release-notes',
         default='-',
@@ -213,9 +231,17 @@ def main():
     host, org, repo = github.host_org_and_repo(
         repo_url=parsed.repo_url,
     )
+    if parsed.github_response_cache:
+        github_response_cache = github.cache.ConditionalRequestCache(
+            path=parsed.github_response_cache,
+        )
+    else:
+        github_response_cache = None
+
     github_api = github.github_api(
         repo_url=parsed.repo_url,
         token=parsed.github_auth_token,
+        response_cache=github_response_cache,
     )
 
     git_helper = gitutil.GitHelper(
@@ -232,6 +258,11 @@ def main():
         # XXX: needs to be extended for cross-github-support
         return github_api
 
+    if parsed.source_block_cache:
+        source_block_cache = rnc.SourceBlockCache(path=parsed.source_block_cache)
+    else:
+        source_block_cache = None
+
     try:
         component_release_notes_doc, subcomponent_release_notes_docs = rnf.collect_release_notes(
             git_helper=git_helper,
@@ -241,6 +272,7 @@ def main():
             github_api_lookup=github_api_lookup,
             version_whither_ref_commit=version_whither_ref_commit,
             is_draft=parsed.draft,
+            source_block_cache=source_block_cache,
         )
     except Exception as e:
         print(f'Warning: error whilst fetch release-notes: {e=}')
@@ -248,6 +280,11 @@ def main():
         traceback.print_exc(file=sys.stderr)
         component_release_notes_doc = None
         subcomponent_release_notes_docs = []
+    finally:
+        if source_block_cache:
+            source_block_cache.close()
+        if github_response_cache:
+            github_response_cache.close()
 
     if component_release_notes_doc:
         release_notes_md = ensure_trailing_newline(rno.release_notes_docs_as_markdown(
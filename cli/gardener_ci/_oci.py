@@ -2,20 +2,20 @@ import concurrent.futures
 import enum
 import hashlib
 import json
+import os
 import pprint
 import subprocess
 import sys
-import tarfile
 import tempfile
 
 import requests
 
 import ccc.oci
 import oci
+import oci.layerindex
 import oci.merge
 import oci.model as om
 import oci.workarounds as ow
-import tarutil
 import version
 
 __cmd_name__ = 'oci'
@@ -76,11 +76,14 @@ def _manifest(
     return manifest
 
 
-def ls(
+def _layer_index_dir() -> str:
+    return os.path.join(tempfile.gettempdir(), 'gardener-ci-oci-layer-indices')
+
+
+def _image_file_reader(
     image: str,
-    long: bool=False, # inspired by ls --long ; aka: ls -l
-):
-    oci_client = ccc.oci.oci_client()
+    oci_client,
+) -> oci.layerindex.ImageFileReader:
     image_reference: om.OciImageReference = om.OciImageReference.to_image_ref(image)
 
     manifest = _manifest(
@@ -88,32 +91,42 @@ def ls(
         oci_client=oci_client,
     )
 
-    for layer in manifest.layers:
-        blob = oci_client.blob(image_reference=image_reference, digest=layer.digest)
-
-        with tarfile.open(
-            fileobj=tarutil.FilelikeProxy(generator=blob.iter_content(chunk_size=8192)),
-            mode='r|*',
-        ) as tf:
-            for info in tf:
-                if long:
-                    suffix = ''
-                    if info.isdir():
-                        prefix = 'd'
-                    elif info.isfile():
-                        prefix = 'f'
-                        suffix = f'({info.size})'
-                    elif info.issym():
-                        suffix = f'-> {info.linkname}'
-                        prefix = 's'
-                    elif info.islnk():
-                        prefix = 'l'
-                    else:
-                        prefix = ' '
-
-                    print(f'{prefix} {info.name} {suffix}')
-                else:
-                    print(info.name)
+    return oci.layerindex.ImageFileReader(
+        oci_client=oci_client,
+        image_reference=image_reference,
+        manifest=manifest,
+        cache_dir=_layer_index_dir(),
+    )
+
+
+def ls(
+    image: str,
+    long: bool=False, # inspired by ls --long ; aka: ls -l
+):
+    image_file_reader = _image_file_reader(
+        image=image,
+        oci_client=ccc.oci.oci_client(),
+    )
+
+    for _, member in image_file_reader.iter_members():
+        if long:
+            suffix = ''
+            if member.isdir():
+                prefix = 'd'
+            elif member.isfile():
+                prefix = 'f'
+                suffix = f'({member.size})'
+            elif member.issym():
+                suffix = f'-> {member.linkname}'
+                prefix = 's'
+            elif member.islnk():
+                prefix = 'l'
+            else:
+                prefix = ' '
+
+            print(f'{prefix} {member.name} {suffix}')
+        else:
+            print(member.name)
 
 
 def cat(
@@ -125,44 +138,26 @@ def cat(
         print('error: either redirect output, or specify --outfile')
         exit(1)
 
-    image_reference = oci.model.OciImageReference.to_image_ref(image)
-
-    oci_client = ccc.oci.oci_client()
-    manifest = _manifest(
-        image_reference=image_reference,
-        oci_client=oci_client,
+    image_file_reader = _image_file_reader(
+        image=image,
+        oci_client=ccc.oci.oci_client(),
     )
 
-    for layer in manifest.layers:
-        blob = oci_client.blob(image_reference=image_reference, digest=layer.digest)
-
-        with tarfile.open(
-            fileobj=tarutil.FilelikeProxy(generator=blob.iter_content(chunk_size=8192)),
-            mode='r|*',
-        ) as tf:
-            for info in tf:
-                if path.removeprefix('/') != info.name.removeprefix('/'):
-                    continue
-                break
-            else:
-                continue
-
-            if not info.isfile():
-                print(f'error: {path=} is not a regular file')
-                exit(1)
-            if outfile == '-':
-                outfile = sys.stdout.buffer
-            else:
-                outfile = open(outfile, 'wb')
+    _, member = image_file_reader.find(path)
+    if not member:
+        print(f'error: did not find {path=}')
+        exit(1)
+    if not member.isfile():
+        print(f'error: {path=} is not a regular file')
+        exit(1)
 
-            octects_left = info.size
-            while octects_left:
-                read = min(octects_left, 8192)
-                outfile.write(tf.fileobj.read(read))
-                octects_left -= read
+    content = image_file_reader.read(path)
 
-            # stop after first match
-            exit(0)
+    if outfile == '-':
+        sys.stdout.buffer.write(content)
+    else:
+        with open(outfile, 'wb') as f:
+            f.write(content)
 
 
 def purge(image: str):
@@ -1,6 +1,8 @@
 import collections.abc
+import concurrent.futures
+import dataclasses
 import logging
-import traceback
+import threading
 
 import cnudie.retrieve
 import cnudie.util
@@ -13,6 +15,50 @@ import version
 logger = logging.getLogger(__name__)
 
 
+class _HostSemaphores:
+    '''
+    limits the amount of concurrent requests against the same (registry-)host
+    '''
+    def __init__(self, max_workers_per_host: int):
+        self.max_workers_per_host = max_workers_per_host
+        self._semaphores: dict[str, threading.Semaphore] = {}
+        self._lock = threading.Lock()
+
+    def __call__(self, image_reference: str | om.OciImageReference) -> threading.Semaphore:
+        host = om.OciImageReference.to_image_ref(image_reference).netloc
+        with self._lock:
+            if not (semaphore := self._semaphores.get(host)):
+                semaphore = self._semaphores[host] = threading.Semaphore(
+                    self.max_workers_per_host,
+                )
+            return semaphore
+
+
+def _versions_to_purge(
+    tags: collections.abc.Iterable[str],
+    reference_version: str,
+    policy: version.VersionRetentionPolicies,
+) -> list[str]:
+    '''
+    returns the tags to purge according to the given policy. Tags are parsed only once (rather
+    than once per rule, and again for sorting); tags which are not valid versions (e.g. cosign-
+    signatures) are ignored.
+    '''
+    version_index = {}
+    for tag in tags:
+        if (parsed_version := version.parse_to_semver(tag, invalid_semver_ok=True)) is None:
+            logger.debug(f'ignoring {tag=} (not a valid version)')
+            continue
+        version_index[tag] = parsed_version
+
+    return list(version.versions_to_purge(
+        versions=tuple(version_index),
+        reference_version=version.parse_to_semver(reference_version),
+        policy=policy,
+        converter=version_index.__getitem__,
+    ))
+
+
 def iter_componentversions_to_purge(
     component: ocm.Component | ocm.ComponentDescriptor,
     policy: version.VersionRetentionPolicies,
@@ -22,8 +68,8 @@ def iter_componentversions_to_purge(
     if isinstance(component, ocm.ComponentDescriptor):
         component = component.component
 
-    for v in version.versions_to_purge(
-        versions=oci_client.tags(oci_ref.ref_without_tag),
+    for v in _versions_to_purge(
+        tags=oci_client.tags(oci_ref.ref_without_tag),
         reference_version=component.version,
         policy=policy,
     ):
@@ -33,21 +79,120 @@ def iter_componentversions_to_purge(
         )
 
 
-def remove_component_descriptor_and_referenced_artefacts(
-    component: ocm.Component | ocm.ComponentDescriptor,
+def componentversions_to_purge(
+    components: collections.abc.Iterable[ocm.Component | ocm.ComponentDescriptor],
+    policy: version.VersionRetentionPolicies,
     oci_client: oc.Client,
+    max_workers: int=16,
+    max_workers_per_host: int=4,
+) -> list[tuple[ocm.Component, list[ocm.ComponentIdentity]]]:
+    '''
+    determines component-versions to purge (see `iter_componentversions_to_purge`) for each of the
+    given (reference-)components. Tags are listed concurrently (running at most
+    `max_workers_per_host` requests against the same registry-host).
+    '''
+    components = [
+        component.component if isinstance(component, ocm.ComponentDescriptor) else component
+        for component in components
+    ]
+    host_semaphore = _HostSemaphores(max_workers_per_host=max_workers_per_host)
+
+    def list_tags(component: ocm.Component) -> list[str]:
+        oci_ref = cnudie.util.oci_ref(component=component)
+        with host_semaphore(oci_ref):
+            return oci_client.tags(oci_ref.ref_without_tag)
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+        components_tags = list(executor.map(list_tags, components))
+
+    return [
+        (
+            component,
+            [
+                ocm.ComponentIdentity(
+                    name=component.name,
+                    version=v,
+                ) for v in _versions_to_purge(
+                    tags=tags,
+                    reference_version=component.version,
+                    policy=policy,
+                )
+            ],
+        ) for component, tags in zip(components, components_tags)
+    ]
+
+
+@dataclasses.dataclass
+class PurgePlan:
+    '''
+    deletion-set for purging component-descriptors and their (local) resources. Resources shared
+    by multiple components are contained only once (keyed by image-reference).
+    '''
+    components: list[ocm.Component] = dataclasses.field(default_factory=list)
+    resources: dict[str, ocm.iter.ResourceNode] = dataclasses.field(default_factory=dict)
+    # component-identity -> image-references of resources to remove before component-descriptor
+    component_resources: dict[ocm.ComponentIdentity, set[str]] = dataclasses.field(
+        default_factory=dict,
+    )
+
+    def cost_report(self) -> str:
+        '''
+        returns a human-readable summary of manifest-deletions (per registry-host) required for
+        executing this plan (platform-specific manifests of multi-arch images are not included)
+        '''
+        resources_per_host = collections.Counter(
+            om.OciImageReference(image_reference).netloc
+            for image_reference in self.resources
+        )
+        components_per_host = collections.Counter(
+            cnudie.util.oci_ref(component=component).netloc
+            for component in self.components
+        )
+
+        return '\n'.join((
+            f'purge-plan: {len(self.components)} component-descriptor(s), '
+            f'{len(self.resources)} resource(s)',
+            *(
+                f'  {host}: {components_per_host[host]} component-descriptor(s), '
+                f'{resources_per_host[host]} resource(s)'
+                for host in sorted(resources_per_host.keys() | components_per_host.keys())
+            ),
+        ))
+
+
+@dataclasses.dataclass
+class PurgeResult:
+    removed_resources: list[str] = dataclasses.field(default_factory=list)
+    removed_components: list[ocm.ComponentIdentity] = dataclasses.field(default_factory=list)
+    failed_resources: dict[str, Exception] = dataclasses.field(default_factory=dict)
+    failed_components: dict[ocm.ComponentIdentity, Exception] = dataclasses.field(
+        default_factory=dict,
+    )
+    # component-descriptors which were not removed, because removal of resources failed
+    skipped_components: list[ocm.ComponentIdentity] = dataclasses.field(default_factory=list)
+
+    @property
+    def ok(self) -> bool:
+        return not (self.failed_resources or self.failed_components or self.skipped_components)
+
+
+def plan_purge(
+    component: ocm.Component | ocm.ComponentDescriptor,
     lookup: cnudie.retrieve.ComponentDescriptorLookupById=None,
     recursive: bool=False,
-    on_error: str='abort', # todo: implement, e.g. patch-component-descriptor-and-abort
-    absent_ok: bool=False,
-):
+    plan: PurgePlan | None=None,
+) -> PurgePlan:
+    '''
+    collects component-descriptors and (local, oci-image) resources to remove for purging the
+    given component (and, if `recursive` is set, referenced components). If `plan` is passed, it
+    is extended (and returned).
+    '''
     if isinstance(component, ocm.ComponentDescriptor):
         component = component.component
 
-    logger.info(f'will try to purge {component.name}:{component.version} including local resources')
-
-    current_component = None
-    resources_with_removal_errors = []
+    if plan is None:
+        plan = PurgePlan()
+    current_resources = None
 
     for node in ocm.iter.iter(
         component=component,
@@ -59,13 +204,11 @@ def remove_component_descriptor_and_referenced_artefacts(
         # - resource-nodes (if any)
         # - source-nodes (if any)
         if isinstance(node, ocm.iter.ComponentNode):
-            if current_component: # skip for first iteration
-                _remove_component_descriptor(
-                    component=current_component,
-                    oci_client=oci_client,
-                    absent_ok=absent_ok,
-                )
-            current_component = node.component
+            if node.component.identity() in plan.component_resources:
+                current_resources = set() # already planned (resources are already collected)
+                continue
+            plan.components.append(node.component)
+            current_resources = plan.component_resources[node.component.identity()] = set()
             continue
 
         if isinstance(node, ocm.iter.SourceNode):
@@ -75,33 +218,262 @@ def remove_component_descriptor_and_referenced_artefacts(
             if not node.resource.relation is ocm.ResourceRelation.LOCAL:
                 logger.debug(f'skipping non-local {node.resource.name=}')
                 continue
-            try:
-                did_remove = _remove_resource(
-                    node=node,
-                    oci_client=oci_client,
-                    absent_ok=absent_ok,
-                )
-                if not did_remove:
-                    logger.info(f'do not know how to remove {node.resource=}')
-            except Exception as e:
-                logger.warning(f'error while trying to remove {node.resource=} - {e=}')
-                traceback.print_exc()
-                resources_with_removal_errors.append(node)
+
+            if not (image_reference := _removable_image_reference(node.resource)):
+                logger.info(f'do not know how to remove {node.resource=}')
+                continue
+
+            plan.resources.setdefault(image_reference, node)
+            current_resources.add(image_reference)
+
+    return plan
+
+
+def execute_purge(
+    plan: PurgePlan,
+    oci_client: oc.Client,
+    on_error: str='abort',
+    absent_ok: bool=False,
+    max_workers: int=16,
+    max_workers_per_host: int=4,
+) -> PurgeResult:
+    '''
+    removes resources and component-descriptors from the given plan, using a thread-pool (running
+    at most `max_workers_per_host` removals concurrently against the same registry-host).
+    Component-descriptors are only removed once all of their resources were removed successfully.
+
+    on_error:
+    - abort: pending removals are cancelled upon first error, which is re-raised
+    - continue: remaining removals are done; component-descriptors of components with failed
+                resource-removals are kept (see `PurgeResult.skipped_components`)
+    '''
+    if on_error not in ('abort', 'continue'):
+        raise ValueError(f'unknown value {on_error=}')
+
+    host_semaphore = _HostSemaphores(max_workers_per_host=max_workers_per_host)
+
+    def remove_resource(image_reference: str, node: ocm.iter.ResourceNode):
+        with host_semaphore(image_reference):
+            _remove_resource(
+                node=node,
+                oci_client=oci_client,
+                absent_ok=absent_ok,
+            )
+
+    def remove_component_descriptor(component: ocm.Component):
+        with host_semaphore(cnudie.util.oci_ref(component=component)):
+            _remove_component_descriptor(
+                component=component,
+                oci_client=oci_client,
+                absent_ok=absent_ok,
+            )
+
+    result = PurgeResult()
+
+    def run(
+        executor: concurrent.futures.Executor,
+        tasks: dict[object, tuple], # key -> (function, *args)
+        kind: str,
+        removed: list,
+        failed: dict,
+    ):
+        futures = {
+            executor.submit(*task): key
+            for key, task in tasks.items()
+        }
+
+        for done_count, future in enumerate(concurrent.futures.as_completed(futures), start=1):
+            key = futures[future]
+
+            if (exception := future.exception()):
+                logger.warning(f'error while trying to remove {kind} {key} - {exception=}')
+                failed[key] = exception
+
                 if on_error == 'abort':
-                    logger.fatal('error encountered - aborting comoponent-descriptor-removal')
-                    raise e
-                else:
-                    raise ValueError(f'unknown value {on_error=}')
-
-    # remove final component (last component-component-descriptor would otherwise not be removed,
-    # as we remove component-descriptors only after (trying to) remove referenced resources.
-    if current_component:
-        _remove_component_descriptor(
-            component=component,
+                    logger.fatal(f'error encountered - aborting purge ({kind} {key})')
+                    for pending_future in futures:
+                        pending_future.cancel()
+                    raise exception
+            else:
+                removed.append(key)
+
+            logger.info(f'purge-progress: {done_count}/{len(futures)} {kind}(s) ({key})')
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+        logger.info(
+            f'purging {len(plan.resources)} resource(s) of {len(plan.components)} component(s)'
+        )
+        run(
+            executor=executor,
+            tasks={
+                image_reference: (remove_resource, image_reference, node)
+                for image_reference, node in plan.resources.items()
+            },
+            kind='resource',
+            removed=result.removed_resources,
+            failed=result.failed_resources,
+        )
+
+        removable_components = []
+        for component in plan.components:
+            component_id = component.identity()
+            if plan.component_resources[component_id] & result.failed_resources.keys():
+                logger.warning(f'will not remove {component_id} (failed to remove resources)')
+                result.skipped_components.append(component_id)
+                continue
+            removable_components.append(component)
+
+        run(
+            executor=executor,
+            tasks={
+                component.identity(): (remove_component_descriptor, component)
+                for component in removable_components
+            },
+            kind='component-descriptor',
+            removed=result.removed_components,
+            failed=result.failed_components,
+        )
+
+    if not result.ok:
+        logger.warning(
+            f'purge finished with errors: {len(result.failed_resources)=} '
+            f'{len(result.failed_components)=} {len(result.skipped_components)=}'
+        )
+
+    return result
+
+
+def remove_component_descriptor_and_referenced_artefacts(
+    component: ocm.Component | ocm.ComponentDescriptor,
+    oci_client: oc.Client,
+    lookup: cnudie.retrieve.ComponentDescriptorLookupById=None,
+    recursive: bool=False,
+    on_error: str='abort',
+    absent_ok: bool=False,
+    max_workers: int=16,
+    max_workers_per_host: int=4,
+) -> PurgeResult:
+    '''
+    removes the given component's component-descriptor, and the (local) resources it references
+    (recursively for referenced components if `recursive` is set). See `plan_purge` and
+    `execute_purge`.
+    '''
+    if isinstance(component, ocm.ComponentDescriptor):
+        component = component.component
+
+    logger.info(f'will try to purge {component.name}:{component.version} including local resources')
+
+    plan = plan_purge(
+        component=component,
+        lookup=lookup,
+        recursive=recursive,
+    )
+
+    return execute_purge(
+        plan=plan,
+        oci_client=oci_client,
+        on_error=on_error,
+        absent_ok=absent_ok,
+        max_workers=max_workers,
+        max_workers_per_host=max_workers_per_host,
+    )
+
+
+def plan_retention_purge(
+    components: collections.abc.Iterable[ocm.Component | ocm.ComponentDescriptor],
+    policy: version.VersionRetentionPolicies,
+    oci_client: oc.Client,
+    lookup: cnudie.retrieve.ComponentDescriptorLookupById,
+    recursive: bool=False,
+    max_workers: int=16,
+    max_workers_per_host: int=4,
+) -> PurgePlan:
+    '''
+    returns a (single) purge-plan for all component-versions to purge according to the given
+    policy (see `componentversions_to_purge`), for each of the given (reference-)components.
+    '''
+    componentversions = [
+        (component, component_id)
+        for component, component_ids in componentversions_to_purge(
+            components=components,
+            policy=policy,
             oci_client=oci_client,
-            absent_ok=absent_ok,
+            max_workers=max_workers,
+            max_workers_per_host=max_workers_per_host,
+        )
+        for component_id in component_ids
+    ]
+
+    def lookup_component_descriptor(
+        component_and_id: tuple[ocm.Component, ocm.ComponentIdentity],
+    ) -> ocm.ComponentDescriptor:
+        component, component_id = component_and_id
+        if (ocm_repo := component.current_ocm_repo):
+            return lookup(component_id, ocm_repo)
+        return lookup(component_id)
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+        component_descriptors = list(executor.map(lookup_component_descriptor, componentversions))
+
+    plan = PurgePlan()
+    for component_descriptor in component_descriptors:
+        plan_purge(
+            component=component_descriptor,
+            lookup=lookup,
+            recursive=recursive,
+            plan=plan,
         )
 
+    return plan
+
+
+def purge_componentversions(
+    components: collections.abc.Iterable[ocm.Component | ocm.ComponentDescriptor],
+    policy: version.VersionRetentionPolicies,
+    oci_client: oc.Client,
+    lookup: cnudie.retrieve.ComponentDescriptorLookupById,
+    recursive: bool=False,
+    dry_run: bool | None=None,
+    on_error: str='continue',
+    absent_ok: bool=True,
+    max_workers: int=16,
+    max_workers_per_host: int=4,
+) -> tuple[PurgePlan, PurgeResult | None]:
+    '''
+    purges component-versions (and their local resources) according to the given retention-
+    policy, for each of the given (reference-)components. Deletions across all repositories are
+    done using a single thread-pool (see `execute_purge`).
+
+    If `dry_run` is set (defaults to `policy.dry_run`), nothing is removed (the returned
+    purge-result is None); the purge-plan's cost-report is logged in any case.
+    '''
+    if dry_run is None:
+        dry_run = policy.dry_run
+
+    plan = plan_retention_purge(
+        components=components,
+        policy=policy,
+        oci_client=oci_client,
+        lookup=lookup,
+        recursive=recursive,
+        max_workers=max_workers,
+        max_workers_per_host=max_workers_per_host,
+    )
+    logger.info(plan.cost_report())
+
+    if dry_run:
+        logger.info(f'{policy.name=}: dry-run - will not remove anything')
+        return plan, None
+
+    return plan, execute_purge(
+        plan=plan,
+        oci_client=oci_client,
+        on_error=on_error,
+        absent_ok=absent_ok,
+        max_workers=max_workers,
+        max_workers_per_host=max_workers_per_host,
+    )
+
 
 def _remove_component_descriptor(
     component: ocm.Component,
@@ -119,23 +491,28 @@ def _remove_component_descriptor(
     )
 
 
-def _remove_resource(
-    node: ocm.iter.ResourceNode,
-    oci_client: oc.Client,
-    absent_ok: bool=False,
-) -> bool:
-    resource = node.resource
+def _removable_image_reference(resource: ocm.Resource) -> str | None:
     if not resource.type in (ocm.ArtefactType.OCI_IMAGE, 'ociImage'):
-        return False # we only support removal of oci-images for now
+        return None # we only support removal of oci-images for now
 
     if not resource.relation in (ocm.ResourceRelation.LOCAL, 'local'):
-        return False # external resources can never be removed (as we do not "own" them)
+        return None # external resources can never be removed (as we do not "own" them)
 
     if not isinstance(resource.access, ocm.OciAccess):
-        return False # similar to above: we only support removal of oci-images in oci-registries
+        return None # similar to above: we only support removal of oci-images in oci-registries
+
+    return resource.access.imageReference
+
+
+def _remove_resource(
+    node: ocm.iter.ResourceNode,
+    oci_client: oc.Client,
+    absent_ok: bool=False,
+) -> bool:
+    if not (image_reference := _removable_image_reference(node.resource)):
+        return False
 
-    access: ocm.OciAccess = resource.access
-    image_reference = om.OciImageReference(access.imageReference)
+    image_reference = om.OciImageReference(image_reference)
 
     manifest = oci_client.manifest(
         image_reference=image_reference,
@@ -541,6 +541,15 @@ def format_component_diff(
     )
 
 
+def _group_by_name(
+    elements: collections.abc.Iterable[ocm.Resource | ocm.Source | ocm.Label],
+) -> dict[str, list]:
+    groups = collections.defaultdict(list)
+    for element in elements:
+        groups[element.name].append(element)
+    return groups
+
+
 def _enumerate_group_pairs(
     left_elements: collections.abc.Sequence[ocm.Resource | ocm.Source | ocm.Label],
     right_elements: collections.abc.Sequence[ocm.Resource | ocm.Source, ocm.Label],
@@ -551,26 +560,26 @@ collections.abc.Generator[tuple, None, None]:
 
     Can be used for Resources, Sources and Label
     '''
+    left_groups = _group_by_name(left_elements)
+    right_groups = _group_by_name(right_elements)
+
     # group the resources with the same name on both sides
     for element in left_elements:
-        right_elements_group = [e for e in right_elements if e.name == element.name]
-        # get resources for one resource via name
-
-        # key is always in left group so we only have to check the length of the right group
-        if len(right_elements_group) == 0:
+        # key is always in left group so we only have to check the right group
+        if not (right_elements_group := right_groups.get(element.name)):
             continue
-        else:
-            left_elements_group = [e for e in left_elements if e.name == element.name]
-
-            if unique_name:
-                if len(left_elements_group) == 1 and len(right_elements_group) == 1:
-                    yield (left_elements_group[0], right_elements_group[0])
-                else:
-                    raise RuntimeError(
-                        f'Element name "{element.name}"" is not unique at least one list. '
-                        f'{len(left_elements_group)=} {len(right_elements_group)=}')
+
+        left_elements_group = left_groups[element.name]
+
+        if unique_name:
+            if len(left_elements_group) == 1 and len(right_elements_group) == 1:
+                yield (left_elements_group[0], right_elements_group[0])
             else:
-                yield (left_elements_group, right_elements_group)
+                raise RuntimeError(
+                    f'Element name "{element.name}"" is not unique at least one list. '
+                    f'{len(left_elements_group)=} {len(right_elements_group)=}')
+        else:
+            yield (list(left_elements_group), list(right_elements_group))
 
 
 @dataclasses.dataclass
@@ -582,9 +591,44 @@ class ResourceDiff:
     resourcepairs_version_changed: list[tuple[ocm.Resource, ocm.Resource]] = dataclasses.field(default_factory=list) # noqa:E501
 
 
-def _add_if_not_duplicate(list, res):
-    if (res.name, res.version) not in [(res.name, res.version) for res in list]:
-        list.append(res)
+class _ResourceList:
+    '''
+    appends resources to the given list, unless a resource w/ the same name and version was
+    already appended
+    '''
+    def __init__(self, resources: list[ocm.Resource]):
+        self.resources = resources
+        self._names_and_versions = {(r.name, r.version) for r in resources}
+
+    def add_if_not_duplicate(self, resource: ocm.Resource):
+        if (name_and_version := (resource.name, resource.version)) in self._names_and_versions:
+            return
+        self._names_and_versions.add(name_and_version)
+        self.resources.append(resource)
+
+
+def _artefact_identities(
+    artefacts: collections.abc.Sequence[ocm.Resource | ocm.Source],
+) -> dict[int, ocm.ArtifactIdentity]:
+    '''
+    returns the identities of the given artefacts (keyed by `id(artefact)`), as determined by
+    `artefact.identity(peers=artefacts)`, albeit w/o comparing each artefact against all peers
+    '''
+    peers_by_identity = collections.defaultdict(dict)
+    for artefact in artefacts:
+        peers_by_identity[artefact.identity(peers=())][id(artefact)] = artefact
+
+    identities = {}
+    for identity, peers in peers_by_identity.items():
+        if len(peers) == 1:
+            identities.update((peer_id, identity) for peer_id in peers)
+            continue
+
+        # identity-collision -> version is added (only colliding peers are relevant for this)
+        peers = tuple(peers.values())
+        identities.update((id(peer), peer.identity(peers=peers)) for peer in peers)
+
+    return identities
 
 
 def diff_resources(
@@ -600,12 +644,15 @@ def diff_resources(
             f'unsupported {type(right_component)=}',
         )
 
+    # identities are determined w/ resources of both components as peers
+    identities = _artefact_identities(left_component.resources + right_component.resources)
+
     left_resource_identities_to_resource = {
-        r.identity(left_component.resources + right_component.resources): r
+        identities[id(r)]: r
         for r in left_component.resources
     }
     right_resource_identities_to_resource = {
-        r.identity(left_component.resources + right_component.resources): r
+        identities[id(r)]: r
         for r in right_component.resources
     }
 
@@ -617,38 +664,27 @@ def diff_resources(
     if left_resource_identities_to_resource.keys() == right_resource_identities_to_resource.keys():
         return resource_diff
 
-    left_names_to_resource = {r.name: r for r in left_component.resources}
-    right_names_to_resource = {r.name: r for r in right_component.resources}
+    resource_refs_only_left = _ResourceList(resource_diff.resource_refs_only_left)
+    resource_refs_only_right = _ResourceList(resource_diff.resource_refs_only_right)
+
+    left_names_to_resources = _group_by_name(left_component.resources)
+    right_names_to_resources = _group_by_name(right_component.resources)
     # get left exclusive resources
     for resource in left_resource_identities_to_resource.values():
-        if not resource.name in right_names_to_resource:
-            _add_if_not_duplicate(resource_diff.resource_refs_only_left, resource)
+        if not resource.name in right_names_to_resources:
+            resource_refs_only_left.add_if_not_duplicate(resource)
 
     # get right exclusive resources
     for resource in right_resource_identities_to_resource.values():
-        if not resource.name in left_names_to_resource:
-            _add_if_not_duplicate(resource_diff.resource_refs_only_right, resource)
+        if not resource.name in left_names_to_resources:
+            resource_refs_only_right.add_if_not_duplicate(resource)
 
     # groups the resources by name. The version will be used at a later point
-    def enumerate_group_pairs(
-        left_resources: list[ocm.Resource],
-        right_resources: list[ocm.Resource]
-    ) -> collections.abc.Generator[tuple[list[ocm.Resource], list[ocm.Resource]], None, None]:
-        # group the resources with the same name on both sides
-        for name in left_names_to_resource.keys():
-            right_resource_group = [r for r in right_resources if r.name == name]
-
-            # key is always in left group so we only have to check the length of the right group
-            if len(right_resource_group) == 0:
-                continue
-            else:
-                left_resource_group = [r for r in left_resources if r.name == name]
-                yield (left_resource_group, right_resource_group)
+    for name, left_resource_group in left_names_to_resources.items():
+        # key is always in left group so we only have to check the right group
+        if not (right_resource_group := right_names_to_resources.get(name)):
+            continue
 
-    for left_resource_group, right_resource_group in enumerate_group_pairs(
-        left_resources=left_component.resources,
-        right_resources=right_component.resources,
-    ):
         if len(left_resource_group) == 1 and len(right_resource_group) == 1:
             # if versions are equal resource will be ignored, resource is unchanged
             if left_resource_group[0].version != right_resource_group[0].version:
@@ -658,12 +694,12 @@ def diff_resources(
             continue
 
         left_identities = {
-            r.identity(left_component.resources + right_component.resources): r
+            identities[id(r)]: r
             for r in left_resource_group
         }
         right_identities = {
-            r.identity(left_component.resources + right_component.resources): r
-                            for r in right_resource_group
+            identities[id(r)]: r
+            for r in right_resource_group
         }
 
         left_resource_ids = sorted(left_identities.keys())
@@ -692,7 +728,7 @@ def diff_resources(
         i = 0
         for i, left_resource in enumerate(left_resources):
             if i >= len(right_resources):
-                _add_if_not_duplicate(resource_diff.resource_refs_only_left, left_resource)
+                resource_refs_only_left.add_if_not_duplicate(left_resource)
 
             else:
                 right_resource = right_resources[i]
@@ -703,10 +739,10 @@ def diff_resources(
         right_resource = right_resources[i:]
 
         for i in left_resource:
-            _add_if_not_duplicate(resource_diff.resource_refs_only_left, i)
+            resource_refs_only_left.add_if_not_duplicate(i)
 
         for i in right_resource:
-            _add_if_not_duplicate(resource_diff.resource_refs_only_right, i)
+            resource_refs_only_right.add_if_not_duplicate(i)
 
     return resource_diff
 
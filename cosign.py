@@ -2,10 +2,14 @@
 #
 # SPDX-License-Identifier: Apache-2.0
 
+import collections.abc
+import concurrent.futures
+import dataclasses
 import enum
 import hashlib
 import json
 import logging
+import threading
 
 import ci.log
 import ci.util
@@ -241,18 +245,49 @@ def sign_image(
     preparation for different signature methods yielding different signatures
     even if private key and signed payload did not change (such as RSSA-PSS).
     '''
+    if not oci_client:
+        import ccc.oci
+        oci_client = ccc.oci.oci_client()
+
+    return _sign_image(
+        image_reference=image_reference,
+        signature=signature,
+        signing_algorithm=signing_algorithm,
+        public_key=public_key,
+        on_exist=on_exist,
+        signature_image_reference=signature_image_reference,
+        oci_client=oci_client,
+        payload=payload,
+        annotations=annotations,
+        put_blob=oci_client.put_blob,
+    )
+
+
+def _sign_image(
+    image_reference: om.OciImageReference | str,
+    signature: str,
+    signing_algorithm: str | None,
+    public_key: str | None,
+    on_exist: OnExist | str,
+    signature_image_reference: om.OciImageReference | str | None,
+    oci_client: oc.Client,
+    payload: bytes | None,
+    annotations: dict[str, str] | None,
+    put_blob: collections.abc.Callable[..., None],
+) -> tuple[str | om.OciImageReference, om.OciImageManifest] | None:
+    '''
+    see `sign_image`; blobs are uploaded using `put_blob` (which must accept the same keyword
+    arguments as `oci.client.Client.put_blob`)
+    '''
     on_exist = OnExist(on_exist)
     if not signature_image_reference:
         signature_image_reference = default_signature_image_reference(image_reference)
     else:
         signature_image_reference = om.OciImageReference.to_image_ref(signature_image_reference)
 
-    if not oci_client:
-        import ccc.oci
-        oci_client = ccc.oci.oci_client()
-
     image_reference = oci_client.to_digest_hash(image_reference)
 
+    exists = False
     if on_exist in (OnExist.SKIP, OnExist.APPEND):
         exists = bool(oci_client.head_manifest(
             image_reference=signature_image_reference,
@@ -280,7 +315,7 @@ def sign_image(
     payload_digest = f'sha256:{hashlib.sha256(payload).hexdigest()}'
 
     if not manifest or not any(l.digest == payload_digest for l in manifest.layers):
-        oci_client.put_blob(
+        put_blob(
             image_reference=signature_image_reference,
             digest=payload_digest,
             octets_count=payload_size,
@@ -294,7 +329,7 @@ def sign_image(
     cfg_blob_digest = f'sha256:{hashlib.sha256(cfg_blob).hexdigest()}'
 
     if not manifest or manifest.config.digest != cfg_blob_digest:
-        oci_client.put_blob(
+        put_blob(
             image_reference=image_reference,
             digest=cfg_blob_digest,
             octets_count=cfg_blob_size,
@@ -350,3 +385,129 @@ def sign_image(
         )
 
     return signature_image_reference, signed_manifest
+
+
+@dataclasses.dataclass
+class ImageSignature:
+    '''
+    a signature to be added to an OCI Image (see `sign_image` for semantics of attributes)
+    '''
+    image_reference: om.OciImageReference | str
+    signature: str
+    signing_algorithm: str | None = None
+    public_key: str | None = None
+    signature_image_reference: om.OciImageReference | str | None = None
+    payload: bytes | None = None
+    annotations: dict[str, str] | None = None
+
+    def key(self) -> tuple:
+        return (
+            str(self.image_reference),
+            self.signature,
+            self.signing_algorithm,
+            self.public_key,
+            str(self.signature_image_reference) if self.signature_image_reference else None,
+            self.payload,
+            json.dumps(self.annotations, sort_keys=True) if self.annotations else None,
+        )
+
+
+def sign_images(
+    image_signatures: collections.abc.Iterable[ImageSignature],
+    on_exist: OnExist | str=OnExist.APPEND,
+    oci_client: oc.Client=None,
+    max_workers: int=8,
+) -> list[tuple[str | om.OciImageReference, om.OciImageManifest] | None]:
+    '''
+    bulk-variant of `sign_image`: adds the given signatures to their respective OCI Images, and
+    returns the results (as returned by `sign_image`) in the order of the given signatures.
+
+    Identical signatures are only processed once. Signatures targeting the same signature
+    artefact are added serially (as each update reads and replaces the artefact's manifest);
+    distinct signature artefacts are processed concurrently (at most `max_workers` at a time).
+    Payload- and cfg-blobs that are already present in the target
+    repository (or were uploaded as part of this call) are not uploaded again. Created signature
+    manifests are identical to those created by `sign_image`.
+    '''
+    if not oci_client:
+        import ccc.oci
+        oci_client = ccc.oci.oci_client()
+
+    image_signatures = tuple(image_signatures)
+    unique_image_signatures: dict[tuple, ImageSignature] = {}
+    for image_signature in image_signatures:
+        unique_image_signatures.setdefault(image_signature.key(), image_signature)
+
+    present_blobs = set() # (repository, digest)
+    present_blobs_lock = threading.Lock()
+
+    def put_blob_if_absent(
+        image_reference: om.OciImageReference | str,
+        digest: str,
+        octets_count: int,
+        data: bytes,
+    ):
+        blob_key = (om.OciImageReference(image_reference).ref_without_tag, digest)
+        with present_blobs_lock:
+            if blob_key in present_blobs:
+                return
+
+        if oci_client.head_blob(
+            image_reference=image_reference,
+            digest=digest,
+            absent_ok=True,
+        ):
+            logger.debug(f'{digest=} already present in {image_reference=} - skipping upload')
+        else:
+            oci_client.put_blob(
+                image_reference=image_reference,
+                digest=digest,
+                octets_count=octets_count,
+                data=data,
+            )
+
+        with present_blobs_lock:
+            present_blobs.add(blob_key)
+
+    def sign(image_signature: ImageSignature):
+        return _sign_image(
+            image_reference=image_signature.image_reference,
+            signature=image_signature.signature,
+            signing_algorithm=image_signature.signing_algorithm,
+            public_key=image_signature.public_key,
+            on_exist=on_exist,
+            signature_image_reference=image_signature.signature_image_reference,
+            oci_client=oci_client,
+            payload=image_signature.payload,
+            annotations=image_signature.annotations,
+            put_blob=put_blob_if_absent,
+        )
+
+    # signature-artefact-reference -> {key: image-signature}
+    image_signature_groups: dict[str, dict[tuple, ImageSignature]] = collections.defaultdict(dict)
+    for key, image_signature in unique_image_signatures.items():
+        if image_signature.signature_image_reference:
+            signature_image_reference = om.OciImageReference.to_image_ref(
+                image_signature.signature_image_reference,
+            )
+        else:
+            signature_image_reference = default_signature_image_reference(
+                image_signature.image_reference,
+            )
+        image_signature_groups[str(signature_image_reference)][key] = image_signature
+
+    def sign_group(image_signatures: dict[tuple, ImageSignature]) -> dict[tuple, tuple | None]:
+        return {
+            key: sign(image_signature)
+            for key, image_signature in image_signatures.items()
+        }
+
+    results = {}
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+        for group_results in executor.map(sign_group, image_signature_groups.values()):
+            results.update(group_results)
+
+    return [
+        results[image_signature.key()]
+        for image_signature in image_signatures
+    ]
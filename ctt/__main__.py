@@ -2,6 +2,7 @@ import argparse
 import logging
 
 import cnudie.retrieve
+import ctt.journal
 import ctt.process_dependencies
 import oci.auth
 import oci.client
@@ -94,6 +95,15 @@ def configure_parser(parser):
         default=False,
         help='scan S3-backed resources and inject SBOM/CBOM documents into replicated descriptors',
     )
+    parser.add_argument(
+        '--journal',
+        default=None,
+        help=(
+            'path to a replication-journal (created if absent). Completed replications are '
+            'recorded; reruns skip recorded work. Reruns with a different processing-cfg are '
+            'refused.'
+        ),
+    )
 
 
 def replicate(parsed):
@@ -133,18 +143,28 @@ def replicate(parsed):
     elif max_workers == 0:
         max_workers = None
 
+    if parsed.journal:
+        journal = ctt.journal.ReplicationJournal(path=parsed.journal)
+    else:
+        journal = None
+
     print(f'starting replication of {parsed.ocm_component} {processing_mode=}')
-    for _ in ctt.process_dependencies.process_images(
-        processing_cfg_path=parsed.processing_cfg,
-        root_component_descriptor=component_descriptor,
-        component_descriptor_lookup=component_descriptor_lookup,
-        oci_client=oci_client,
-        processing_mode=processing_mode,
-        max_workers=max_workers,
-        pruning_mode=parsed.pruning_mode,
-        inject_s3_sboms=parsed.inject_s3_sboms,
-    ):
-        pass
+    try:
+        for _ in ctt.process_dependencies.process_images(
+            processing_cfg_path=parsed.processing_cfg,
+            root_component_descriptor=component_descriptor,
+            component_descriptor_lookup=component_descriptor_lookup,
+            oci_client=oci_client,
+            processing_mode=processing_mode,
+            max_workers=max_workers,
+            pruning_mode=parsed.pruning_mode,
+            inject_s3_sboms=parsed.inject_s3_sboms,
+            journal=journal,
+        ):
+            pass
+    finally:
+        if journal:
+            journal.close()
 
 
 def main():
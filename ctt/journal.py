@@ -0,0 +1,193 @@
+'''
+an (optional) append-only, on-disk journal for replication-plan-processing
+
+The journal records completed resource-replications (keyed by source- and target-reference, and
+source-digest) and completed component-descriptor uploads (keyed by target OCM-repository,
+component-identity, and a fingerprint of the patched component descriptor, which covers source
+component descriptor and target-digests of replicated resources).
+It is intended to allow reruns (e.g. after a replication was aborted) to skip work that was
+already done, without re-issuing existence-checks against the target registry.
+
+Journal-entries only match if the recorded source-digest (or fingerprint) matches the current
+one; thus, entries are implicitly invalidated if the source changes.
+
+Entries are only valid for the processing-cfg they were recorded with (e.g. target-repositories,
+filters, platform-filter). Hence, the journal starts with a header-entry holding a fingerprint of
+the processing-cfg; resuming with a differing processing-cfg is refused (see
+`ReplicationJournal.check_cfg_fingerprint`).
+
+The journal is stored as JSON-Lines. Entries are appended (and flushed) upon completion of the
+respective work-item; a truncated last line (e.g. if the process was killed while writing) is
+ignored upon reading.
+'''
+
+import json
+import logging
+import os
+import threading
+
+import ocm
+
+logger = logging.getLogger(__name__)
+
+
+class ReplicationJournal:
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        self._resources: dict[tuple[str, str], tuple[str, str]] = {}
+        self._components: dict[tuple[str, str, str], str] = {}
+        self.cfg_fingerprint: str | None = None
+
+        truncated = False
+        if os.path.isfile(path):
+            truncated = self._read()
+
+        self._file = open(path, 'a')
+        if truncated:
+            self._file.write('\n') # terminate truncated last line
+
+    def _read(self) -> bool:
+        '''
+        reads journal-entries; returns whether last line is truncated
+        '''
+        line = ''
+        with open(self.path) as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    logger.warning(f'ignoring malformed journal-entry in {self.path}: {line=}')
+                    continue
+
+                self._add(entry)
+
+        logger.info(
+            f'read replication-journal from {self.path}: {len(self._resources)} resources, '
+            f'{len(self._components)} components'
+        )
+
+        return bool(line) and not line.endswith('\n')
+
+    def _add(self, entry: dict):
+        if (entry_type := entry.get('type')) == 'header':
+            self.cfg_fingerprint = entry['cfg_fingerprint']
+        elif entry_type == 'resource':
+            self._resources[(entry['src_ref'], entry['tgt_ref'])] = (
+                entry['source_digest'],
+                entry['target_digest'],
+            )
+        elif entry_type == 'component':
+            self._components[(
+                entry['ocm_repository'],
+                entry['name'],
+                entry['version'],
+            )] = entry['fingerprint']
+        else:
+            logger.warning(f'ignoring journal-entry of unknown {entry_type=}')
+
+    def _append(self, entry: dict):
+        with self._lock:
+            self._add(entry)
+            self._file.write(json.dumps(entry) + '\n')
+            self._file.flush()
+
+    def check_cfg_fingerprint(self, cfg_fingerprint: str):
+        '''
+        records the given processing-cfg fingerprint for a new journal. Raises a `ValueError` if
+        the journal was recorded with a different (or without a) processing-cfg fingerprint, as
+        its entries must not be reused in this case.
+        '''
+        with self._lock:
+            recorded_fingerprint = self.cfg_fingerprint
+            has_entries = bool(self._resources or self._components)
+
+        if recorded_fingerprint == cfg_fingerprint:
+            return
+
+        if recorded_fingerprint or has_entries:
+            raise ValueError(
+                f'replication-journal {self.path} was recorded with a different processing-cfg '
+                f'({recorded_fingerprint=}, {cfg_fingerprint=}) - refusing to resume; remove '
+                'the journal or pass a different path'
+            )
+
+        self._append({
+            'type': 'header',
+            'cfg_fingerprint': cfg_fingerprint,
+        })
+
+    def close(self):
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args, **kwargs):
+        self.close()
+
+    def resource_target_digest(
+        self,
+        src_ref: str,
+        tgt_ref: str,
+        source_digest: str,
+    ) -> str | None:
+        '''
+        returns the target (manifest-)digest of a previous replication from `src_ref` to `tgt_ref`
+        if its source-digest matches the given one; None otherwise.
+        '''
+        recorded_source_digest, target_digest = self._resources.get(
+            (str(src_ref), str(tgt_ref)),
+            (None, None),
+        )
+
+        if recorded_source_digest != source_digest:
+            return None
+
+        return target_digest
+
+    def record_resource(
+        self,
+        src_ref: str,
+        tgt_ref: str,
+        source_digest: str,
+        target_digest: str,
+    ):
+        if self.resource_target_digest(src_ref, tgt_ref, source_digest) == target_digest:
+            return
+
+        self._append({
+            'type': 'resource',
+            'src_ref': str(src_ref),
+            'tgt_ref': str(tgt_ref),
+            'source_digest': source_digest,
+            'target_digest': target_digest,
+        })
+
+    def component_uploaded(
+        self,
+        ocm_repository: str,
+        component_id: ocm.ComponentIdentity,
+        fingerprint: str,
+    ) -> bool:
+        '''
+        returns whether the component descriptor with given identity was previously uploaded to
+        the given ocm-repository, with a matching fingerprint.
+        '''
+        return self._components.get(
+            (ocm_repository, component_id.name, component_id.version),
+        ) == fingerprint
+
+    def record_component(
+        self,
+        ocm_repository: str,
+        component_id: ocm.ComponentIdentity,
+        fingerprint: str,
+    ):
+        self._append({
+            'type': 'component',
+            'ocm_repository': ocm_repository,
+            'name': component_id.name,
+            'version': component_id.version,
+            'fingerprint': fingerprint,
+        })
@@ -3,6 +3,7 @@
 # SPDX-License-Identifier: Apache-2.0
 
 
+import concurrent.futures
 import dataclasses
 import hashlib
 import json
@@ -10,7 +11,6 @@ import logging
 import tarfile
 import tempfile
 import typing
-import zlib
 
 import requests
 
@@ -20,6 +20,7 @@ import oci.client as oc
 import oci.convert as oconv
 import oci.platform
 import oci.model as om
+import oci.mount
 import tarutil
 
 logger = logging.getLogger(__name__)
@@ -33,6 +34,8 @@ def filter_image(
     mode: oci.ReplicationMode=oci.ReplicationMode.REGISTRY_DEFAULTS,
     platform_filter: typing.Callable[[om.OciPlatform], bool]=None,
     oci_manifest_annotations: dict[str, str]=None,
+    max_workers: int=4,
+    blob_mounts: oci.mount.BlobMountPlanner | None=None,
 ) -> typing.Tuple[requests.Response, str, bytes]: # response, tgt-ref, manifest_bytes
     source_ref = om.OciImageReference.to_image_ref(source_ref)
     target_ref = om.OciImageReference.to_image_ref(target_ref)
@@ -46,6 +49,7 @@ def filter_image(
             mode=mode,
             platform_filter=platform_filter,
             annotations=oci_manifest_annotations,
+            blob_mounts=blob_mounts,
         )
 
     if mode is oci.ReplicationMode.REGISTRY_DEFAULTS:
@@ -91,6 +95,7 @@ def filter_image(
                 remove_files=remove_files,
                 oci_client=oci_client,
                 oci_manifest_annotations=oci_manifest_annotations,
+                max_workers=max_workers,
             )
 
             # patch (potentially) modified manifest-digest
@@ -135,6 +140,7 @@ def filter_image(
             remove_files=remove_files,
             oci_client=oci_client,
             oci_manifest_annotations=oci_manifest_annotations,
+            max_workers=max_workers,
         )
 
         manifest_list = om.OciImageManifestList(
@@ -191,13 +197,8 @@ def filter_image(
 
     have_non_tar_layer = False
     patch_cfg_blob = True
+    tar_layers = []
     for layer in manifest.layers:
-        layer_hash = hashlib.sha256()
-        cfg_hash = hashlib.sha256() # we need to write "non-gzipped" hash to cfg-blob
-        leng = 0
-        src_leng = 0 # required for calculating leng for gzip-footer
-        crc = 0 # requried for calculcating crc32-checksum for gzip-footer
-
         if not 'tar' in layer.mediaType:
             have_non_tar_layer = True
             cp_cfg_blob = True
@@ -230,6 +231,16 @@ def filter_image(
                 'don\'t know how to process mixed image (tar + non-tar layers)'
             )
 
+        tar_layers.append(layer)
+
+    def filter_layer(layer: om.OciBlobRef) -> tuple[om.OciBlobRef, str]:
+        '''
+        filters and uploads given (tar-)layer; returns patched layer and non-gzipped digest
+        '''
+        layer_hash = hashlib.sha256()
+        cfg_hash = hashlib.sha256() # we need to write "non-gzipped" hash to cfg-blob
+        leng = 0
+
         # unfortunately, GCR (our most important oci-registry) does not support chunked uploads,
         # so we have to resort to writing the streaming result into a local tempfile to be able
         # to calculate digest-hash prior to upload to tgt; XXX: we might use streaming
@@ -247,34 +258,22 @@ def filter_image(
                 chunk_size=tarfile.BLOCKSIZE * 64,
             )
 
-            f.write((gzip_header := gziputil.gzip_header(fname=b'layer.tar')))
-            layer_hash.update(gzip_header)
-            leng += len(gzip_header)
-
-            compressor = gziputil.zlib_compressobj()
-
-            for chunk in filtered_stream:
-                cfg_hash.update(chunk) # need to hash before compressing for cfg-blob
-                crc = zlib.crc32(chunk, crc)
-                src_leng += len(chunk)
-
-                chunk = compressor.compress(chunk)
+            def hashed_filtered_stream():
+                for chunk in filtered_stream:
+                    cfg_hash.update(chunk) # need to hash before compressing for cfg-blob
+                    yield chunk
+
+            # layers are already filtered concurrently (and ctt processes many images
+            # concurrently) -> use few compression-threads per layer (instead of one per cpu)
+            for chunk in gziputil.parallel_gzip(
+                chunks=hashed_filtered_stream(),
+                fname=b'layer.tar',
+                max_workers=2,
+            ):
                 layer_hash.update(chunk)
                 leng += len(chunk)
                 f.write(chunk)
 
-            f.write((remainder := compressor.flush()))
-            layer_hash.update(remainder)
-            leng += len(remainder)
-
-            gzip_footer = gziputil.gzip_footer(
-                crc32=crc,
-                uncompressed_size=src_leng,
-            )
-            f.write(gzip_footer)
-            layer_hash.update(gzip_footer)
-            leng += len(gzip_footer)
-
             f.seek(0)
 
             oci_client.put_blob(
@@ -284,10 +283,20 @@ def filter_image(
                 data=f,
             )
 
-            non_gzipped_layer_digests[layer_digest] = 'sha256:' + cfg_hash.hexdigest()
+        return (
+            dataclasses.replace(layer, digest=layer_digest, size=leng),
+            'sha256:' + cfg_hash.hexdigest(),
+        )
+
+    # layers are independent from each other, and may thus be filtered concurrently
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+        for layer, (new_layer, non_gzipped_digest) in zip(
+            tar_layers,
+            executor.map(filter_layer, tar_layers),
+        ):
+            non_gzipped_layer_digests[new_layer.digest] = non_gzipped_digest
 
             # update copy of layers-list with new layer
-            new_layer = dataclasses.replace(layer, digest=layer_digest, size=leng)
             layers_copy[layers_copy.index(layer)] = new_layer
 
     # switch layers in manifest to announce changes w/ manifest-upload
@@ -32,11 +32,13 @@ import sbom.s3 as sbom_s3
 import oci
 import oci.client
 import oci.model as om
+import oci.mount
 import ocm
 import ocm.gardener
 import ocm.iter
 
 import ctt.filters as filters
+import ctt.journal
 import ctt.model
 import ctt.processors as processors
 import ctt.targets as targets
@@ -142,6 +144,7 @@ class ProcessingPipeline:
         tgt_oci_registries: collections.abc.Iterable[str],
         oci_client: oci.client.Client,
         replication_mode: oci.ReplicationMode=oci.ReplicationMode.PREFER_MULTIARCH,
+        journal: ctt.journal.ReplicationJournal | None=None,
     ) -> ctt.model.ReplicationResourceElement | None:
         if not self.matches_filter(component, resource):
             return None
@@ -191,6 +194,19 @@ class ProcessingPipeline:
             label=ctt_label,
         )
 
+        if (
+            journal
+            and (source_digest := known_source_digest(replication_resource_element))
+            and (target_digest := journal.resource_target_digest(
+                src_ref=replication_resource_element.src_ref,
+                tgt_ref=replication_resource_element.tgt_ref,
+                source_digest=source_digest,
+            ))
+        ):
+            logger.debug(f'{replication_resource_element.tgt_ref=} found in journal')
+            replication_resource_element.digest = target_digest
+            return replication_resource_element
+
         if manifest_blob_ref := oci_client.head_manifest(
             image_reference=str(replication_resource_element.tgt_ref),
             absent_ok=True,
@@ -201,6 +217,27 @@ class ProcessingPipeline:
         return replication_resource_element
 
 
+def known_source_digest(
+    replication_resource_element: ctt.model.ReplicationResourceElement,
+) -> str | None:
+    '''
+    returns the (manifest-)digest of the source OCI artefact if it is known without issuing any
+    requests (i.e. from the resource's digest, or from the source reference); None otherwise.
+    '''
+    if (
+        (digest := replication_resource_element.source.digest)
+        and digest.hashAlgorithm.upper() == 'SHA-256'
+        and digest.normalisationAlgorithm == ocm.NormalisationAlgorithm.OCI_ARTIFACT_DIGEST
+    ):
+        return f'sha256:{digest.value}'
+
+    src_ref = replication_resource_element.src_ref
+    if src_ref.has_digest_tag or src_ref.has_mixed_tag:
+        return src_ref.tag
+
+    return None
+
+
 def create_ctt_label(
     processing_rules: list[str],
 ) -> ocm.Label:
@@ -422,6 +459,7 @@ def process_upload_request(
     platform_filter: collections.abc.Callable[[om.OciPlatform], bool]=None,
     inject_ocm_coordinates_into_oci_manifests: bool=False,
     processing_mode: ProcessingMode=ProcessingMode.REGULAR,
+    blob_mounts: oci.mount.BlobMountPlanner | None=None,
 ) -> str:
     src_ref = replication_resource_element.src_ref
     tgt_ref = replication_resource_element.tgt_ref
@@ -483,6 +521,7 @@ def process_upload_request(
             platform_filter=platform_filter,
             oci_client=oci_client,
             oci_manifest_annotations=oci_manifest_annotations,
+            blob_mounts=blob_mounts,
         )
     except Exception as e:
         logger.error(
@@ -534,6 +573,7 @@ def iter_replication_resource_elements(
     oci_client: oci.client.Client,
     replication_mode: oci.ReplicationMode=oci.ReplicationMode.PREFER_MULTIARCH,
     max_workers: int=16,
+    journal: ctt.journal.ReplicationJournal | None=None,
 ) -> collections.abc.Iterable[ctt.model.ReplicationResourceElement]:
     shared_targets = {
         name: _target(cfg) for name, cfg in processing_cfg.get('targets', {}).items()
@@ -561,6 +601,7 @@ def iter_replication_resource_elements(
                 tgt_oci_registries=tgt_oci_registries,
                 oci_client=oci_client,
                 replication_mode=replication_mode,
+                journal=journal,
             )
 
             if replication_resource_element:
@@ -604,6 +645,7 @@ def create_replication_plan_step(
     remove_label: collections.abc.Callable[[str], bool]=None,
     max_workers: int=16,
     pruning_mode: PruningMode=PruningMode.PRUNE_SUBTREES,
+    journal: ctt.journal.ReplicationJournal | None=None,
 ) -> ctt.model.ReplicationPlanStep:
     tgt_ocm_repo = ocm.OciOcmRepository(
         baseUrl=ocm_repository,
@@ -632,6 +674,7 @@ def create_replication_plan_step(
         oci_client=oci_client,
         replication_mode=replication_mode,
         max_workers=max_workers,
+        journal=journal,
     ))
 
     return ctt.model.ReplicationPlanStep(
@@ -641,6 +684,35 @@ def create_replication_plan_step(
     )
 
 
+def journal_cfg_fingerprint(
+    processing_cfg: dict,
+    replication_mode: oci.ReplicationMode,
+    tgt_ocm_repo_path: str | None=None,
+    **filters: collections.abc.Callable | None,
+) -> str:
+    '''
+    returns a fingerprint of the processing-cfg a replication-journal is valid for. Filters are
+    callables; they are represented by their qualified names (thus, differing closures of the same
+    function are not told apart).
+    '''
+    def callable_name(obj) -> str:
+        return f'{obj.__module__}.{obj.__qualname__}'
+
+    return hashlib.sha256(json.dumps(
+        {
+            'processing_cfg': processing_cfg,
+            'replication_mode': replication_mode,
+            'tgt_ocm_repo_path': tgt_ocm_repo_path,
+            'filters': {
+                name: callable_name(f) if f else None
+                for name, f in filters.items()
+            },
+        },
+        cls=ctt_util.EnumJSONEncoder,
+        sort_keys=True,
+    ).encode('utf-8')).hexdigest()
+
+
 def process_images(
     processing_cfg_path: str,
     root_component_descriptor: ocm.ComponentDescriptor,
@@ -658,6 +730,7 @@ def process_images(
     tgt_ocm_repo_path: str | None=None, # deprecated -> specify `ocm_repository` in tgt-cfg instead
     pruning_mode: PruningMode=PruningMode.PRUNE_SUBTREES,
     inject_s3_sboms: bool=False,
+    journal: ctt.journal.ReplicationJournal | None=None,
 ) -> collections.abc.Generator[ocm.iter.Node, None, None]:
     '''
     note: Passing a filter to prevent component descriptors from being replicated using the
@@ -666,9 +739,25 @@ def process_images(
     `component_filter` parameter will also exclude its resources as well as all transitive component
     references from the replication. In both cases, `True` means the respective component is
     _excluded_.
+
+    If a `journal` is passed, completed resource-replications and component-descriptor uploads
+    are recorded, and (matching) recorded ones are skipped (see `ctt.journal`). As the journal is
+    only valid for the processing-cfg it was recorded with, a `ValueError` is raised if it was
+    recorded with a different one.
     '''
     processing_cfg = parse_processing_cfg(processing_cfg_path)
 
+    if journal:
+        journal.check_cfg_fingerprint(journal_cfg_fingerprint(
+            processing_cfg=processing_cfg,
+            replication_mode=replication_mode,
+            tgt_ocm_repo_path=tgt_ocm_repo_path,
+            platform_filter=platform_filter,
+            skip_component_upload=skip_component_upload,
+            component_filter=component_filter,
+            remove_label=remove_label,
+        ))
+
     reftype_filter = None
     if remove_label and remove_label(ocm.gardener.ExtraComponentReferencesLabel.name):
         def filter_extra_component_refs(reftype: ocm.iter.NodeReferenceType) -> bool:
@@ -739,11 +828,16 @@ def process_images(
             remove_label=remove_label,
             max_workers=max_workers,
             pruning_mode=pruning_mode,
+            journal=journal,
         )
         replication_plan.steps.append(replication_plan_step)
 
     logger.info(replication_plan)
 
+    # steps replicate (largely) the same artefacts to different target ocm-repositories, which
+    # often share their registry host -> upload blobs only once per host
+    blob_mounts = oci.mount.BlobMountPlanner()
+
     def _exec_step(step):
         tgt_lookup = create_component_descriptor_lookup_for_ocm_repo(
             ocm_repo_url=step.target_ocm_repository,
@@ -770,6 +864,8 @@ def process_images(
             max_workers=max_workers,
             inject_s3_sboms=inject_s3_sboms,
             local_blobs_mode=local_blobs_mode,
+            journal=journal,
+            blob_mounts=blob_mounts,
         ))
 
     with concurrent.futures.ThreadPoolExecutor(
@@ -778,6 +874,219 @@ def process_images(
         for nodes in step_executor.map(_exec_step, replication_plan.steps):
             yield from nodes
 
+    logger.info(blob_mounts.summary())
+
+
+def patch_resources(
+    resources: collections.abc.Sequence[ocm.Resource],
+    replicated_resources: collections.abc.Iterable[ocm.Resource],
+) -> list[ocm.Resource]:
+    '''
+    returns the given resources (of one component), with those replaced by replicated resources
+    which share the same identity. Identities are determined with the component's resources as
+    peers, whereby each resource collides with (a copy of) itself, i.e. identities of resources
+    whose name and extra-identity are present in `resources` always include the version (see
+    `ocm.Artifact.identity`).
+    '''
+    base_identities = {
+        resource.identity(peers=())
+        for resource in resources
+    }
+
+    def identity(resource: ocm.Resource) -> ocm.ResourceIdentity:
+        if resource.identity(peers=()) not in base_identities:
+            return resource.identity(peers=())
+
+        # a (shallow) copy of the resource itself is a (cheap) colliding peer
+        return resource.identity(peers=(dataclasses.replace(resource),))
+
+    patched_resources = {
+        identity(resource): resource
+        for resource in replicated_resources
+    }
+
+    return [
+        patched_resources.get(identity(resource), resource)
+        for resource in resources
+    ]
+
+
+def _component_dependencies(
+    replication_plan_components: collections.abc.Sequence[ctt.model.ReplicationComponentElement],
+) -> list[set[int]]:
+    '''
+    returns, for each passed replication-plan-component (by index), the indices of those preceding
+    replication-plan-components it depends on (i.e. which it references, either via component
+    references or via extra-component-references label). Components with same identity depend on
+    their predecessors (so they are never processed concurrently).
+
+    As replication-plan-components are created in post-order (i.e. referenced components precede
+    their referrers), only preceding components are considered (which also breaks cycles).
+    '''
+    indices_by_id: dict[ocm.ComponentIdentity, list[int]] = collections.defaultdict(list)
+    dependencies = []
+
+    for idx, replication_plan_component in enumerate(replication_plan_components):
+        component = replication_plan_component.target.component
+
+        referenced_ids = {
+            ocm.ComponentIdentity(
+                name=cref.componentName,
+                version=cref.version,
+            ) for cref in component.componentReferences
+        }
+        if extra_crefs_label := component.find_label(
+            ocm.gardener.ExtraComponentReferencesLabel.name,
+        ):
+            for extra_cref_raw in extra_crefs_label.value:
+                extra_cref = dacite.from_dict(
+                    data_class=ocm.gardener.ExtraComponentReference,
+                    data=extra_cref_raw,
+                )
+                referenced_ids.add(extra_cref.component_reference)
+        referenced_ids.add(component.identity())
+
+        dependencies.append({
+            dependency_idx
+            for referenced_id in referenced_ids
+            for dependency_idx in indices_by_id.get(referenced_id, ())
+        })
+        indices_by_id[component.identity()].append(idx)
+
+    return dependencies
+
+
+def _process_in_dependency_order(
+    replication_plan_components: collections.abc.Sequence[ctt.model.ReplicationComponentElement],
+    process_component: collections.abc.Callable[[ctt.model.ReplicationComponentElement], None],
+    max_workers: int=16,
+):
+    '''
+    calls `process_component` for each of the passed replication-plan-components, using a
+    thread-pool. Components are processed only after all components they depend on (see
+    `_component_dependencies`) have been processed, thus guaranteeing that referenced component
+    descriptors are published before their referrers. Independent components are processed
+    concurrently.
+
+    If processing of a component fails, no further components are scheduled, and the exception is
+    re-raised (after already running components have finished).
+    '''
+    dependencies = _component_dependencies(replication_plan_components)
+    dependants: dict[int, list[int]] = collections.defaultdict(list)
+    for idx, idx_dependencies in enumerate(dependencies):
+        for dependency_idx in idx_dependencies:
+            dependants[dependency_idx].append(idx)
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+        def submit(idx: int) -> concurrent.futures.Future:
+            return executor.submit(process_component, replication_plan_components[idx])
+
+        futures = {
+            submit(idx): idx
+            for idx, idx_dependencies in enumerate(dependencies)
+            if not idx_dependencies
+        }
+
+        while futures:
+            done, _ = concurrent.futures.wait(
+                futures,
+                return_when=concurrent.futures.FIRST_COMPLETED,
+            )
+
+            for future in done:
+                idx = futures.pop(future)
+
+                if (exception := future.exception()):
+                    component = replication_plan_components[idx].target.component
+                    logger.error(
+                        f'exception while processing {component.name}:{component.version}'
+                    )
+                    concurrent.futures.wait(futures)
+                    raise exception
+
+                for dependant_idx in dependants[idx]:
+                    dependencies[dependant_idx].discard(idx)
+                    if not dependencies[dependant_idx]:
+                        futures[submit(dependant_idx)] = dependant_idx
+
+
+def _s3_bucket(access: ocm.S3Access | ocm.LegacyS3Access) -> str:
+    if isinstance(access, ocm.LegacyS3Access):
+        return access.bucketName
+    return access.bucket
+
+
+def _s3_key(access: ocm.S3Access | ocm.LegacyS3Access) -> str:
+    if isinstance(access, ocm.LegacyS3Access):
+        return access.objectKey
+    return access.key
+
+
+def _scan_s3_resources(
+    s3_candidates: collections.abc.Sequence[tuple[ocm.Component, ocm.Resource]],
+    scan_s3_resource: collections.abc.Callable[[ocm.Resource], tuple],
+    admission: sbom_inject.ScanAdmission,
+    estimate_bytes: collections.abc.Callable[[ocm.Resource], tuple[int, int]],
+    max_workers: int | None=16,
+    max_workers_per_bucket: int=4,
+) -> list[tuple | None]:
+    '''
+    calls `scan_s3_resource` for each of the passed (S3-backed) resources, using a thread-pool,
+    and returns the scan-results in the order of the passed candidates. At most
+    `max_workers_per_bucket` scans are run concurrently against the same S3-bucket. In addition,
+    each scan is only started once admitted by `admission`, based on its estimated disk- and
+    memory-consumption (as returned by `estimate_bytes`).
+
+    Failing scans are not considered fatal (the respective result is None); failures are
+    reported in aggregated form once all scans have finished.
+    '''
+    bucket_semaphores: dict[str, threading.Semaphore] = {}
+    bucket_semaphores_lock = threading.Lock()
+
+    def bucket_semaphore(bucket: str) -> threading.Semaphore:
+        with bucket_semaphores_lock:
+            if not (semaphore := bucket_semaphores.get(bucket)):
+                semaphore = bucket_semaphores[bucket] = threading.Semaphore(max_workers_per_bucket)
+            return semaphore
+
+    def scan(resource: ocm.Resource) -> tuple:
+        with bucket_semaphore(_s3_bucket(resource.access)):
+            est_disk, est_mem = estimate_bytes(resource)
+            admission.admit(est_disk, est_mem)
+            try:
+                return scan_s3_resource(resource)
+            finally:
+                admission.release(est_disk, est_mem)
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [
+            executor.submit(scan, resource)
+            for _, resource in s3_candidates
+        ]
+
+    results = []
+    failures = []
+    for (component, resource), future in zip(s3_candidates, futures):
+        if (exception := future.exception()):
+            logger.warning(f'{resource.name!r}: S3 SBOM scan failed: {exception}')
+            failures.append(
+                f'{component.name}:{component.version} {resource.name}:{resource.version}: '
+                f'{exception}'
+            )
+            results.append(None)
+            continue
+
+        results.append(future.result())
+
+    if failures:
+        failures_str = '\n'.join(failures)
+        logger.warning(
+            f'S3 SBOM scan failed for {len(failures)} of {len(s3_candidates)} resource(s):\n'
+            f'{failures_str}'
+        )
+
+    return results
+
 
 def process_replication_plan_step(
     replication_plan_step: ctt.model.ReplicationPlanStep,
@@ -796,6 +1105,8 @@ def process_replication_plan_step(
     max_workers: int=16,
     inject_s3_sboms: bool=False,
     local_blobs_mode: LocalBlobsMode=LocalBlobsMode.COPY_BY_VALUE,
+    journal: ctt.journal.ReplicationJournal | None=None,
+    blob_mounts: oci.mount.BlobMountPlanner | None=None,
 ) -> collections.abc.Generator[ocm.iter.Node, None, None]:
     def process_replication_resource_element(
         replication_resource_element: ctt.model.ReplicationResourceElement,
@@ -807,6 +1118,7 @@ def process_replication_plan_step(
             platform_filter=platform_filter,
             inject_ocm_coordinates_into_oci_manifests=inject_ocm_coordinates_into_oci_manifests,
             processing_mode=processing_mode,
+            blob_mounts=blob_mounts,
         )
 
         if not oci_manifest_digest:
@@ -853,6 +1165,18 @@ def process_replication_plan_step(
                     else:
                         raise
 
+        if (
+            journal
+            and processing_mode is not ProcessingMode.DRY_RUN
+            and (source_digest := known_source_digest(replication_resource_element))
+        ):
+            journal.record_resource(
+                src_ref=replication_resource_element.src_ref,
+                tgt_ref=replication_resource_element.tgt_ref,
+                source_digest=source_digest,
+                target_digest=oci_manifest_digest,
+            )
+
         if digest := replication_resource_element.target.digest:
             # if resource has a digest we understand, and is an ociArtifact, then we need to
             # update the digest, because we might have changed the oci-artefact
@@ -914,6 +1238,13 @@ def process_replication_plan_step(
         replication_plan_step.resources,
     ))
 
+    # index replicated resources by component (used for patching in phase 2)
+    resource_groups: dict[ocm.ComponentIdentity, list[ocm.Resource]] = collections.defaultdict(list)
+    for replication_resource_element in replication_resource_elements:
+        resource_groups[replication_resource_element.component_id].append(
+            replication_resource_element.target,
+        )
+
     # --- SBOM injection (between Phase 1 image uploads and Phase 2 descriptor patching) ---
     # Maps component_identity → list of extra OCM resource dicts to append.
     sbom_extra_resources: dict[ocm.ComponentIdentity, list[dict]] = collections.defaultdict(list)
@@ -1087,38 +1418,43 @@ def process_replication_plan_step(
 
         logger.info(f'S3 SBOM injection: {len(s3_candidates)} S3 resource(s) to process')
 
-        for component, resource in s3_candidates:
-            component_id = component.identity()
-            access = resource.access
-
-            if isinstance(access, ocm.LegacyS3Access):
-                s3_url = sbom_s3.s3_url(access.bucketName, access.objectKey, access.region)
-            else:
-                s3_url = sbom_s3.s3_url(access.bucket, access.key, access.region)
-
-            if processing_mode is ProcessingMode.DRY_RUN:
+        if processing_mode is ProcessingMode.DRY_RUN:
+            for _, resource in s3_candidates:
+                access = resource.access
+                s3_url = sbom_s3.s3_url(_s3_bucket(access), _s3_key(access), access.region)
                 logger.info(
                     f'dry-run: would scan S3 resource {resource.name!r} ({s3_url})'
                 )
-                continue
+            s3_candidates = []
 
-            try:
-                (spdx_bytes, cdx_bytes, cbom_bytes,
-                 tool_ver, cbom_tool_ver,
-                 spdx_digest, cdx_digest, cbom_digest,
-                 repo_ref, content_digest) = sbom_inject.scan_s3_resource(
-                    access=access,
-                    oci_client=oci_client,
-                    registry_base=registry_base,
-                    tmpdir=tmpdir,
-                    tool_ver=syft_ver,
-                )
-            except Exception as e:
-                logger.warning(
-                    f'{resource.name!r}: S3 SBOM scan failed: {e}'
-                )
+        def scan_s3_resource(resource: ocm.Resource) -> tuple:
+            return sbom_inject.scan_s3_resource(
+                access=resource.access,
+                oci_client=oci_client,
+                registry_base=registry_base,
+                tmpdir=tmpdir,
+                tool_ver=syft_ver,
+            )
+
+        scan_results = _scan_s3_resources(
+            s3_candidates=s3_candidates,
+            scan_s3_resource=scan_s3_resource,
+            admission=sbom_inject.ScanAdmission(tmpdir=tmpdir),
+            estimate_bytes=lambda resource: sbom_inject.estimate_s3_scan_bytes(resource.access),
+            max_workers=max_workers,
+        )
+
+        for (component, resource), scan_result in zip(s3_candidates, scan_results):
+            if not scan_result:
                 continue
 
+            (spdx_bytes, cdx_bytes, cbom_bytes,
+             tool_ver, cbom_tool_ver,
+             spdx_digest, cdx_digest, cbom_digest,
+             repo_ref, content_digest) = scan_result
+            access = resource.access
+            s3_url = sbom_s3.s3_url(_s3_bucket(access), _s3_key(access), access.region)
+
             spdx_res, cdx_res, cbom_res = sbom_inject.build_s3_sbom_ocm_resources(
                 resource_name=resource.name,
                 version=resource.version,
@@ -1132,7 +1468,7 @@ def process_replication_plan_step(
                 cbom_tool_ver=cbom_tool_ver,
                 source_extra_identity=resource.extraIdentity or None,
             )
-            sbom_extra_resources[component_id].extend((spdx_res, cdx_res, cbom_res))
+            sbom_extra_resources[component.identity()].extend((spdx_res, cdx_res, cbom_res))
             logger.info(
                 f'{resource.name!r}: S3 SBOM/CBOM injected '
                 f'(spdx={spdx_digest[:16]}... cdx={cdx_digest[:16]}...)'
@@ -1150,35 +1486,35 @@ def process_replication_plan_step(
             # resolve the (updated) root component descriptor again
             root_component_descriptor = replication_plan_component.target
 
+    def patch_and_publish_component(
+        replication_plan_component: ctt.model.ReplicationComponentElement,
+    ):
         component = replication_plan_component.target.component
 
-        resource_group = [
-            replication_resource_element.target
-            for replication_resource_element in replication_resource_elements
-            if replication_resource_element.component_id == component.identity()
-        ]
-
-        patched_resources = {}
-
-        # patch-in overwrites (caveat: must be done sequentially, as lists are not threadsafe)
-        # use copy of resources as peers to shortcut "self"-check in identity function
-        peer_resources = [
-            copy.deepcopy(resource)
-            for resource in component.resources
-        ]
-
-        for resource in resource_group:
-            patched_resources[resource.identity(peer_resources)] = resource
-
-        component.resources = [
-            patched_resources.get(resource.identity(peer_resources), resource)
-            for resource in component.resources
-        ]
+        component.resources = patch_resources(
+            resources=component.resources,
+            replicated_resources=resource_groups.get(component.identity(), ()),
+        )
 
         # append any SBOM resources injected for this component
         for sbom_resource in sbom_extra_resources.get(component.identity(), ()):
             component.resources.append(sbom_resource)
 
+        if journal:
+            fingerprint = hashlib.sha256(json.dumps(
+                dataclasses.asdict(replication_plan_component.target),
+                cls=ctt_util.EnumJSONEncoder,
+                sort_keys=True,
+            ).encode('utf-8')).hexdigest()
+
+            if journal.component_uploaded(
+                ocm_repository=replication_plan_step.target_ocm_repository,
+                component_id=component.identity(),
+                fingerprint=fingerprint,
+            ):
+                logger.info(f'{component.name}:{component.version} found in journal - skipping')
+                return
+
         # Validate the patched component-descriptor and exit on fail
         if not skip_cd_validation:
             # ensure component-descriptor is json-serialisable
@@ -1209,11 +1545,11 @@ def process_replication_plan_step(
 
         # publish the (patched) component-descriptors
         if skip_component_upload and skip_component_upload(component):
-            continue
+            return
 
         if processing_mode is ProcessingMode.DRY_RUN:
             print('dry-run - will not publish component-descriptor')
-            continue
+            return
         elif processing_mode is not ProcessingMode.REGULAR:
             raise NotImplementedError(processing_mode)
 
@@ -1235,8 +1571,22 @@ def process_replication_plan_step(
             oci_client=oci_client,
             overwrite=overwrite_descriptors,
             rewrite_local_blobs=local_blobs_mode is LocalBlobsMode.COPY_BY_REFERENCE,
+            blob_mounts=blob_mounts,
         )
 
+        if journal:
+            journal.record_component(
+                ocm_repository=replication_plan_step.target_ocm_repository,
+                component_id=component.identity(),
+                fingerprint=fingerprint,
+            )
+
+    _process_in_dependency_order(
+        replication_plan_components=replication_plan_step.components,
+        process_component=patch_and_publish_component,
+        max_workers=max_workers,
+    )
+
     if processing_mode is ProcessingMode.DRY_RUN:
         return # early exit because components cannot be retrieved from target
 
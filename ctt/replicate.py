@@ -11,6 +11,7 @@ import logging
 import oci
 import oci.client
 import oci.model as om
+import oci.mount
 import ocm
 import ocm.oci
 
@@ -25,6 +26,7 @@ def replicate_oci_artifact_with_patched_component_descriptor(
     oci_client: oci.client.Client,
     overwrite: bool=False,
     rewrite_local_blobs: bool=False,
+    blob_mounts: oci.mount.BlobMountPlanner | None=None,
 ):
     if isinstance(src_ocm_repo, str):
         src_ocm_repo = ocm.OciOcmRepository(baseUrl=src_ocm_repo)
@@ -112,6 +114,7 @@ def replicate_oci_artifact_with_patched_component_descriptor(
             src_manifest.config: cfg_raw,
         },
         blobs_to_skip=blobs_to_skip,
+        blob_mounts=blob_mounts,
     )
 
     target_manifest_dict = target_manifest.as_dict()
@@ -0,0 +1,150 @@
+import copy
+
+import pytest
+
+import oci
+import ocm
+
+import ctt.journal
+import ctt.process_dependencies
+
+
+def test_replication_journal(tmpdir):
+    path = tmpdir.join('journal.jsonl')
+    component_id = ocm.ComponentIdentity(name='acme.org/component', version='1.2.3')
+
+    with ctt.journal.ReplicationJournal(path=str(path)) as journal:
+        assert journal.resource_target_digest(
+            src_ref='src.org/image@sha256:abc',
+            tgt_ref='tgt.org/image:1.2.3',
+            source_digest='sha256:abc',
+        ) is None
+
+        journal.record_resource(
+            src_ref='src.org/image@sha256:abc',
+            tgt_ref='tgt.org/image:1.2.3',
+            source_digest='sha256:abc',
+            target_digest='sha256:def',
+        )
+        journal.record_component(
+            ocm_repository='tgt.org/ocm',
+            component_id=component_id,
+            fingerprint='fingerprint',
+        )
+
+    # simulate process being killed while writing
+    with open(path, 'a') as f:
+        f.write('{"type": "resource", "src_ref": ')
+
+    with ctt.journal.ReplicationJournal(path=str(path)) as journal:
+        assert journal.resource_target_digest(
+            src_ref='src.org/image@sha256:abc',
+            tgt_ref='tgt.org/image:1.2.3',
+            source_digest='sha256:abc',
+        ) == 'sha256:def'
+
+        # changed source-digest is expected to invalidate entry
+        assert journal.resource_target_digest(
+            src_ref='src.org/image@sha256:abc',
+            tgt_ref='tgt.org/image:1.2.3',
+            source_digest='sha256:changed',
+        ) is None
+
+        assert journal.component_uploaded(
+            ocm_repository='tgt.org/ocm',
+            component_id=component_id,
+            fingerprint='fingerprint',
+        )
+        assert not journal.component_uploaded(
+            ocm_repository='tgt.org/ocm',
+            component_id=component_id,
+            fingerprint='changed-fingerprint',
+        )
+        assert not journal.component_uploaded(
+            ocm_repository='other.org/ocm',
+            component_id=component_id,
+            fingerprint='fingerprint',
+        )
+
+        journal.record_resource(
+            src_ref='src.org/image:1.2.3',
+            tgt_ref='tgt.org/image:1.2.3',
+            source_digest='sha256:123',
+            target_digest='sha256:456',
+        )
+
+    # entries appended after truncated line are expected to be readable
+    with ctt.journal.ReplicationJournal(path=str(path)) as journal:
+        assert journal.resource_target_digest(
+            src_ref='src.org/image:1.2.3',
+            tgt_ref='tgt.org/image:1.2.3',
+            source_digest='sha256:123',
+        ) == 'sha256:456'
+
+
+def test_replication_journal_cfg_fingerprint(tmpdir):
+    path = tmpdir.join('journal.jsonl')
+
+    with ctt.journal.ReplicationJournal(path=str(path)) as journal:
+        journal.check_cfg_fingerprint('cfg-1')
+        journal.record_resource(
+            src_ref='src.org/image:1.2.3',
+            tgt_ref='tgt.org/image:1.2.3',
+            source_digest='sha256:abc',
+            target_digest='sha256:def',
+        )
+
+    with ctt.journal.ReplicationJournal(path=str(path)) as journal:
+        assert journal.cfg_fingerprint == 'cfg-1'
+        journal.check_cfg_fingerprint('cfg-1')
+
+        with pytest.raises(ValueError):
+            journal.check_cfg_fingerprint('cfg-2')
+
+    # journals w/o header (but w/ entries) must not be resumed either
+    path = tmpdir.join('journal-without-header.jsonl')
+    with ctt.journal.ReplicationJournal(path=str(path)) as journal:
+        journal.record_resource(
+            src_ref='src.org/image:1.2.3',
+            tgt_ref='tgt.org/image:1.2.3',
+            source_digest='sha256:abc',
+            target_digest='sha256:def',
+        )
+
+    with ctt.journal.ReplicationJournal(path=str(path)) as journal:
+        with pytest.raises(ValueError):
+            journal.check_cfg_fingerprint('cfg-1')
+
+
+def test_journal_cfg_fingerprint():
+    def platform_filter(platform):
+        return True
+
+    processing_cfg = {'targets': {'tgt': {'kwargs': {'ocm_repository': 'tgt.org/ocm'}}}}
+
+    fingerprint = ctt.process_dependencies.journal_cfg_fingerprint(
+        processing_cfg=processing_cfg,
+        replication_mode=oci.ReplicationMode.PREFER_MULTIARCH,
+        platform_filter=platform_filter,
+    )
+    assert fingerprint == ctt.process_dependencies.journal_cfg_fingerprint(
+        processing_cfg=copy.deepcopy(processing_cfg),
+        replication_mode=oci.ReplicationMode.PREFER_MULTIARCH,
+        platform_filter=platform_filter,
+    )
+
+    assert fingerprint != ctt.process_dependencies.journal_cfg_fingerprint(
+        processing_cfg={'targets': {'tgt': {'kwargs': {'ocm_repository': 'other.org/ocm'}}}},
+        replication_mode=oci.ReplicationMode.PREFER_MULTIARCH,
+        platform_filter=platform_filter,
+    )
+    assert fingerprint != ctt.process_dependencies.journal_cfg_fingerprint(
+        processing_cfg=processing_cfg,
+        replication_mode=oci.ReplicationMode.PREFER_MULTIARCH,
+        platform_filter=None,
+    )
+    assert fingerprint != ctt.process_dependencies.journal_cfg_fingerprint(
+        processing_cfg=processing_cfg,
+        replication_mode=oci.ReplicationMode.NORMALISE_TO_MULTIARCH,
+        platform_filter=platform_filter,
+    )
@@ -2,8 +2,20 @@
 #
 # SPDX-License-Identifier: Apache-2.0
 
+import collections
+import copy
+import dataclasses
+import http.server
+import random
+import threading
+import time
+
+import pytest
+
+import ctt.model
 import ctt.process_dependencies as process_dependencies
 import sbom.inject as sbom_inject
+import sbom.s3 as sbom_s3
 import ocm
 
 
@@ -203,3 +215,329 @@ def test_identity_version_fallback_with_version_in_extra_identity():
     assert len(set(map(str, identities))) == 3, (
         f'expected 3 distinct identities, got: {[str(i) for i in identities]}'
     )
+
+
+def _replication_plan_component(
+    name: str,
+    references: tuple[str]=(),
+) -> ctt.model.ReplicationComponentElement:
+    component_descriptor = ocm.ComponentDescriptor(
+        meta=ocm.Metadata(),
+        component=ocm.Component(
+            name=name,
+            version='1.0.0',
+            repositoryContexts=[],
+            provider='acme.org',
+            sources=[],
+            componentReferences=[
+                ocm.ComponentReference(
+                    name=reference,
+                    componentName=reference,
+                    version='1.0.0',
+                ) for reference in references
+            ],
+            resources=[],
+            labels=[],
+        ),
+    )
+    return ctt.model.ReplicationComponentElement(
+        source=component_descriptor,
+        target=component_descriptor,
+    )
+
+
+def test_process_in_dependency_order():
+    # post-order, as created by `determine_changed_components` (incl. duplicates for diamonds)
+    replication_plan_components = [
+        _replication_plan_component('leaf'),
+        _replication_plan_component('a', references=('leaf',)),
+        _replication_plan_component('leaf'),
+        _replication_plan_component('b', references=('leaf', 'unrelated')),
+        _replication_plan_component('c'),
+        _replication_plan_component('root', references=('a', 'b', 'c')),
+    ]
+
+    lock = threading.Lock()
+    processed = []
+    running = set()
+    max_concurrency = 0
+
+    def process_component(replication_plan_component):
+        nonlocal max_concurrency
+        name = replication_plan_component.target.component.name
+        references = {
+            cref.componentName
+            for cref in replication_plan_component.target.component.componentReferences
+        }
+
+        with lock:
+            # referenced components are expected to be processed before their referrers, and
+            # components with same identity must not be processed concurrently
+            assert references & {'leaf', 'a', 'b', 'c'} <= set(processed)
+            assert name not in running
+            running.add(name)
+            max_concurrency = max(max_concurrency, len(running))
+
+        time.sleep(0.05)
+
+        with lock:
+            running.remove(name)
+            processed.append(name)
+
+    process_dependencies._process_in_dependency_order(
+        replication_plan_components=replication_plan_components,
+        process_component=process_component,
+        max_workers=4,
+    )
+
+    assert sorted(processed) == sorted(
+        rpc.target.component.name for rpc in replication_plan_components
+    )
+    assert processed[-1] == 'root'
+    assert max_concurrency > 1
+
+
+def test_process_in_dependency_order_stops_on_error():
+    replication_plan_components = [
+        _replication_plan_component('leaf'),
+        _replication_plan_component('a', references=('leaf',)),
+    ]
+    processed = []
+
+    def process_component(replication_plan_component):
+        if (name := replication_plan_component.target.component.name) == 'leaf':
+            raise ValueError(name)
+        processed.append(name)
+
+    with pytest.raises(ValueError):
+        process_dependencies._process_in_dependency_order(
+            replication_plan_components=replication_plan_components,
+            process_component=process_component,
+        )
+
+    assert not processed
+
+
+def _patch_resources_by_peer_copies(resources, replicated_resources):
+    # previous implementation (identities determined using deep-copied peers)
+    peer_resources = [copy.deepcopy(resource) for resource in resources]
+    patched_resources = {
+        resource.identity(peer_resources): resource
+        for resource in replicated_resources
+    }
+    return [
+        patched_resources.get(resource.identity(peer_resources), resource)
+        for resource in resources
+    ]
+
+
+def test_patch_resources():
+    rnd = random.Random(42)
+
+    for _ in range(50):
+        resources = [
+            _fake_resource(
+                name=f'r{rnd.randint(0, 5)}',
+                version=f'{rnd.randint(0, 2)}.0',
+                extra_identity=rnd.choice(({}, {'arch': 'amd64'}, {'arch': 'arm64'})),
+            ) for _ in range(rnd.randint(0, 12))
+        ]
+        replicated_resources = [
+            dataclasses.replace(resource, access=ocm.OciAccess(imageReference=f'tgt/{idx}'))
+            for idx, resource in enumerate(resources)
+            if rnd.random() < 0.7
+        ] + [_fake_resource(name='not-in-component')]
+
+        patched = process_dependencies.patch_resources(
+            resources=resources,
+            replicated_resources=replicated_resources,
+        )
+        assert [id(r) for r in patched] == [
+            id(r) for r in _patch_resources_by_peer_copies(resources, replicated_resources)
+        ]
+
+
+def test_patch_resources_many_resources():
+    resources = [
+        _fake_resource(name=f'r{idx}', version='1.0') for idx in range(10_000)
+    ]
+    replicated_resources = [
+        dataclasses.replace(resource, access=ocm.OciAccess(imageReference=f'tgt/{idx}'))
+        for idx, resource in enumerate(resources)
+    ]
+
+    patched = process_dependencies.patch_resources(
+        resources=resources,
+        replicated_resources=replicated_resources,
+    )
+
+    assert patched == replicated_resources
+
+
+class _S3StandIn(http.server.ThreadingHTTPServer):
+    '''
+    in-process stand-in for (public) S3-buckets, serving objects via `GET /<bucket>/<key>`, and
+    recording max. concurrent requests (per bucket, and in total)
+    '''
+    def __init__(self, objects: dict[tuple[str, str], bytes]):
+        self.objects = objects
+        self.lock = threading.Lock()
+        self.running = collections.Counter()
+        self.max_running = collections.Counter()
+        self.max_running_total = 0
+
+        server = self
+
+        class RequestHandler(http.server.BaseHTTPRequestHandler):
+            def do_HEAD(self):
+                bucket, key = self.path.lstrip('/').split('/', 1)
+                if (body := server.objects.get((bucket, key))) is None:
+                    self.send_error(404)
+                    return
+
+                self.send_response(200)
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+
+            def do_GET(self):
+                bucket, key = self.path.lstrip('/').split('/', 1)
+                with server.lock:
+                    server.running[bucket] += 1
+                    server.max_running[bucket] = max(
+                        server.max_running[bucket],
+                        server.running[bucket],
+                    )
+                    server.max_running_total = max(
+                        server.max_running_total,
+                        sum(server.running.values()),
+                    )
+
+                time.sleep(0.05)
+                body = server.objects.get((bucket, key))
+
+                with server.lock:
+                    server.running[bucket] -= 1
+
+                if body is None:
+                    self.send_error(404)
+                    return
+
+                self.send_response(200)
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args, **kwargs):
+                pass
+
+        super().__init__(('127.0.0.1', 0), RequestHandler)
+
+    def s3_url(self, bucket: str, key: str, region: str | None=None) -> str:
+        return f'http://127.0.0.1:{self.server_port}/{bucket}/{key}'
+
+
+@pytest.fixture
+def s3_stand_in(monkeypatch):
+    objects = {
+        (bucket, f'releases/{idx}.tar.gz'): f'{bucket}-{idx}'.encode()
+        for bucket in ('bucket-a', 'bucket-b')
+        for idx in range(8)
+    }
+    server = _S3StandIn(objects=objects)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    monkeypatch.setattr(sbom_s3, 's3_url', server.s3_url)
+
+    yield server
+
+    server.shutdown()
+    server.server_close()
+
+
+def _s3_candidates() -> list[tuple[ocm.Component, ocm.Resource]]:
+    component = _replication_plan_component('acme.org/s3').target.component
+
+    def s3_resource(bucket: str, key: str, legacy: bool=False) -> ocm.Resource:
+        if legacy:
+            access = ocm.LegacyS3Access(bucketName=bucket, objectKey=key)
+        else:
+            access = ocm.S3Access(bucket=bucket, key=key)
+        return ocm.Resource(
+            name=f'{bucket}-{key}',
+            version='1.0.0',
+            type='gardenlinux',
+            access=access,
+        )
+
+    return [
+        (component, s3_resource(bucket, f'releases/{idx}.tar.gz', legacy=idx % 2))
+        for bucket in ('bucket-a', 'bucket-b')
+        for idx in range(8)
+    ] + [(component, s3_resource('bucket-a', 'does-not-exist'))]
+
+
+def _scan_s3_resource(resource):
+    access = resource.access
+    return (b''.join(sbom_s3.iter_s3_object(
+        bucket=process_dependencies._s3_bucket(access),
+        key=process_dependencies._s3_key(access),
+    )),)
+
+
+_expected_s3_scan_results = [
+    (f'{bucket}-{idx}'.encode(),)
+    for bucket in ('bucket-a', 'bucket-b')
+    for idx in range(8)
+] + [None]
+
+
+def test_scan_s3_resources(s3_stand_in, monkeypatch):
+    # plenty of resources -> admission is expected to admit all scans
+    monkeypatch.setattr(sbom_inject, '_available_disk_bytes', lambda path: 2 ** 50)
+    monkeypatch.setattr(sbom_inject, '_available_mem_bytes', lambda: 2 ** 50)
+
+    scan_results = process_dependencies._scan_s3_resources(
+        s3_candidates=_s3_candidates(),
+        scan_s3_resource=_scan_s3_resource,
+        admission=sbom_inject.ScanAdmission(tmpdir='/tmp'), # nosec B108
+        estimate_bytes=lambda resource: sbom_inject.estimate_s3_scan_bytes(resource.access),
+        max_workers=16,
+        max_workers_per_bucket=3,
+    )
+
+    # results are expected in order of candidates; failures must not be fatal
+    assert scan_results == _expected_s3_scan_results
+
+    assert s3_stand_in.max_running == {'bucket-a': 3, 'bucket-b': 3}
+    assert s3_stand_in.max_running_total == 6
+
+
+def test_scan_s3_resources_admission(s3_stand_in, monkeypatch):
+    # estimates are expected to be based on object-sizes (looked up via HEAD)
+    est_disk, est_mem = sbom_inject.estimate_s3_scan_bytes(
+        ocm.S3Access(bucket='bucket-a', key='releases/0.tar.gz'),
+    )
+    assert est_disk == len(b'bucket-a-0') * sbom_inject._DISK_FACTOR
+    assert est_mem == sbom_inject._MEM_BASE + len(b'bucket-a-0') * sbom_inject._MEM_FACTOR
+
+    # headroom suffices for a single scan
+    monkeypatch.setattr(sbom_inject, '_available_disk_bytes', lambda path: 2 ** 50)
+    monkeypatch.setattr(
+        sbom_inject,
+        '_available_mem_bytes',
+        lambda: sbom_inject._MEM_HEADROOM + est_mem,
+    )
+
+    admission = sbom_inject.ScanAdmission(tmpdir='/tmp') # nosec B108
+    scan_results = process_dependencies._scan_s3_resources(
+        s3_candidates=_s3_candidates(),
+        scan_s3_resource=_scan_s3_resource,
+        admission=admission,
+        estimate_bytes=lambda resource: sbom_inject.estimate_s3_scan_bytes(resource.access),
+        max_workers=16,
+        max_workers_per_bucket=3,
+    )
+
+    assert scan_results == _expected_s3_scan_results
+    assert s3_stand_in.max_running_total == 1
+    assert admission.running == admission.reserved_disk == admission.reserved_mem == 0
@@ -9,6 +9,9 @@ import typing
 
 import github3
 
+import github.cache
+import github.ratelimit
+
 RepoUrl: typing.TypeAlias = str
 GithubApiLookup = collections.abc.Callable[[RepoUrl], github3.GitHub | None]
 
@@ -36,10 +39,12 @@ def host_org_and_repo(
 def github_api(
     repo_url: str=None,
     token: str=None,
+    response_cache: github.cache.ConditionalRequestCache | None=None,
 ) -> github3.GitHub:
     '''
     returns an initialised github-api instance, honouring some environment variables typically
-    present for GitHub-Actions-runs.
+    present for GitHub-Actions-runs. If `response_cache` is passed, responses are cached (and
+    revalidated using conditional requests).
 
     This function is intended to be used in GitHub-Actions.
     '''
@@ -58,6 +63,17 @@ def github_api(
             token=token,
         )
 
+    github.ratelimit.mount(
+        session=github_api.session,
+        base_url=github_api.session.base_url,
+    )
+    if response_cache:
+        github.cache.mount(
+            session=github_api.session,
+            base_url=github_api.session.base_url,
+            cache=response_cache,
+        )
+
     return github_api
 
 
@@ -65,10 +81,13 @@ def github_app_api(
     github_app_private_key: str | bytes,
     github_app_id: int,
     repo_url: str | None=None,
+    response_cache: github.cache.ConditionalRequestCache | None=None,
 ) -> github3.GitHub | github3.GitHubEnterprise:
     '''
     returns an initialised github-api instance, which is already logged in using the provided app
     credentials and honouring some environment variables typically present for GitHub-Actions-runs.
+    If `response_cache` is passed, responses are cached (and revalidated using conditional
+    requests).
 
     This function is intended to be used in GitHub-Actions.
     '''
@@ -84,6 +103,17 @@ def github_app_api(
             url=server_url,
         )
 
+    github.ratelimit.mount(
+        session=github_api.session,
+        base_url=github_api.session.base_url,
+    )
+    if response_cache:
+        github.cache.mount(
+            session=github_api.session,
+            base_url=github_api.session.base_url,
+            cache=response_cache,
+        )
+
     if isinstance(github_app_private_key, str):
         github_app_private_key = github_app_private_key.encode('utf-8')
 
@@ -0,0 +1,211 @@
+'''
+persistent cache for github-api responses, revalidated using conditional requests
+
+Listings retrieved from github-api (e.g. releases, pullrequests, tags, commits) rarely change
+between consecutive runs. Responses are stored in a local sqlite-file along with their
+validators (`ETag`, `Last-Modified`). Subsequent requests for the same url are sent as
+conditional requests (`If-None-Match`, `If-Modified-Since`); if github responds w/ http-304 (which
+does not count against the primary rate-limit), the cached response is returned instead.
+
+The cache is installed into a `requests.Session` (such as the one used by github3's api-objects)
+using `mount`.
+'''
+
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+import urllib.parse
+
+import requests
+import requests.adapters
+import requests.structures
+import requests.utils
+
+logger = logging.getLogger(__name__)
+
+
+_schema = '''
+CREATE TABLE IF NOT EXISTS responses (
+    cache_key TEXT PRIMARY KEY,
+    etag TEXT,
+    last_modified TEXT,
+    status_code INTEGER NOT NULL,
+    headers TEXT NOT NULL,
+    content BLOB NOT NULL
+)
+'''
+
+
+def _cache_key(request: requests.PreparedRequest) -> str:
+    # github-api responds w/ `Vary: Accept, Authorization`. Authorization is deliberately not
+    # part of the key, as tokens typically differ for each run (e.g. for GitHub-Actions); as cached
+    # responses are always revalidated, github will not respond w/ http-304 for unauthorised
+    # requests
+    key = hashlib.sha256(request.url.encode('utf-8'))
+    key.update(b'\0' + request.headers.get('Accept', '').encode('utf-8'))
+    return key.hexdigest()
+
+
+class ConditionalRequestCache:
+    '''
+    caches responses to GET-requests which carry a validator (`ETag` or `Last-Modified`) in a
+    sqlite-file at the given path (which is created if absent). Cached responses are always
+    revalidated.
+
+    Hit- and miss-counts are exposed as `hits` and `misses`.
+    '''
+    def __init__(self, path: str):
+        self.path = path
+        self.hits = 0
+        self.misses = 0
+
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        with self._connection:
+            self._connection.execute(_schema)
+
+    def close(self):
+        with self._lock:
+            self._connection.close()
+        logger.info(f'github-response-cache: {self.hits=} {self.misses=}')
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args, **kwargs):
+        self.close()
+
+    def _lookup(self, cache_key: str) -> tuple | None:
+        with self._lock:
+            return self._connection.execute(
+                'SELECT etag, last_modified, status_code, headers, content FROM responses '
+                'WHERE cache_key = ?',
+                (cache_key,),
+            ).fetchone()
+
+    def _store(self, cache_key: str, response: requests.Response):
+        with self._lock, self._connection:
+            self._connection.execute(
+                'INSERT OR REPLACE INTO responses '
+                '(cache_key, etag, last_modified, status_code, headers, content) '
+                'VALUES (?, ?, ?, ?, ?, ?)',
+                (
+                    cache_key,
+                    response.headers.get('ETag'),
+                    response.headers.get('Last-Modified'),
+                    response.status_code,
+                    json.dumps(dict(response.headers)),
+                    response.content,
+                ),
+            )
+
+    def send(
+        self,
+        adapter: requests.adapters.BaseAdapter,
+        request: requests.PreparedRequest,
+        **kwargs,
+    ) -> requests.Response:
+        '''
+        sends given request using given adapter, revalidating (and returning) cached responses,
+        and storing cacheable responses
+        '''
+        if (
+            request.method != 'GET'
+            or kwargs.get('stream')
+            or 'If-None-Match' in request.headers
+            or 'If-Modified-Since' in request.headers
+        ):
+            return adapter.send(request, **kwargs)
+
+        cache_key = _cache_key(request)
+
+        if (cached := self._lookup(cache_key)):
+            etag, last_modified, status_code, headers, content = cached
+
+            conditional_request = request.copy()
+            if etag:
+                conditional_request.headers['If-None-Match'] = etag
+            if last_modified:
+                conditional_request.headers['If-Modified-Since'] = last_modified
+
+            response = adapter.send(conditional_request, **kwargs)
+
+            if response.status_code == 304:
+                with self._lock:
+                    self.hits += 1
+
+                headers = requests.structures.CaseInsensitiveDict(json.loads(headers))
+                # rate-limit-headers et al. are taken from actual response
+                headers.update(response.headers)
+                headers.pop('Content-Length', None)
+
+                cached_response = requests.Response()
+                cached_response.status_code = status_code
+                cached_response.headers = headers
+                cached_response._content = content
+                cached_response.url = response.url
+                cached_response.encoding = requests.utils.get_encoding_from_headers(headers)
+                cached_response.reason = 'OK (cached)'
+                cached_response.request = request
+                cached_response.connection = response.connection
+                cached_response.elapsed = response.elapsed
+                return cached_response
+        else:
+            response = adapter.send(request, **kwargs)
+
+        with self._lock:
+            self.misses += 1
+
+        if response.status_code == 200 and (
+            'ETag' in response.headers or 'Last-Modified' in response.headers
+        ):
+            self._store(cache_key, response)
+
+        return response
+
+
+class CachingAdapter(requests.adapters.BaseAdapter):
+    '''
+    routes requests through given `ConditionalRequestCache`, delegating to given adapter
+    '''
+    def __init__(
+        self,
+        cache: ConditionalRequestCache,
+        adapter: requests.adapters.BaseAdapter,
+    ):
+        super().__init__()
+        self.cache = cache
+        self.adapter = adapter
+
+    def send(self, request: requests.PreparedRequest, **kwargs) -> requests.Response:
+        return self.cache.send(
+            adapter=self.adapter,
+            request=request,
+            **kwargs,
+        )
+
+    def close(self):
+        self.adapter.close()
+
+
+def mount(
+    session: requests.Session,
+    base_url: str,
+    cache: ConditionalRequestCache,
+):
+    '''
+    routes all requests of given session against the host of given base-url through given cache,
+    wrapping the adapter mounted so far
+    '''
+    parsed_url = urllib.parse.urlparse(base_url)
+    prefix = f'{parsed_url.scheme}://{parsed_url.netloc}/'
+
+    session.mount(
+        prefix,
+        CachingAdapter(
+            cache=cache,
+            adapter=session.get_adapter(prefix),
+        ),
+    )
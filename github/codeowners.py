@@ -2,8 +2,10 @@
 #
 # SPDX-License-Identifier: Apache-2.0
 
+import concurrent.futures
 import logging
 import os
+import threading
 import typing
 
 from github3 import GitHub, GitHubEnterprise
@@ -122,9 +124,57 @@ def filter_codeowners_entries(
         yield from line.split()[1:]
 
 
+class ResolutionCache:
+    '''
+    run-scoped cache for lookups of organisations, teams, users and email-addresses against
+    github-api, intended to be shared across multiple resolutions (e.g. for multiple repositories
+    processed in one run), so each distinct principal is looked up only once.
+
+    Concurrent lookups of the same key are done only once (other callers wait for the result).
+    Failed lookups are not cached, except for `NotFoundError`.
+    '''
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._entries: dict[tuple, concurrent.futures.Future] = {}
+        self.lookups = 0
+
+    def get(
+        self,
+        key: tuple,
+        lookup: typing.Callable[[], typing.Any],
+    ):
+        with self._lock:
+            if (future := self._entries.get(key)):
+                is_owner = False
+            else:
+                future = self._entries[key] = concurrent.futures.Future()
+                is_owner = True
+                self.lookups += 1
+
+        if is_owner:
+            try:
+                future.set_result(lookup())
+            except BaseException as e:
+                future.set_exception(e)
+                if not isinstance(e, NotFoundError):
+                    with self._lock:
+                        del self._entries[key]
+
+        return future.result()
+
+
+def _cache_key(
+    kind: str,
+    github_api: GitHub,
+    name: str,
+) -> tuple[str, str, str]:
+    return (kind, getattr(github_api, '_github_url', None), name.lower())
+
+
 def determine_email_address(
     github_user_name: str | Username,
     github_api: GitHub,
+    cache: ResolutionCache | None=None,
 ) -> EmailAddress | None:
     '''
     Return email address exposed for given user.
@@ -133,6 +183,15 @@ def determine_email_address(
     if not github_user_name:
         raise ValueError(github_user_name)
 
+    if cache:
+        return cache.get(
+            key=_cache_key('user-email', github_api, github_user_name),
+            lookup=lambda: determine_email_address(
+                github_user_name=github_user_name,
+                github_api=github_api,
+            ),
+        )
+
     try:
         user = github_api.user(github_user_name)
     except NotFoundError:
@@ -148,7 +207,18 @@ def determine_email_address(
 def usernames_from_email_address(
     email_address: EmailAddress,
     gh_api: GitHub | GitHubEnterprise,
+    cache: ResolutionCache | None=None,
 ) -> typing.Generator[Username, None, None]:
+    if cache:
+        yield from cache.get(
+            key=_cache_key('email-search', gh_api, email_address),
+            lookup=lambda: tuple(usernames_from_email_address(
+                email_address=email_address,
+                gh_api=gh_api,
+            )),
+        )
+        return
+
     no_user = True
     for res in gh_api.search_users(query=f'{email_address} in:email'):
         no_user = False
@@ -162,11 +232,39 @@ def resolve_team_members(
     team: Team,
     github_api: GitHub,
     absent_ok: bool=True,
+    cache: ResolutionCache | None=None,
 ) -> typing.Generator[Username, None, None]:
     '''
     Return generator yielding usernames resolved recursively from given team.
     If no team found for given team, no users are returned.
     '''
+    if cache:
+        def lookup_team_members() -> tuple[Username]:
+            organisation = cache.get(
+                key=_cache_key('organisation', github_api, team.org_name),
+                lookup=lambda: github_api.organization(team.org_name),
+            )
+            github_team: github3.orgs.Team = organisation.team_by_name(team.name)
+
+            return tuple(
+                Username(member.login)
+                for member in github_team.members()
+            )
+
+        try:
+            yield from cache.get(
+                key=_cache_key('team-members', github_api, team),
+                lookup=lookup_team_members,
+            )
+        except NotFoundError:
+            logger.warning('failed to lookup team {t}'.format(t=team.name))
+            if absent_ok:
+                return
+
+            raise
+
+        return
+
     try:
         organisation = github_api.organization(team.org_name)
         team = organisation.team_by_name(team.name)
@@ -187,6 +285,8 @@ def resolve_team_members(
 def resolve_email_addresses(
     codeowners_entries: typing.Iterable[Username | EmailAddress | Team],
     github_api: GitHub,
+    cache: ResolutionCache | None=None,
+    max_workers: int=8,
 ) -> typing.Generator[EmailAddress, None, None]:
     '''
     Returns a generator yielding the resolved email addresses for the given iterable of
@@ -194,8 +294,15 @@ def resolve_email_addresses(
     Teams are resolved to Users recursively.
     Users are resolved to exposed email addresses.
     If no email address is exposed the User is skipped.
+
+    Lookups are cached in passed `cache` (if not passed, a cache scoped to this call is used);
+    users are looked up concurrently, using at most `max_workers` threads.
     '''
+    if not cache:
+        cache = ResolutionCache()
+
     unique_email_addresses = set()
+    usernames = set()
 
     for codeowner_entry in codeowners_entries:
         if isinstance(codeowner_entry, EmailAddress):
@@ -203,30 +310,37 @@ def resolve_email_addresses(
             continue
 
         if isinstance(codeowner_entry, Username):
-            if (email_address := determine_email_address(
-                github_user_name=codeowner_entry,
-                github_api=github_api,
-            )):
-                unique_email_addresses.add(email_address)
-                continue
+            usernames.add(codeowner_entry)
+            continue
 
         if isinstance(codeowner_entry, Team):
-            for email_address in resolve_email_addresses(
-                codeowners_entries=resolve_team_members(
-                    team=codeowner_entry,
-                    github_api=github_api,
-                ),
+            usernames.update(resolve_team_members(
+                team=codeowner_entry,
                 github_api=github_api,
-            ):
-                unique_email_addresses.add(email_address)
+                cache=cache,
+            ))
             continue
 
+    def determine_email_address_cached(username: Username) -> EmailAddress | None:
+        return determine_email_address(
+            github_user_name=username,
+            github_api=github_api,
+            cache=cache,
+        )
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+        for email_address in executor.map(determine_email_address_cached, usernames):
+            if email_address:
+                unique_email_addresses.add(email_address)
+
     yield from unique_email_addresses
 
 
 def resolve_usernames(
     codeowners_entries: typing.Iterable[Username | EmailAddress | Team],
     github_api: GitHub,
+    cache: ResolutionCache | None=None,
+    max_workers: int=8,
 ) -> typing.Generator[Username, None, None]:
     '''
     Returns a generator yielding the resolved usernames for the given iterable of
@@ -234,8 +348,15 @@ def resolve_usernames(
     Teams are resolved to Users recursively.
     Emails are resolved to users.
     If no username is found for given email address, its skipped.
+
+    Lookups are cached in passed `cache` (if not passed, a cache scoped to this call is used);
+    email addresses are looked up concurrently, using at most `max_workers` threads.
     '''
+    if not cache:
+        cache = ResolutionCache()
+
     unique_usernames = set()
+    email_addresses = set()
 
     for codeowner_entry in codeowners_entries:
         if isinstance(codeowner_entry, Username):
@@ -243,24 +364,26 @@ def resolve_usernames(
             continue
 
         if isinstance(codeowner_entry, EmailAddress):
-            for username in usernames_from_email_address(
-                email_address=codeowner_entry,
-                gh_api=github_api,
-            ):
-                unique_usernames.add(username)
-
+            email_addresses.add(codeowner_entry)
             continue
 
         if isinstance(codeowner_entry, Team):
-            for username in resolve_usernames(
-                codeowners_entries=resolve_team_members(
-                    team=codeowner_entry,
-                    github_api=github_api,
-                ),
+            unique_usernames.update(resolve_team_members(
+                team=codeowner_entry,
                 github_api=github_api,
-            ):
-                unique_usernames.add(username)
-
+                cache=cache,
+            ))
             continue
 
+    def usernames_from_email_address_cached(email_address: EmailAddress) -> tuple[Username]:
+        return tuple(usernames_from_email_address(
+            email_address=email_address,
+            gh_api=github_api,
+            cache=cache,
+        ))
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+        for usernames in executor.map(usernames_from_email_address_cached, email_addresses):
+            unique_usernames.update(usernames)
+
     yield from unique_usernames
@@ -0,0 +1,257 @@
+'''
+rate-limit-aware scheduling of requests against github-api
+
+GitHub advertises the remaining request-budget (per resource, e.g. `core`, `search`, `graphql`)
+with each response (`X-RateLimit-Remaining`, `X-RateLimit-Reset`). If the budget is exhausted,
+or if secondary rate-limits are hit (e.g. too many concurrent requests), responses are
+rejected (http-403 / http-429), typically accompanied by a `Retry-After` header.
+
+`RateLimitScheduler` tracks the budget from response headers and paces requests accordingly
+(requests are delayed only until the advertised reset), limits the amount of concurrent requests,
+and retries rate-limited requests. It is intended to be shared by all requests against the same
+github-host (see `shared_scheduler`), and is installed into a `requests.Session` (such as the one
+used by github3's api-objects) using `mount`.
+
+see: https://docs.github.com/en/rest/using-the-rest-api/rate-limits-for-the-rest-api
+'''
+
+import collections.abc
+import dataclasses
+import logging
+import threading
+import time
+import urllib.parse
+
+import requests
+import requests.adapters
+
+logger = logging.getLogger(__name__)
+
+'''
+wait-time for secondary rate-limits w/o advertised `Retry-After` (as recommended by GitHub)
+'''
+default_retry_after_seconds = 60
+
+
+@dataclasses.dataclass
+class Budget:
+    limit: int
+    remaining: int
+    reset: float # epoch-seconds
+
+
+def resource_from_url(url: str) -> str:
+    path = urllib.parse.urlparse(url).path
+    if '/search/' in path:
+        return 'search'
+    if path.endswith('/graphql'):
+        return 'graphql'
+    return 'core'
+
+
+def retry_after(
+    response: requests.Response,
+    now: float | None=None,
+) -> float | None:
+    '''
+    returns the amount of seconds to wait before retrying, if given response indicates that the
+    request was rejected because of (primary or secondary) rate-limits; None otherwise.
+    '''
+    if response is None or response.status_code not in (403, 429):
+        return None
+
+    if now is None:
+        now = time.time()
+
+    headers = response.headers
+
+    if (retry_after_header := headers.get('Retry-After')):
+        try:
+            return max(float(retry_after_header), 0)
+        except ValueError:
+            pass
+
+    if headers.get('X-RateLimit-Remaining') == '0' and (reset := headers.get('X-RateLimit-Reset')):
+        return max(float(reset) - now, 0) + 1 # reset has a resolution of 1s
+
+    if response.status_code == 429 or 'rate limit' in response.text.lower():
+        return default_retry_after_seconds
+
+    return None # e.g. missing permissions
+
+
+class RateLimitScheduler:
+    '''
+    paces requests according to the rate-limit budgets advertised by github (see module
+    docstring). Once the remaining budget for a resource falls below `pace_below` (as fraction of
+    the limit), requests are spread evenly until the reset. Exhausted budgets, and rejected
+    requests block further requests until the advertised reset / retry-after.
+
+    `clock` and `sleep` may be overwritten for testing purposes.
+    '''
+    def __init__(
+        self,
+        max_concurrency: int=8,
+        pace_below: float=0.05,
+        clock: collections.abc.Callable[[], float]=time.time,
+        sleep: collections.abc.Callable[[float], None]=time.sleep,
+    ):
+        self.pace_below = pace_below
+        self.clock = clock
+        self.sleep = sleep
+
+        self._lock = threading.Lock()
+        self._concurrency = threading.BoundedSemaphore(max_concurrency)
+        self._budgets: dict[str, Budget] = {}
+        self._next_send: dict[str, float] = {} # per resource, if paced
+        self._blocked_until = 0.0
+        self.waited_seconds = 0.0
+
+    def delay(self, resource: str='core') -> float:
+        '''
+        returns the amount of seconds a request against given resource should be delayed
+        '''
+        now = self.clock()
+
+        with self._lock:
+            delay = max(self._blocked_until - now, 0)
+
+            if not (budget := self._budgets.get(resource)) or budget.reset <= now:
+                return delay
+
+            if budget.remaining <= 0:
+                return max(delay, budget.reset - now + 1)
+
+            if budget.remaining < budget.limit * self.pace_below:
+                # spread remaining requests evenly until reset; each caller reserves its own slot,
+                # so that concurrent callers are not released at once
+                interval = (budget.reset - now) / budget.remaining
+                send_at = max(self._next_send.get(resource, now), now + delay)
+                self._next_send[resource] = send_at + interval
+                return send_at - now
+
+            return delay
+
+    def wait(self, resource: str='core'):
+        if (delay := self.delay(resource=resource)) <= 0:
+            return
+
+        logger.info(f'github rate-limit: delaying request against {resource=} for {delay:.1f}s')
+        with self._lock:
+            self.waited_seconds += delay
+        self.sleep(delay)
+
+    def update(self, response: requests.Response) -> float | None:
+        '''
+        updates budget from the given response's headers; returns the amount of seconds to wait
+        before retrying, if request was rate-limited (see `retry_after`)
+        '''
+        headers = response.headers
+        now = self.clock()
+
+        with self._lock:
+            if (
+                (remaining := headers.get('X-RateLimit-Remaining')) is not None
+                and (reset := headers.get('X-RateLimit-Reset')) is not None
+            ):
+                resource = headers.get('X-RateLimit-Resource') or resource_from_url(response.url)
+                self._budgets[resource] = Budget(
+                    limit=int(headers.get('X-RateLimit-Limit') or remaining),
+                    remaining=int(remaining),
+                    reset=float(reset),
+                )
+
+            if (seconds := retry_after(response=response, now=now)) is not None:
+                self._blocked_until = max(self._blocked_until, now + seconds)
+
+        return seconds
+
+    def request(
+        self,
+        send: collections.abc.Callable[[], requests.Response],
+        resource: str='core',
+        retries: int=5,
+    ) -> requests.Response:
+        '''
+        sends a request (by calling `send`), honouring rate-limits; rate-limited requests are
+        retried (at most `retries` times), the last response is returned in any case. Callers
+        must pass `retries=0` if `send` cannot be repeated.
+        '''
+        while True:
+            self.wait(resource=resource)
+
+            with self._concurrency:
+                response = send()
+
+            if self.update(response) is None or retries <= 0:
+                return response
+
+            logger.warning(
+                f'github rate-limit: request was rejected ({response.status_code=}), will '
+                f'retry ({retries=})'
+            )
+            retries -= 1
+            response.close()
+
+
+class RateLimitedAdapter(requests.adapters.HTTPAdapter):
+    def __init__(
+        self,
+        scheduler: RateLimitScheduler,
+        retries: int=5,
+        **kwargs,
+    ):
+        super().__init__(**kwargs)
+        self.scheduler = scheduler
+        self.retries = retries
+
+    def send(self, request: requests.PreparedRequest, *args, **kwargs) -> requests.Response:
+        def send():
+            return super(RateLimitedAdapter, self).send(request, *args, **kwargs)
+
+        # streamed bodies (file-objects, generators) are consumed by the first attempt, so
+        # rate-limited responses are returned to the caller instead
+        if request.body is None or isinstance(request.body, (bytes, str)):
+            retries = self.retries
+        else:
+            retries = 0
+
+        return self.scheduler.request(
+            send=send,
+            resource=resource_from_url(request.url),
+            retries=retries,
+        )
+
+
+_schedulers: dict[str, RateLimitScheduler] = {}
+_schedulers_lock = threading.Lock()
+
+
+def shared_scheduler(host: str) -> RateLimitScheduler:
+    '''
+    returns the (process-wide) shared scheduler for the given github-host
+    '''
+    with _schedulers_lock:
+        if not (host_scheduler := _schedulers.get(host)):
+            host_scheduler = _schedulers[host] = RateLimitScheduler()
+        return host_scheduler
+
+
+def mount(
+    session: requests.Session,
+    base_url: str,
+    scheduler: RateLimitScheduler | None=None,
+):
+    '''
+    routes all requests of given session against the host of given base-url through given
+    scheduler (or the shared scheduler for the respective host, if not passed)
+    '''
+    parsed_url = urllib.parse.urlparse(base_url)
+
+    if not scheduler:
+        scheduler = shared_scheduler(parsed_url.netloc)
+
+    session.mount(
+        f'{parsed_url.scheme}://{parsed_url.netloc}/',
+        RateLimitedAdapter(scheduler=scheduler),
+    )
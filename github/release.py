@@ -7,6 +7,7 @@ import logging
 
 import github3.repos
 import github3.repos.release
+import semver
 
 import github.limits
 import version
@@ -113,6 +114,12 @@ def delete_outdated_draft_releases(
         yield release, release.delete()
 
 
+def _parse_to_semver_or_none(version_str: str | None) -> semver.VersionInfo | None:
+    if version_str is None:
+        return None
+    return version.parse_to_semver(version_str, invalid_semver_ok=True)
+
+
 def outdated_draft_releases(
     draft_releases: list[github3.repos.release.Release],
     greatest_release_version: str,
@@ -126,25 +133,15 @@ def outdated_draft_releases(
         - if there are multiple releases versions in a partition, keep only the release
             corresponding to greatest (according to semver)
     '''
-
     greatest_release_version_info = version.parse_to_semver(greatest_release_version)
 
-    def _has_semver_draft_prerelease_label(release_name):
-        version_info = version.parse_to_semver(release_name)
-        if version_info.prerelease != 'draft':
-            return False
-        return True
-
+    # parse each release-name only once
     autogenerated_draft_releases = [
-        release for release in draft_releases
+        (release, release_version_info)
+        for release in draft_releases
         if release.name
-        and version.is_semver_parseable(release.name)
-        and _has_semver_draft_prerelease_label(release.name)
-    ]
-
-    draft_release_version_infos = [
-        version.parse_to_semver(release.name)
-        for release in autogenerated_draft_releases
+        and (release_version_info := _parse_to_semver_or_none(release.name)) is not None
+        and release_version_info.prerelease == 'draft'
     ]
 
     def _yield_outdated_version_infos_from_partition(partition):
@@ -153,52 +150,39 @@ def outdated_draft_releases(
             if version_info < greatest_release_version_info and version_info.patch == 0:
                 yield version_info
         else:
-            yield from [
-                version_info
-                for version_info in partition[1:]
-            ]
+            yield from partition[1:]
 
-    outdated_version_infos = list()
-    for partition in version.partition_by_major_and_minor(draft_release_version_infos):
-        outdated_version_infos.extend(_yield_outdated_version_infos_from_partition(partition))
+    outdated_version_infos = set()
+    for partition in version.partition_by_major_and_minor(
+        release_version_info for _, release_version_info in autogenerated_draft_releases
+    ):
+        outdated_version_infos.update(_yield_outdated_version_infos_from_partition(partition))
 
-    outdated_draft_releases = [
+    return [
         release
-        for release in autogenerated_draft_releases
-        if version.parse_to_semver(release.name) in outdated_version_infos
+        for release, release_version_info in autogenerated_draft_releases
+        if release_version_info in outdated_version_infos
     ]
 
-    return outdated_draft_releases
-
 
 def find_greatest_github_release_version(
     releases: list[github3.repos.release.Release],
     warn_for_unparseable_releases: bool = True,
     ignore_prerelease_versions: bool = False,
 ):
-    # currently, non-draft-releases are not created with a name by us. Use the tag name as fallback
-    release_versions = [
-        release.name if release.name else release.tag_name
-        for release in releases
-    ]
+    release_version_infos = []
+    for release in releases:
+        # currently, non-draft-releases are not created with a name by us. Use the tag name as
+        # fallback
+        release_name = release.name if release.name else release.tag_name
 
-    def filter_non_semver_parseable_releases(release_name):
-        try:
-            version.parse_to_semver(release_name)
-            return True
-        except ValueError:
+        if (release_version_info := _parse_to_semver_or_none(release_name)) is None:
             if warn_for_unparseable_releases:
                 logger.warning(f'ignoring release {release_name=} (not semver)')
-            return False
+            continue
 
-    release_versions = [
-        name for name in filter(filter_non_semver_parseable_releases, release_versions)
-    ]
+        release_version_infos.append(release_version_info)
 
-    release_version_infos = [
-        version.parse_to_semver(release_version)
-        for release_version in release_versions
-    ]
     greatest_version = version.greatest_version(
         versions=release_version_infos,
         ignore_prerelease_versions=ignore_prerelease_versions,
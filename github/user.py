@@ -4,6 +4,8 @@ import time
 import cachetools
 import github3.github
 
+import github.ratelimit as grl
+
 logger = logging.getLogger(__name__)
 
 _user_cache = cachetools.TTLCache(maxsize=512, ttl=60*60*12) # 12h
@@ -41,8 +43,12 @@ def is_user_active(
         if not retries:
             raise
 
-        logger.warning(f'received http-403 - maybe due to quota - will retry {retries=}')
-        time.sleep(60)
+        seconds = grl.retry_after(fbe.response)
+        if seconds is None:
+            seconds = grl.default_retry_after_seconds
+
+        logger.warning(f'received http-403 - maybe due to quota - will retry {retries=} {seconds=}')
+        time.sleep(seconds)
         return is_user_active(
             username=username,
             github=github,
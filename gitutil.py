@@ -298,6 +298,47 @@ class GitHelper:
             with remote.repo.git.custom_environment(**cmd_env):
                 remote.repo.git.notes('add', '-f', '-m', body, commit.hexsha)
 
+    def add_notes(self, bodies: dict[str, str]):
+        '''
+        adds (or overwrites) notes for multiple commits at once. `bodies` maps commit-digests to
+        note-bodies. In contrast to repeated calls of `add_note`, all notes are written using a
+        single invocation of `git fast-import` (resulting in exactly one commit to notes-ref).
+        '''
+        if not bodies:
+            return
+
+        with self._authenticated_remote() as (cmd_env, remote):
+            repo = remote.repo
+            with repo.git.custom_environment(**cmd_env):
+                notes_ref = repo.git.notes('get-ref')
+                committer = repo.git.var('GIT_COMMITTER_IDENT')
+                try:
+                    parent = repo.git.rev_parse('--verify', '--quiet', notes_ref)
+                except git.exc.GitCommandError:
+                    parent = None # notes-ref does not exist yet
+
+                def data(payload: str) -> bytes:
+                    payload = payload.encode('utf-8')
+                    return f'data {len(payload)}\n'.encode('utf-8') + payload + b'\n'
+
+                with tempfile.TemporaryFile() as stream:
+                    stream.write(f'commit {notes_ref}\ncommitter {committer}\n'.encode('utf-8'))
+                    stream.write(data(f'Notes added for {len(bodies)} commits'))
+                    if parent:
+                        stream.write(f'from {parent}\n'.encode('utf-8'))
+
+                    for commit_digest, body in bodies.items():
+                        stream.write(f'N inline {commit_digest}\n'.encode('utf-8'))
+                        stream.write(data(body))
+
+                    stream.write(b'done\n')
+                    stream.seek(0)
+
+                    repo.git.execute(
+                        ['git', 'fast-import', '--quiet', '--done'],
+                        istream=stream,
+                    )
+
     def fetch_head(self, ref: str):
         with self._authenticated_remote() as (cmd_env, remote):
             with remote.repo.git.custom_environment(**cmd_env):
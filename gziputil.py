@@ -1,3 +1,8 @@
+import collections
+import collections.abc
+import concurrent.futures
+import functools
+import os
 import struct
 import time
 import zlib
@@ -9,6 +14,8 @@ some useful utils for creating standard-compliant GZIP-streams that also work w/
 see https://docs.fileformat.com/compression/gz/
 '''
 
+_max_zdict_size = 32 * 1024 # deflate's max. window-size
+
 
 def gzip_header(fname: bytes=b'', mtime: int=None) -> bytes:
     '''
@@ -56,3 +63,144 @@ def zlib_compressobj():
         memLevel=zlib.DEF_MEM_LEVEL,
         strategy=zlib.Z_DEFAULT_STRATEGY,
     )
+
+
+def _gf2_matrix_times(matrix: collections.abc.Sequence[int], vector: int) -> int:
+    result = 0
+    idx = 0
+    while vector:
+        if vector & 1:
+            result ^= matrix[idx]
+        vector >>= 1
+        idx += 1
+    return result
+
+
+def _gf2_matrix_multiply(
+    a: collections.abc.Sequence[int],
+    b: collections.abc.Sequence[int],
+) -> tuple[int]:
+    return tuple(_gf2_matrix_times(a, column) for column in b)
+
+
+@functools.cache
+def _crc32_zeroes_operator(length: int) -> tuple[int]:
+    '''
+    returns the (GF(2)-)matrix that maps the crc32-checksum of some data to the crc32-checksum of
+    the same data with `length` zero-octets appended (see zlib's `crc32_combine`)
+    '''
+    # operator for one zero-bit
+    operator = (0xedb88320,) + tuple(1 << n for n in range(31))
+    # operator for one zero-octet
+    for _ in range(3):
+        operator = _gf2_matrix_multiply(operator, operator)
+
+    result = tuple(1 << n for n in range(32)) # identity
+    while length:
+        if length & 1:
+            result = _gf2_matrix_multiply(operator, result)
+        length >>= 1
+        if length:
+            operator = _gf2_matrix_multiply(operator, operator)
+
+    return result
+
+
+def crc32_combine(crc1: int, crc2: int, length2: int) -> int:
+    '''
+    returns the crc32-checksum of the concatenation of two octet-sequences, given their
+    crc32-checksums and the length of the second sequence (same semantics as zlib's
+    `crc32_combine`, which is not exposed by python's `zlib` module)
+    '''
+    if length2 <= 0:
+        return crc1
+    return _gf2_matrix_times(_crc32_zeroes_operator(length2), crc1) ^ crc2
+
+
+def _iter_blocks(
+    chunks: collections.abc.Iterable[bytes],
+    block_size: int,
+) -> collections.abc.Generator[bytes, None, None]:
+    buf = bytearray()
+    for chunk in chunks:
+        buf += chunk
+        while len(buf) >= block_size:
+            yield bytes(buf[:block_size])
+            del buf[:block_size]
+    if buf:
+        yield bytes(buf)
+
+
+def _compress_block(
+    block: bytes,
+    zdict: bytes,
+    level: int,
+) -> tuple[bytes, int]:
+    kwargs = {'zdict': zdict} if zdict else {}
+    compressor = zlib.compressobj(
+        level=level,
+        method=zlib.DEFLATED,
+        wbits=-15,
+        memLevel=zlib.DEF_MEM_LEVEL,
+        strategy=zlib.Z_DEFAULT_STRATEGY,
+        **kwargs,
+    )
+    # sync-flush aligns output to octet-boundaries w/o marking last deflate-block as final, thus
+    # compressed blocks may be concatenated into one deflate-stream
+    compressed = compressor.compress(block) + compressor.flush(zlib.Z_SYNC_FLUSH)
+
+    return compressed, zlib.crc32(block)
+
+
+def parallel_gzip(
+    chunks: collections.abc.Iterable[bytes],
+    fname: bytes=b'',
+    mtime: int=None,
+    level: int=zlib.Z_DEFAULT_COMPRESSION,
+    block_size: int=128 * 1024,
+    max_workers: int | None=None,
+) -> collections.abc.Generator[bytes, None, None]:
+    '''
+    compresses the given chunks into a single gzip-member (incl. header and footer), yielding
+    compressed chunks (similar to `pigz`).
+
+    The uncompressed stream is split into blocks of `block_size` octets, which are compressed
+    concurrently (zlib releases the GIL); each block's compressor is primed with the last 32 KiB
+    of the preceding block, so compression-ratio is close to that of a single compressor. The
+    resulting stream is readable by any gzip-decompressor (incl. python's `tarfile` module in
+    streaming mode).
+    '''
+    if not max_workers:
+        max_workers = os.cpu_count() or 1
+
+    yield gzip_header(fname=fname, mtime=mtime)
+
+    crc = 0
+    uncompressed_size = 0
+    pending = collections.deque() # (future, block-length)
+
+    def pop_pending():
+        nonlocal crc, uncompressed_size
+        future, block_length = pending.popleft()
+        compressed, block_crc = future.result()
+        crc = crc32_combine(crc, block_crc, block_length)
+        uncompressed_size += block_length
+        return compressed
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+        zdict = b''
+        for block in _iter_blocks(chunks=chunks, block_size=block_size):
+            pending.append((executor.submit(_compress_block, block, zdict, level), len(block)))
+            zdict = block[-_max_zdict_size:]
+
+            # limit amount of blocks held in memory
+            while len(pending) > 2 * max_workers:
+                yield pop_pending()
+
+        while pending:
+            yield pop_pending()
+
+    # empty final deflate-block
+    yield zlib_compressobj().flush(zlib.Z_FINISH)
+
+    yield gzip_footer(crc32=crc, uncompressed_size=uncompressed_size)
@@ -5,10 +5,9 @@
 import collections.abc
 import enum
 import functools
-import io
 import json as js
 import logging
-import sys
+import tempfile
 import typing
 import zlib
 
@@ -213,20 +212,38 @@ class EncodingMethod(enum.StrEnum):
     GZIP = 'gzip'
 
 
+_encode_chunk_size = 64 * 1024 # octets
+
+
 def encode_request(
-    data: str | bytes | dict | typing.IO=None,
+    data: str | bytes | dict | typing.IO | collections.abc.Iterable[str | bytes]=None,
     json: dict=None,
     headers: dict[str, str]=None,
     encoding_method: EncodingMethod=EncodingMethod.GZIP,
+    chunked: bool=False,
+    spool_max_size: int=8 * 1024 * 1024, # 8 MiB
 ) -> (
-    tuple[collections.abc.Generator[bytes, None, None], dict[str, str]]
-    | collections.abc.Generator[bytes, None, None]
+    tuple[bytes | typing.IO | collections.abc.Generator[bytes, None, None], dict[str, str]]
+    | bytes | typing.IO | collections.abc.Generator[bytes, None, None]
 ):
     '''
     Encodes the given `data` or `json` property based on the selected `encoding_method`. Only one of
-    `data` or `json` must be set, otherwise a `ValueError` is raised.
+    `data` or `json` must be set, otherwise a `ValueError` is raised. `data` may also be a
+    file-like object, or an iterable of `str` or `bytes` (e.g. a generator), which are read
+    incrementally.
+
+    If `chunked` is set, the encoded data is returned as a generator, which encodes `data` lazily
+    (i.e. memory consumption does not depend on size of `data`). Passed to `requests` as `data`,
+    it will be sent using chunked transfer-encoding.
+
+    Otherwise, `Content-Length` is determined:
+    - for `str`, `bytes`, `dict`, and `json`, the encoded data is returned as `bytes`
+    - for file-like objects and iterables, the encoded data is written to a (rewound) spooled
+      temporary file (which is kept in memory up to `spool_max_size` octets, and written to disk
+      otherwise), which is returned
 
-    The corresponding `Content-Encoding` header is patched-in to the provided headers dictionary.
+    The corresponding `Content-Encoding` (and `Content-Length`, unless `chunked` is set) header is
+    patched-in to the provided headers dictionary.
 
     If `headers` is provided and not `None`, the response is a tuple of the compression result and
     the patched headers, otherwise only the compression result is returned.
@@ -250,32 +267,64 @@ def encode_request(
         else:
             raise ValueError(f'Encoding of type {type(obj)} is not (yet) supported')
 
-    def _compress(data, encoding_method) -> collections.abc.Generator[bytes, None, None]:
-        if isinstance(data, io.BufferedIOBase):
-            if encoding_method == EncodingMethod.GZIP:
-                compressor = zlib.compressobj(wbits=31)
-                data.seek(0)
+    in_memory = isinstance(data, (str, bytes, dict))
+    readable = hasattr(data, 'read')
+
+    if not (in_memory or readable or hasattr(data, '__iter__')):
+        raise ValueError(f'Encoding of type {type(data)} is not (yet) supported')
 
-                while (chunk := data.read(8192)):
-                    yield compressor.compress(chunk)
-                yield compressor.flush()
+    def _iter_chunks() -> collections.abc.Generator[bytes, None, None]:
+        if in_memory:
+            yield _encode(data)
+
+        elif readable:
+            if hasattr(data, 'seekable') and data.seekable():
+                data.seek(0)
 
-        elif hasattr(data, '__iter__') and not isinstance(data, (str, bytes, dict)):
-            raise ValueError(f'Encoding of iterable {type(data)} is not (yet) supported')
+            while (chunk := data.read(_encode_chunk_size)):
+                yield _encode(chunk)
 
         else:
-            data = _encode(data)
+            for chunk in data:
+                yield _encode(chunk)
+
+    def _compress(
+        chunks: collections.abc.Iterable[bytes],
+    ) -> collections.abc.Generator[bytes, None, None]:
+        if encoding_method == EncodingMethod.GZIP:
+            compressor = zlib.compressobj(wbits=31)
+
+            for chunk in chunks:
+                if (compressed_chunk := compressor.compress(chunk)):
+                    yield compressed_chunk
+            yield compressor.flush()
+
+    if chunked:
+        encoded_data = _compress(_iter_chunks())
+
+        if headers is not None:
+            headers['Content-Encoding'] = encoding_method
+            headers.pop('Content-Length', None)
+            return encoded_data, headers
+
+        return encoded_data
+
+    if in_memory:
+        encoded_data = b''.join(_compress(_iter_chunks()))
+        content_length = len(encoded_data)
+
+    else:
+        encoded_data = tempfile.SpooledTemporaryFile(max_size=spool_max_size)
 
-            if encoding_method == EncodingMethod.GZIP:
-                compressor = zlib.compressobj(wbits=31)
-                yield compressor.compress(data) + compressor.flush()
+        for compressed_chunk in _compress(_iter_chunks()):
+            encoded_data.write(compressed_chunk)
 
-    compressed_data = b''.join(_compress(data, encoding_method))
-    content_length = sys.getsizeof(compressed_data)
+        content_length = encoded_data.tell()
+        encoded_data.seek(0)
 
     if headers is not None:
         headers['Content-Encoding'] = encoding_method
         headers['Content-Length'] = str(content_length)
-        return compressed_data, headers
+        return encoded_data, headers
 
-    return compressed_data
+    return encoded_data
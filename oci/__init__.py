@@ -14,6 +14,7 @@ import oci.auth as oa
 import oci.client as oc
 import oci.convert as oconv
 import oci.model as om
+import oci.mount
 import oci.platform as op
 
 
@@ -70,6 +71,7 @@ def replicate_artifact(
     mode: ReplicationMode=ReplicationMode.REGISTRY_DEFAULTS,
     platform_filter: collections.abc.Callable[[om.OciPlatform], bool]=None,
     annotations: dict[str, str]=None,
+    blob_mounts: oci.mount.BlobMountPlanner | None=None,
 ) -> tuple[requests.Response, str, bytes]:
     '''
     replicate the given OCI Artifact from src_image_reference to tgt_image_reference.
@@ -101,6 +103,10 @@ def replicate_artifact(
     overwritten. If existing values are identical, it is tried to avoid to create a "pseudo-diff"
     (i.e. in case the existing values are equal, the manifest will be left untouched).
 
+    If `blob_mounts` is passed, blobs that were already replicated to another repository on the
+    target's registry host (using the same planner) are mounted from there, rather than uploaded
+    (see `oci.mount`).
+
     pass either `credentials_lookup`, `routes`, OR `oci_client`
     '''
     if not (bool(credentials_lookup) ^ bool(oci_client)):
@@ -211,6 +217,7 @@ def replicate_artifact(
                     oci_client=client,
                     mode=recursive_mode,
                     annotations=annotations,
+                    blob_mounts=blob_mounts,
                 )
 
                 submanifest_digest = f'sha256:{hashlib.sha256(submanifest_bytes).hexdigest()}'
@@ -271,6 +278,7 @@ def replicate_artifact(
                     tgt_image_reference=tgt_image_ref,
                     oci_client=oci_client,
                     annotations=annotations,
+                    blob_mounts=blob_mounts,
                 )
 
                 manifest_list = om.OciImageManifestList(
@@ -326,6 +334,12 @@ def replicate_artifact(
             digest=layer.digest,
         )
         if head_res.ok:
+            if blob_mounts:
+                blob_mounts.blob_present(
+                    image_reference=tgt_image_reference,
+                    digest=layer.digest,
+                )
+
             if not need_uncompressed_layer_digests:
                 logger.info(f'skipping blob download {layer.digest=} - already exists in tgt')
                 continue # no need to download if blob already exists in tgt
@@ -346,6 +360,28 @@ def replicate_artifact(
                 uncompressed_layer_digests.append(f'sha256:{layer_hash.hexdigest()}')
                 continue # we may still skip the upload, of course
 
+        # cfg-blob might be absent in src (see below); it is small, anyways
+        if blob_mounts and not is_cfg_blob and not need_uncompressed_layer_digests:
+            def upload_blob():
+                client.put_blob(
+                    image_reference=tgt_image_reference,
+                    digest=layer.digest,
+                    octets_count=layer.size,
+                    data=client.blob(
+                        image_reference=src_image_reference,
+                        digest=layer.digest,
+                    ),
+                )
+
+            blob_mounts.mount_or_upload(
+                oci_client=client,
+                image_reference=tgt_image_reference,
+                digest=layer.digest,
+                octets_count=layer.size,
+                upload=upload_blob,
+            )
+            continue
+
         # todo: consider silencing warning if we do v1->v2-conversion (cfg-blob will never exist
         #       in this case
         blob_res = client.blob(
@@ -437,12 +473,16 @@ def replicate_blobs(
     oci_client: oc.Client,
     blob_overwrites: dict[om.OciBlobRef, bytes | io.BytesIO],
     blobs_to_skip: frozenset[str]=frozenset(),
+    blob_mounts: oci.mount.BlobMountPlanner | None=None,
 ) -> om.OciImageManifest:
     '''
     replicates blobs from given oci-image-ref to the specified target-ref, optionally replacing
     the specified blobs. This is particularly useful for replacing some "special" blobs, such
     as a component-descriptor layer blob or the config-blob.
 
+    If `blob_mounts` is passed, (non-overwritten) blobs that were already replicated to another
+    repository on the target's registry host are mounted from there (see `oci.mount`).
+
     Note that the uploaded artifact must be finalised after the upload by a "manifest-put".
     '''
     blob_overwrites = {k.digest:v for k,v in blob_overwrites.items()}
@@ -481,6 +521,8 @@ def replicate_blobs(
             digest = blob.digest
 
             if oci_client.head_blob(image_reference=tgt_ref, digest=digest).ok:
+                if blob_mounts:
+                    blob_mounts.blob_present(image_reference=tgt_ref, digest=digest)
                 return om.OciBlobRef(
                     digest=digest,
                     mediaType=blob.mediaType,
@@ -498,19 +540,35 @@ def replicate_blobs(
                     size=blob.size,
                 )
 
-            src_blob: requests.models.Response = oci_client.blob(
-                image_reference=src_ref,
-                digest=digest,
-            )
+            octets_count = blob.size
 
-            octets_count = int(src_blob.headers['Content-Length'])
+            def upload_blob():
+                nonlocal octets_count
+                src_blob: requests.models.Response = oci_client.blob(
+                    image_reference=src_ref,
+                    digest=digest,
+                )
+
+                octets_count = int(src_blob.headers['Content-Length'])
+
+                oci_client.put_blob(
+                    image_reference=tgt_ref,
+                    digest=digest,
+                    octets_count=octets_count,
+                    data=src_blob,
+                )
+
+            if blob_mounts:
+                blob_mounts.mount_or_upload(
+                    oci_client=oci_client,
+                    image_reference=tgt_ref,
+                    digest=digest,
+                    octets_count=blob.size,
+                    upload=upload_blob,
+                )
+            else:
+                upload_blob()
 
-            oci_client.put_blob(
-                image_reference=tgt_ref,
-                digest=digest,
-                octets_count=octets_count,
-                data=src_blob,
-            )
             return om.OciBlobRef(
                 digest=digest,
                 mediaType=blob.mediaType,
@@ -264,6 +264,17 @@ def _scope(image_reference: str | om.OciImageReference, action: str):
     return scope
 
 
+def _scope_actions(scope: str) -> set[str]:
+    '''
+    returns the actions of given scope (which may consist of multiple, space-separated scopes)
+    '''
+    return {
+        action
+        for single_scope in scope.split(' ')
+        for action in single_scope.rsplit(':', 1)[-1].split(',')
+    }
+
+
 def _next_paginated_url(
     url: str,
     headers: dict,
@@ -556,9 +567,10 @@ class Client:
         ):
             return # no re-auth required, yet
 
-        if 'push' in scope:
+        actions = _scope_actions(scope)
+        if 'push' in actions:
             privileges = oa.Privileges.READWRITE
-        elif 'pull' in scope:
+        elif 'pull' in actions:
             privileges = oa.Privileges.READONLY
         else:
             privileges = None
@@ -634,11 +646,12 @@ class Client:
         else:
             logger.warning(f'did not understand {auth_challenge=} - pbly a bug')
 
-        bearer_dict = {'scope': scope}
+        # multiple (space-separated) scopes are requested using one scope-parameter each
+        bearer_dict = {'scope': scope.split(' ')}
         if service:
             bearer_dict['service'] = service
 
-        realm = bearer['realm'] + '?' + urllib.parse.urlencode(bearer_dict)
+        realm = bearer['realm'] + '?' + urllib.parse.urlencode(bearer_dict, doseq=True)
 
         if oci_creds:
             auth = requests.auth.HTTPBasicAuth(
@@ -756,8 +769,7 @@ class Client:
         auth = None
 
         if auth_method is AuthMethod.BASIC:
-            actions = scope.split(':')[-1]
-            if 'push' in actions:
+            if 'push' in _scope_actions(scope):
                 privileges = oa.Privileges.READWRITE
             else:
                 privileges = oa.Privileges.READONLY
@@ -1389,16 +1401,30 @@ class Client:
         digest: str,
         stream=True,
         absent_ok=False,
+        byte_range: tuple[int, int] | None=None,
     ) -> requests.models.Response:
+        '''
+        retrieves the blob with the given digest. If `byte_range` is passed (first and last octet,
+        both inclusive), only the given range is requested. Note that registries are not required
+        to honour range-requests; callers must check for status-code 206 (partial content), and
+        handle 200 (full content) otherwise.
+        '''
         image_reference = om.OciImageReference(image_reference)
 
         scope = _scope(image_reference=image_reference, action='pull')
 
+        if byte_range:
+            first, last = byte_range
+            headers = {'Range': f'bytes={first}-{last}'}
+        else:
+            headers = None
+
         res = self._request(
             url=self.routes.blob_url(image_reference=image_reference, digest=digest),
             image_reference=image_reference,
             scope=scope,
             method='GET',
+            headers=headers,
             stream=stream,
             raise_for_status=False,
         )
@@ -1450,14 +1476,20 @@ class Client:
 
         Returns True if the registry mounted the blob (HTTP 201), False if it
         fell back to a normal upload session (HTTP 202 — caller must still upload
-        the blob via put_blob).
+        the blob via put_blob). Upload sessions opened this way are cancelled.
 
         Using this before put_blob avoids a client-side download+re-upload when
         source and target live on the same registry.
+
+        In addition to push-privileges for the target repository, pull-privileges for the
+        source repository are requested (token-based registries will not mount otherwise).
         '''
         image_reference = om.OciImageReference(image_reference)
         from_reference = om.OciImageReference(from_reference)
-        scope = _scope(image_reference=image_reference, action='push,pull')
+        scope = ' '.join((
+            _scope(image_reference=image_reference, action='push,pull'),
+            _scope(image_reference=from_reference, action='pull'),
+        ))
 
         res = self._request(
             url=self.routes.mount_url(
@@ -1484,6 +1516,20 @@ class Client:
                 f'unexpected response to mount attempt '
                 f'({res.status_code=}); falling back to regular upload'
             )
+        elif (upload_url := res.headers.get('Location')):
+            # registry opened a regular upload session instead -> cancel it (best effort)
+            if upload_url.startswith('/'):
+                parsed_url = urllib.parse.urlparse(res.url)
+                upload_url = f'{parsed_url.scheme}://{parsed_url.netloc}{upload_url}'
+
+            self._request(
+                url=upload_url,
+                image_reference=image_reference,
+                scope=scope,
+                method='DELETE',
+                raise_for_status=False,
+                warn_if_not_ok=False,
+            )
 
         return False
 
@@ -0,0 +1,656 @@
+'''
+random-access reads of single files from (tar-) layers of OCI images.
+
+Reading a single file from an image layer would naively require downloading (and decompressing)
+the whole layer. This module builds (and optionally persists) an index for each layer, which
+consists of:
+
+- a tar-member index (member-name -> offset and size within uncompressed tar-stream)
+- for gzip-compressed layers: a zran-style checkpoint-index, recording the state required to
+  resume decompression at deflate-block-boundaries (compressed offset, pending bits, and the
+  preceding 32KiB of uncompressed data (the "window")), roughly every `span` uncompressed octets
+
+Building the index requires a single pass over the layer-blob. Afterwards, files can be read
+using HTTP-range-requests against the blob-endpoint, transferring (roughly) not more than the
+file's size plus `span` (compressed) octets.
+
+Python's zlib-module does not expose inflate's `Z_BLOCK` flush-mode, nor `inflatePrime`. Hence,
+libz is used via ctypes (libz is always present, as it is a dependency of CPython's zlib-module).
+'''
+
+import base64
+import ctypes
+import ctypes.util
+import dataclasses
+import functools
+import json
+import logging
+import os
+import tarfile
+import tempfile
+import zlib
+
+import dacite
+import requests
+
+import oci.client as oc
+import oci.model as om
+import oci.util
+
+logger = logging.getLogger(__name__)
+
+WINDOW_SIZE = 32768 # size of deflate's sliding window
+DEFAULT_SPAN = 1024 * 1024 # 1 MiB of uncompressed data between checkpoints
+_CHUNK_SIZE = 64 * 1024
+
+_Z_OK = 0
+_Z_STREAM_END = 1
+_Z_BUF_ERROR = -5
+_Z_NO_FLUSH = 0
+_Z_BLOCK = 5
+
+
+class _ZStream(ctypes.Structure):
+    _fields_ = [
+        ('next_in', ctypes.c_void_p),
+        ('avail_in', ctypes.c_uint),
+        ('total_in', ctypes.c_ulong),
+        ('next_out', ctypes.c_void_p),
+        ('avail_out', ctypes.c_uint),
+        ('total_out', ctypes.c_ulong),
+        ('msg', ctypes.c_char_p),
+        ('state', ctypes.c_void_p),
+        ('zalloc', ctypes.c_void_p),
+        ('zfree', ctypes.c_void_p),
+        ('opaque', ctypes.c_void_p),
+        ('data_type', ctypes.c_int),
+        ('adler', ctypes.c_ulong),
+        ('reserved', ctypes.c_ulong),
+    ]
+
+
+@functools.cache
+def _libz() -> ctypes.CDLL:
+    if not (libname := ctypes.util.find_library('z')):
+        raise RuntimeError('did not find libz')
+
+    libz = ctypes.CDLL(libname)
+    libz.zlibVersion.restype = ctypes.c_char_p
+    libz.inflateInit2_.argtypes = (
+        ctypes.POINTER(_ZStream), ctypes.c_int, ctypes.c_char_p, ctypes.c_int,
+    )
+    libz.inflate.argtypes = (ctypes.POINTER(_ZStream), ctypes.c_int)
+    libz.inflateEnd.argtypes = (ctypes.POINTER(_ZStream),)
+    libz.inflateReset.argtypes = (ctypes.POINTER(_ZStream),)
+    libz.inflatePrime.argtypes = (ctypes.POINTER(_ZStream), ctypes.c_int, ctypes.c_int)
+    libz.inflateSetDictionary.argtypes = (
+        ctypes.POINTER(_ZStream), ctypes.c_char_p, ctypes.c_uint,
+    )
+
+    return libz
+
+
+class _Inflater:
+    '''
+    thin wrapper around libz's inflate, exposing what is needed to build and use a zran-style
+    checkpoint-index. Use as context-manager (to release zlib's state).
+    '''
+    def __init__(self, window_bits: int):
+        self._libz = _libz()
+        self._strm = _ZStream()
+        self._in_buf = None
+        self._out_buf = ctypes.create_string_buffer(_CHUNK_SIZE)
+
+        ret = self._libz.inflateInit2_(
+            ctypes.byref(self._strm),
+            window_bits,
+            self._libz.zlibVersion(),
+            ctypes.sizeof(_ZStream),
+        )
+        if ret != _Z_OK:
+            raise RuntimeError(f'inflateInit2 failed: {ret=}')
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args, **kwargs):
+        self._libz.inflateEnd(ctypes.byref(self._strm))
+
+    def reset(self):
+        self._libz.inflateReset(ctypes.byref(self._strm))
+
+    def prime(self, bits: int, value: int):
+        self._libz.inflatePrime(ctypes.byref(self._strm), bits, value)
+
+    def set_dictionary(self, window: bytes):
+        self._libz.inflateSetDictionary(ctypes.byref(self._strm), window, len(window))
+
+    @property
+    def data_type(self) -> int:
+        return self._strm.data_type
+
+    def feed(self, data: bytes):
+        self._in_buf = ctypes.create_string_buffer(data, len(data))
+        self._strm.next_in = ctypes.addressof(self._in_buf)
+        self._strm.avail_in = len(data)
+
+    @property
+    def avail_in(self) -> int:
+        return self._strm.avail_in
+
+    def inflate(self, flush: int) -> tuple[bytes, int, int]:
+        '''
+        inflates (previously fed) input, returning produced output, count of consumed input-octets,
+        and inflate's return-code.
+        '''
+        avail_in = self._strm.avail_in
+        self._strm.next_out = ctypes.addressof(self._out_buf)
+        self._strm.avail_out = _CHUNK_SIZE
+
+        ret = self._libz.inflate(ctypes.byref(self._strm), flush)
+        if ret not in (_Z_OK, _Z_STREAM_END, _Z_BUF_ERROR):
+            raise zlib.error(f'inflate failed: {ret=} ({self._strm.msg=})')
+
+        produced = _CHUNK_SIZE - self._strm.avail_out
+        return self._out_buf.raw[:produced], avail_in - self._strm.avail_in, ret
+
+
+@dataclasses.dataclass(kw_only=True)
+class Checkpoint:
+    compressed_offset: int # offset of first complete octet of deflate-block in compressed data
+    uncompressed_offset: int
+    bits: int # count of bits of deflate-block in octet preceding `compressed_offset`
+    window: str # preceding (up to 32KiB) uncompressed octets (zlib-compressed, and base64-encoded)
+
+    def window_octets(self) -> bytes:
+        return zlib.decompress(base64.b64decode(self.window))
+
+
+@dataclasses.dataclass(kw_only=True)
+class Member:
+    name: str
+    offset: int # offset of member's data within (uncompressed) tar-stream
+    size: int
+    type: str # tarfile's member-type (e.g. tarfile.REGTYPE)
+    linkname: str = ''
+
+    def isfile(self) -> bool:
+        return self.type.encode('utf-8') in (tarfile.REGTYPE, tarfile.AREGTYPE)
+
+    def isdir(self) -> bool:
+        return self.type.encode('utf-8') == tarfile.DIRTYPE
+
+    def issym(self) -> bool:
+        return self.type.encode('utf-8') == tarfile.SYMTYPE
+
+    def islnk(self) -> bool:
+        return self.type.encode('utf-8') == tarfile.LNKTYPE
+
+
+@dataclasses.dataclass(kw_only=True)
+class LayerIndex:
+    digest: str
+    compressed: bool
+    members: list[Member]
+    checkpoints: list[Checkpoint] = dataclasses.field(default_factory=list)
+
+    @functools.cached_property
+    def members_by_name(self) -> dict[str, Member]:
+        # later members (with same name) take precedence, as with tar-extraction
+        return {
+            member.name: member
+            for member in self.members
+        }
+
+    def member(self, name: str) -> Member | None:
+        return self.members_by_name.get(_normalise_name(name))
+
+    def checkpoint(self, uncompressed_offset: int) -> Checkpoint:
+        '''
+        returns greatest checkpoint whose uncompressed offset does not exceed the given one
+        '''
+        candidate = self.checkpoints[0]
+        for checkpoint in self.checkpoints:
+            if checkpoint.uncompressed_offset > uncompressed_offset:
+                break
+            candidate = checkpoint
+        return candidate
+
+    @staticmethod
+    def from_dict(raw: dict):
+        return dacite.from_dict(
+            data_class=LayerIndex,
+            data=raw,
+        )
+
+
+def _normalise_name(name: str) -> str:
+    name = name.removeprefix('./').lstrip('/')
+    return name.removesuffix('/')
+
+
+def _iter_inflated_recording_checkpoints(
+    chunks,
+    checkpoints: list[Checkpoint],
+    span: int,
+):
+    '''
+    yields inflated data from given (gzip-compressed) chunks. While inflating, checkpoints are
+    appended to passed `checkpoints` list (roughly every `span` octets). Concatenated gzip-members
+    are supported.
+    '''
+    compressed_offset = 0
+    uncompressed_offset = 0
+    last_checkpoint = None
+    window = b''
+
+    # windowBits: 15 + 16 -> gzip-format
+    with _Inflater(window_bits=15 + 16) as inflater:
+        for chunk in chunks:
+            inflater.feed(chunk)
+            output_buffer_full = False
+
+            # inflate might hold back output if output-buffer was exhausted -> drain
+            while inflater.avail_in or output_buffer_full:
+                output, consumed, ret = inflater.inflate(flush=_Z_BLOCK)
+                output_buffer_full = len(output) == _CHUNK_SIZE
+
+                compressed_offset += consumed
+                uncompressed_offset += len(output)
+
+                if output:
+                    window = (window + output)[-WINDOW_SIZE:]
+                    yield output
+
+                if ret == _Z_STREAM_END:
+                    # there might be another gzip-member; this requires a new checkpoint, as
+                    # previous window must not be used
+                    inflater.reset()
+                    last_checkpoint = None
+                    window = b''
+                    continue
+
+                data_type = inflater.data_type
+                at_block_boundary = data_type & 128 and not data_type & 64
+
+                if not at_block_boundary:
+                    if not consumed and not output:
+                        break # need more input
+                    continue
+
+                if (
+                    last_checkpoint is not None
+                    and uncompressed_offset - last_checkpoint < span
+                ):
+                    continue
+
+                checkpoints.append(Checkpoint(
+                    compressed_offset=compressed_offset,
+                    uncompressed_offset=uncompressed_offset,
+                    bits=data_type & 7,
+                    window=base64.b64encode(zlib.compress(window)).decode('utf-8'),
+                ))
+                last_checkpoint = uncompressed_offset
+
+
+def build_layer_index(
+    digest: str,
+    chunks,
+    span: int=DEFAULT_SPAN,
+) -> LayerIndex:
+    '''
+    builds index for the layer-blob, passed as an iterable of octet-chunks. The layer-blob is
+    expected to be a tar-archive, either uncompressed, or gzip-compressed.
+    '''
+    chunks = iter(chunks)
+    first_chunk = b''
+    for first_chunk in chunks:
+        if first_chunk:
+            break
+
+    def all_chunks():
+        yield first_chunk
+        yield from chunks
+
+    if first_chunk[:4] == b'\x28\xb5\x2f\xfd':
+        raise ValueError(f'{digest=}: zstd-compressed layers are not supported')
+
+    checkpoints = []
+    if (compressed := first_chunk[:2] == b'\x1f\x8b'):
+        uncompressed_chunks = _iter_inflated_recording_checkpoints(
+            chunks=all_chunks(),
+            checkpoints=checkpoints,
+            span=span,
+        )
+    else:
+        uncompressed_chunks = all_chunks()
+
+    members = []
+    with tarfile.open(
+        fileobj=oci.util.FilelikeProxy(generator=uncompressed_chunks),
+        mode='r|',
+    ) as tf:
+        for info in tf:
+            members.append(Member(
+                name=_normalise_name(info.name),
+                offset=info.offset_data,
+                size=info.size,
+                type=info.type.decode('utf-8'),
+                linkname=info.linkname,
+            ))
+
+    # consume remainder (if any)
+    for _ in uncompressed_chunks:
+        pass
+
+    return LayerIndex(
+        digest=digest,
+        compressed=compressed,
+        members=members,
+        checkpoints=checkpoints,
+    )
+
+
+def _index_path(cache_dir: str, digest: str) -> str:
+    return os.path.join(cache_dir, f'{digest.replace(":", "-")}.index.json')
+
+
+def layer_index(
+    oci_client: oc.Client,
+    image_reference: str | om.OciImageReference,
+    digest: str,
+    cache_dir: str | None=None,
+    span: int=DEFAULT_SPAN,
+) -> LayerIndex:
+    '''
+    returns the index for the layer-blob with the given digest. If `cache_dir` is passed, indices
+    are read from (and persisted to) this directory (indices are keyed by layer-digest, and thus
+    immutable). Otherwise, or if absent from cache, the layer-blob is retrieved (once).
+    '''
+    if cache_dir and os.path.isfile(index_path := _index_path(cache_dir, digest)):
+        with open(index_path) as f:
+            return LayerIndex.from_dict(json.load(f))
+
+    logger.info(f'building layer-index for {image_reference=} {digest=}')
+    blob = oci_client.blob(
+        image_reference=image_reference,
+        digest=digest,
+    )
+    index = build_layer_index(
+        digest=digest,
+        chunks=blob.iter_content(chunk_size=_CHUNK_SIZE),
+        span=span,
+    )
+
+    if cache_dir:
+        os.makedirs(cache_dir, exist_ok=True)
+        # write to tempfile, followed by a mv to avoid collisions through concurrent
+        # processes or threads (assuming mv is an atomic operation)
+        with tempfile.NamedTemporaryFile(mode='w', dir=cache_dir, delete=False) as f:
+            json.dump(dataclasses.asdict(index), f)
+        os.replace(f.name, index_path)
+
+    return index
+
+
+class _RangeReader:
+    '''
+    reads (compressed) octets of a blob sequentially, starting at a given offset, using
+    range-requests of increasing size. If the registry does not support range-requests, the blob
+    is retrieved once (skipping leading octets), and subsequently read from this response. Use as
+    context-manager (to release a retained response).
+    '''
+    def __init__(
+        self,
+        oci_client: oc.Client,
+        image_reference: str | om.OciImageReference,
+        digest: str,
+        offset: int,
+    ):
+        self.oci_client = oci_client
+        self.image_reference = image_reference
+        self.digest = digest
+        self.offset = offset
+        self.read_octets = 0
+        self._request_size = 16 * 1024
+        self._response = None # retained if registry does not support range-requests
+        self._chunks = None
+        self._pending = bytearray()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args, **kwargs):
+        self.close()
+
+    def close(self):
+        if self._response is not None:
+            self._response.close()
+            self._response = None
+            self._chunks = None
+
+    def _read_from_response(self, size: int) -> bytes:
+        while len(self._pending) < size:
+            if not (chunk := next(self._chunks, None)):
+                break
+            self._pending += chunk
+
+        data = bytes(self._pending[:size])
+        del self._pending[:size]
+        return data
+
+    def _open_response(self, res: requests.models.Response):
+        logger.warning(f'no support for range-requests for {self.image_reference=}')
+        self._response = res
+        self._chunks = res.iter_content(chunk_size=_CHUNK_SIZE)
+
+        # skip leading octets
+        skip = self.offset
+        while skip:
+            if not (chunk := next(self._chunks, None)):
+                break
+            if skip >= len(chunk):
+                skip -= len(chunk)
+                continue
+            self._pending += chunk[skip:]
+            skip = 0
+
+    def read(self, size: int | None=None) -> bytes:
+        size = size or self._request_size
+
+        if self._chunks is not None:
+            data = self._read_from_response(size)
+        else:
+            self._request_size = min(self._request_size * 2, 4 * 1024 * 1024)
+
+            try:
+                res = self.oci_client.blob(
+                    image_reference=self.image_reference,
+                    digest=self.digest,
+                    stream=True,
+                    byte_range=(self.offset, self.offset + size - 1),
+                )
+            except requests.exceptions.HTTPError as e:
+                if e.response is None or e.response.status_code != 416:
+                    raise
+                res = None # range not satisfiable -> EOF
+
+            if res is None:
+                data = b''
+            elif res.status_code == 206:
+                data = res.content
+            else:
+                self._open_response(res)
+                data = self._read_from_response(size)
+
+        self.offset += len(data)
+        self.read_octets += len(data)
+        return data
+
+
+def read_member(
+    oci_client: oc.Client,
+    image_reference: str | om.OciImageReference,
+    index: LayerIndex,
+    member: Member,
+) -> bytes:
+    '''
+    reads the given (regular file) member from the layer-blob, using range-requests.
+    '''
+    if not member.isfile():
+        raise ValueError(f'{member.name=} is not a regular file')
+
+    if not member.size:
+        return b''
+
+    if not index.compressed:
+        res = oci_client.blob(
+            image_reference=image_reference,
+            digest=index.digest,
+            stream=False,
+            byte_range=(member.offset, member.offset + member.size - 1),
+        )
+        if res.status_code == 206:
+            return res.content
+        return res.content[member.offset:member.offset + member.size]
+
+    checkpoint = index.checkpoint(member.offset)
+
+    if checkpoint.bits:
+        compressed_offset = checkpoint.compressed_offset - 1
+    else:
+        compressed_offset = checkpoint.compressed_offset
+
+    # skip octets between checkpoint and member's data
+    skip = member.offset - checkpoint.uncompressed_offset
+    result = bytearray()
+
+    with (
+        _RangeReader(
+            oci_client=oci_client,
+            image_reference=image_reference,
+            digest=index.digest,
+            offset=compressed_offset,
+        ) as reader,
+        _Inflater(window_bits=-15) as inflater, # raw deflate (no header)
+    ):
+        if checkpoint.bits:
+            octet = reader.read(1)[0]
+            inflater.prime(checkpoint.bits, octet >> (8 - checkpoint.bits))
+        inflater.set_dictionary(checkpoint.window_octets())
+
+        while len(result) < member.size:
+            if not inflater.avail_in:
+                if not (data := reader.read()):
+                    raise EOFError(f'unexpected end of {index.digest=}')
+                inflater.feed(data)
+
+            output, _, ret = inflater.inflate(flush=_Z_NO_FLUSH)
+
+            if skip >= len(output):
+                skip -= len(output)
+            else:
+                result += output[skip:]
+                skip = 0
+
+            if ret == _Z_STREAM_END:
+                break
+
+    if len(result) < member.size:
+        raise EOFError(f'{member.name=} exceeds gzip-member in {index.digest=}')
+
+    logger.debug(f'read {member.name=} ({member.size=}) from {reader.read_octets} octets')
+
+    return bytes(result[:member.size])
+
+
+class ImageFileReader:
+    '''
+    random-access reader for files within an OCI image (honouring layer-order; files from upper
+    layers shadow those from lower layers). Layer-indices are built lazily, and kept in memory
+    (and persisted to `cache_dir`, if passed).
+
+    Layers for which no index can be built (e.g. unsupported compression) are skipped (with a
+    warning) when looking up files, so that files from other layers remain readable.
+    '''
+    def __init__(
+        self,
+        oci_client: oc.Client,
+        image_reference: str | om.OciImageReference,
+        manifest: om.OciImageManifest,
+        cache_dir: str | None=None,
+    ):
+        self.oci_client = oci_client
+        self.image_reference = om.OciImageReference.to_image_ref(image_reference)
+        self.manifest = manifest
+        self.cache_dir = cache_dir
+        self._indices: dict[str, LayerIndex] = {}
+        self._unreadable_layers: set[str] = set()
+
+    def layer_index(self, digest: str) -> LayerIndex:
+        if not (index := self._indices.get(digest)):
+            index = layer_index(
+                oci_client=self.oci_client,
+                image_reference=self.image_reference,
+                digest=digest,
+                cache_dir=self.cache_dir,
+            )
+            self._indices[digest] = index
+
+        return index
+
+    def _layer_index_or_none(self, digest: str) -> LayerIndex | None:
+        if digest in self._unreadable_layers:
+            return None
+
+        try:
+            return self.layer_index(digest)
+        except Exception as e:
+            logger.warning(
+                f'failed to index layer {digest=} of {self.image_reference=} - skipping: {e}'
+            )
+            self._unreadable_layers.add(digest)
+            return None
+
+    def iter_members(self):
+        '''
+        yields pairs of layer-index and member for all layers, starting with lowest layer
+        '''
+        for layer in self.manifest.layers:
+            index = self.layer_index(layer.digest)
+            for member in index.members:
+                yield index, member
+
+    def find(self, path: str) -> tuple[LayerIndex, Member] | tuple[None, None]:
+        '''
+        returns layer-index and member for given path from uppermost layer containing it
+        '''
+        name = _normalise_name(path)
+        dirname, basename = os.path.split(name)
+        whiteout = os.path.join(dirname, f'.wh.{basename}')
+
+        for layer in reversed(self.manifest.layers):
+            if not (index := self._layer_index_or_none(layer.digest)):
+                continue
+            if (member := index.member(name)):
+                return index, member
+            if index.member(whiteout):
+                break
+
+        return None, None
+
+    def read(self, path: str) -> bytes | None:
+        '''
+        returns contents of regular file at given path, or None if absent (or not a regular file)
+        '''
+        index, member = self.find(path)
+
+        if not member or not member.isfile():
+            return None
+
+        return read_member(
+            oci_client=self.oci_client,
+            image_reference=self.image_reference,
+            index=index,
+            member=member,
+        )
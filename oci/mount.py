@@ -0,0 +1,138 @@
+'''
+planning of cross-repository blob-mounts for replications of the same blobs to multiple targets
+
+When replicating (the same) OCI artefacts to multiple target repositories that share a registry
+host (e.g. to multiple OCM repositories), uploading each blob once per target repository is
+wasteful. `BlobMountPlanner` groups blob-replications by target registry host: the first target
+repository a blob is replicated to (or found to be already present in) becomes the blob's
+"upload-target"; the blob is uploaded there, and any other target repository on the same host
+receives the blob via a cross-repository mount from the upload-target.
+
+Replications of the same blob to the same host are serialised, so concurrent replications to
+multiple targets wait for the upload to the upload-target instead of uploading in parallel.
+
+If a mount fails, the blob is uploaded instead. Mounts are no longer attempted against a
+registry host once `max_mount_failures` mounts failed there (unless a mount succeeded before).
+'''
+
+import collections
+import collections.abc
+import logging
+import threading
+
+import oci.client as oc
+import oci.model as om
+
+logger = logging.getLogger(__name__)
+
+
+class BlobMountPlanner:
+    def __init__(self, max_mount_failures: int=3):
+        self.max_mount_failures = max_mount_failures
+
+        self._lock = threading.Lock()
+        self._blob_locks: dict[tuple[str, str], threading.Lock] = {}
+        self._upload_targets: dict[tuple[str, str], str] = {} # (host, digest) -> repository
+        self._mount_failures: collections.Counter[str] = collections.Counter() # host -> count
+        self._hosts_with_mount_support: set[str] = set()
+        self._hosts_without_mount_support: set[str] = set()
+
+        self.uploaded_octets = 0
+        self.mounted_octets = 0 # i.e. saved uploads
+        self.mount_count = 0
+
+    def _blob_lock(self, key: tuple[str, str]) -> threading.Lock:
+        with self._lock:
+            if not (lock := self._blob_locks.get(key)):
+                lock = self._blob_locks[key] = threading.Lock()
+            return lock
+
+    def upload_target(
+        self,
+        image_reference: str | om.OciImageReference,
+        digest: str,
+    ) -> str | None:
+        '''
+        returns the repository on the same registry host as the given image-reference, from which
+        the blob with given digest may be mounted (if any)
+        '''
+        image_reference = om.OciImageReference.to_image_ref(image_reference)
+        return self._upload_targets.get((image_reference.netloc, digest))
+
+    def blob_present(
+        self,
+        image_reference: str | om.OciImageReference,
+        digest: str,
+    ):
+        '''
+        records that the blob with given digest is present in the repository of the given
+        image-reference (thus it may be mounted from there into other repositories)
+        '''
+        image_reference = om.OciImageReference.to_image_ref(image_reference)
+        with self._lock:
+            self._upload_targets.setdefault(
+                (image_reference.netloc, digest),
+                image_reference.ref_without_tag,
+            )
+
+    def mount_or_upload(
+        self,
+        oci_client: oc.Client,
+        image_reference: str | om.OciImageReference,
+        digest: str,
+        octets_count: int,
+        upload: collections.abc.Callable[[], None],
+    ) -> bool:
+        '''
+        makes the blob with given digest available in the repository of the given
+        image-reference, either by mounting it from its upload-target (if there is one on the
+        same registry host), or by calling `upload`. Returns whether the blob was mounted.
+        '''
+        image_reference = om.OciImageReference.to_image_ref(image_reference)
+        host = image_reference.netloc
+        repository = image_reference.ref_without_tag
+
+        with self._blob_lock((host, digest)):
+            if (
+                (upload_target := self._upload_targets.get((host, digest)))
+                and upload_target != repository
+                and host not in self._hosts_without_mount_support
+            ):
+                if oci_client.mount_blob(
+                    image_reference=image_reference,
+                    digest=digest,
+                    from_reference=upload_target,
+                ):
+                    logger.info(f'mounted {digest=} from {upload_target=} into {repository=}')
+                    with self._lock:
+                        self._hosts_with_mount_support.add(host)
+                        self.mounted_octets += octets_count
+                        self.mount_count += 1
+                    return True
+
+                logger.info(
+                    f'failed to mount {digest=} from {upload_target=} into {repository=} - '
+                    'falling back to upload'
+                )
+                with self._lock:
+                    self._mount_failures[host] += 1
+                    if (
+                        host not in self._hosts_with_mount_support
+                        and self._mount_failures[host] >= self.max_mount_failures
+                    ):
+                        logger.info(f'{host=} does not seem to support cross-repository mounts')
+                        self._hosts_without_mount_support.add(host)
+
+            upload()
+
+            with self._lock:
+                self.uploaded_octets += octets_count
+                self._upload_targets.setdefault((host, digest), repository)
+
+        return False
+
+    def summary(self) -> str:
+        return (
+            f'{self.mount_count} blob(s) mounted across target repositories, saving '
+            f'{self.mounted_octets} octets of uploads ({self.uploaded_octets} octets uploaded)'
+        )
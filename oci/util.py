@@ -54,6 +54,22 @@ def urljoin(*parts):
     return '/'.join([first] + middle + [last])
 
 
+class FilelikeProxy:
+    '''
+    a filelike object (read-only) backed by a generator yielding (arbitrarily-sized) chunks. This is
+    "good enough" for usage w/ tarfile.open in stream-mode (`r|`), which does not rely on `size`
+    being honoured.
+    '''
+    def __init__(self, generator: collections.abc.Iterator[bytes]):
+        self.generator = generator
+
+    def read(self, size: int=-1) -> bytes:
+        try:
+            return next(self.generator)
+        except StopIteration:
+            return b''
+
+
 class _TeeFilelikeProxy:
     '''
     Takes a filelike object (which may be a non-seekable stream) and patches its
@@ -710,6 +710,40 @@ def _read_schema_file(schema_file_path: str):
         return yaml.safe_load(f)
 
 
+@functools.cache
+def json_schema_validator(
+    json_schema_file_path: str=default_json_schema_path,
+) -> 'jsonschema.protocols.Validator':
+    '''
+    returns a validator for the json-schema read from the given path. Validators are cached (thus
+    the schema-file is read, and the schema itself is checked only once per process). Validators
+    are stateless, and may thus be shared between threads.
+    '''
+    if not _have_jsonschema:
+        raise RuntimeError('jsonschema package not available - validation cannot be done')
+
+    schema_dict = _read_schema_file(json_schema_file_path)
+    validator_cls = jsonschema.validators.validator_for(schema_dict)
+    validator_cls.check_schema(schema_dict)
+
+    return validator_cls(schema_dict)
+
+
+def validate_json_schema(
+    instance: dict,
+    json_schema_file_path: str=default_json_schema_path,
+):
+    '''
+    validates the given instance against the json-schema read from the given path, using a cached
+    validator (see `json_schema_validator`). Semantics match those of `jsonschema.validate`, i.e.
+    the "best-matching" `jsonschema.ValidationError` is raised.
+    '''
+    validator = json_schema_validator(json_schema_file_path)
+
+    if (error := jsonschema.exceptions.best_match(validator.iter_errors(instance))):
+        raise error
+
+
 def enum_or_string(
     v,
     enum_type: enum.Enum,
@@ -744,12 +778,11 @@ class ComponentDescriptor:
 
         validation_mode = ValidationMode(validation_mode)
         json_schema_file_path = json_schema_file_path or default_json_schema_path
-        schema_dict = _read_schema_file(json_schema_file_path)
 
         try:
-            jsonschema.validate(
+            validate_json_schema(
                 instance=component_descriptor_dict,
-                schema=schema_dict,
+                json_schema_file_path=json_schema_file_path,
             )
         except jsonschema.ValidationError as e:
             if validation_mode is ValidationMode.WARN:
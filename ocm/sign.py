@@ -3,9 +3,11 @@ Functionality for normalising and hashing OCM-Component-Descriptors.
 '''
 
 import collections.abc
+import concurrent.futures
 import copy
 import dataclasses
 import datetime
+import functools
 import hashlib
 import json
 
@@ -16,6 +18,46 @@ class DigestMismatchException(Exception):
     pass
 
 
+class DigestMemo:
+    '''
+    memoises digests of (referenced) component descriptors, keyed by component identity,
+    normalisation algorithm and verification mode. Intended to be shared across one signing- or
+    verification-run, so each distinct component (e.g. in diamond-shaped component graphs) is
+    normalised and hashed only once.
+    '''
+    def __init__(self):
+        self._digests: dict[tuple, str] = {}
+        self.hits = 0
+
+    @staticmethod
+    def _key(
+        component_id: ocm.ComponentIdentity,
+        verify_digests: bool,
+        normalisation: ocm.NormalisationAlgorithm,
+    ) -> tuple:
+        return component_id.name, component_id.version, normalisation, verify_digests
+
+    def get(
+        self,
+        component_id: ocm.ComponentIdentity,
+        verify_digests: bool,
+        normalisation: ocm.NormalisationAlgorithm,
+    ) -> str | None:
+        digest = self._digests.get(self._key(component_id, verify_digests, normalisation))
+        if digest:
+            self.hits += 1
+        return digest
+
+    def put(
+        self,
+        component_id: ocm.ComponentIdentity,
+        verify_digests: bool,
+        normalisation: ocm.NormalisationAlgorithm,
+        digest: str,
+    ):
+        self._digests[self._key(component_id, verify_digests, normalisation)] = digest
+
+
 def normalise_obj(
     obj: dict,
 ) -> list[dict]:
@@ -104,6 +146,7 @@ def normalise_component_reference(
     access_to_digest_lookup: collections.abc.Callable[[ocm.Access], ocm.DigestSpec],
     verify_digests: bool=False,
     normalisation: ocm.NormalisationAlgorithm=ocm.NormalisationAlgorithm.JSON_NORMALISATION,
+    digest_memo: DigestMemo | None=None,
 ) -> list[dict]:
     component_reference_raw = dataclasses.asdict(component_reference)
 
@@ -113,18 +156,25 @@ def normalise_component_reference(
         del component_reference_raw['labels']
 
     if not component_reference.digest or verify_digests:
-        component_descriptor = component_descriptor_lookup(ocm.ComponentIdentity(
+        component_id = ocm.ComponentIdentity(
             name=component_reference.componentName,
             version=component_reference.version,
-        ))
+        )
 
-        digest = component_descriptor_digest(
-            component_descriptor=component_descriptor,
-            component_descriptor_lookup=component_descriptor_lookup,
-            access_to_digest_lookup=access_to_digest_lookup,
+        if not digest_memo or not (digest := digest_memo.get(
+            component_id=component_id,
             verify_digests=verify_digests,
             normalisation=normalisation,
-        )
+        )):
+            digest = component_descriptor_digest(
+                component_descriptor=component_descriptor_lookup(component_id),
+                component_descriptor_lookup=component_descriptor_lookup,
+                access_to_digest_lookup=access_to_digest_lookup,
+                verify_digests=verify_digests,
+                normalisation=normalisation,
+                digest_memo=digest_memo,
+                max_workers=1, # digests were already prefetched (if desired) for whole graph
+            )
 
         component_reference_raw['digest'] = dataclasses.asdict(ocm.DigestSpec(
             hashAlgorithm='SHA-256',
@@ -158,6 +208,7 @@ def normalise_component(
     access_to_digest_lookup: collections.abc.Callable[[ocm.Access], ocm.DigestSpec],
     verify_digests: bool=False,
     normalisation: ocm.NormalisationAlgorithm=ocm.NormalisationAlgorithm.JSON_NORMALISATION,
+    digest_memo: DigestMemo | None=None,
 ) -> list[dict]:
     component_raw = dataclasses.asdict(component)
 
@@ -178,6 +229,7 @@ def normalise_component(
             access_to_digest_lookup=access_to_digest_lookup,
             verify_digests=verify_digests,
             normalisation=normalisation,
+            digest_memo=digest_memo,
         ) for cref in component.componentReferences
     ]
 
@@ -215,12 +267,138 @@ def normalise_component(
     return normalise_obj(component_raw)
 
 
+def _requires_digest_lookup(
+    resource: ocm.Resource,
+    verify_digests: bool,
+) -> bool:
+    '''
+    returns whether `normalise_resource` will call `access_to_digest_lookup` for given resource
+    '''
+    if not resource.access:
+        return False
+
+    if not resource.digest:
+        return True
+
+    return verify_digests and not (
+        resource.digest.hashAlgorithm == ocm.NO_DIGEST
+        and resource.digest.normalisationAlgorithm == ocm.EXCLUDE_FROM_SIGNATURE
+        and resource.digest.value == ocm.NO_DIGEST
+    )
+
+
+def _access_key(access: ocm.Access) -> str:
+    if dataclasses.is_dataclass(access):
+        access_raw = dataclasses.asdict(access)
+    else:
+        access_raw = dict(access) # ocm.AccessDict
+
+    return json.dumps(access_raw, sort_keys=True, default=str)
+
+
+def _iter_accesses_to_resolve(
+    component_descriptor: ocm.ComponentDescriptor,
+    component_descriptor_lookup: collections.abc.Callable[[ocm.ComponentIdentity], ocm.ComponentDescriptor], # noqa: E501
+    verify_digests: bool,
+    normalisation: ocm.NormalisationAlgorithm,
+    digest_memo: DigestMemo | None,
+) -> collections.abc.Generator[ocm.Access, None, None]:
+    '''
+    yields accesses of all resources (of given and recursively referenced component descriptors)
+    for which digests will be looked up during normalisation
+    '''
+    seen_component_ids = set()
+    component_descriptors = [component_descriptor]
+
+    while component_descriptors:
+        component = component_descriptors.pop().component
+
+        if (component_id := component.identity()) in seen_component_ids:
+            continue
+        seen_component_ids.add(component_id)
+
+        for resource in component.resources:
+            if _requires_digest_lookup(resource, verify_digests):
+                yield resource.access
+
+        for cref in component.componentReferences:
+            if cref.digest and not verify_digests:
+                continue
+
+            cref_id = ocm.ComponentIdentity(
+                name=cref.componentName,
+                version=cref.version,
+            )
+            if cref_id in seen_component_ids:
+                continue
+            if digest_memo and digest_memo.get(
+                component_id=cref_id,
+                verify_digests=verify_digests,
+                normalisation=normalisation,
+            ):
+                continue
+
+            component_descriptors.append(component_descriptor_lookup(cref_id))
+
+
+def prefetching_access_to_digest_lookup(
+    component_descriptor: ocm.ComponentDescriptor,
+    component_descriptor_lookup: collections.abc.Callable[[ocm.ComponentIdentity], ocm.ComponentDescriptor], # noqa: E501
+    access_to_digest_lookup: collections.abc.Callable[[ocm.Access], ocm.DigestSpec],
+    verify_digests: bool=False,
+    normalisation: ocm.NormalisationAlgorithm=ocm.NormalisationAlgorithm.JSON_NORMALISATION,
+    digest_memo: DigestMemo | None=None,
+    max_workers: int=8,
+) -> collections.abc.Callable[[ocm.Access], ocm.DigestSpec]:
+    '''
+    collects the accesses of all resources whose digests will be looked up during normalisation of
+    the given component descriptor (including referenced component descriptors), and resolves
+    them concurrently (each distinct access only once).
+
+    Returns an access-to-digest-lookup serving the resolved digests. Exceptions raised during
+    resolution are re-raised upon lookup of the respective access (thus, normalisation fails at
+    the same resource as it would w/o prefetching). Accesses not known in advance are passed to
+    the given `access_to_digest_lookup`.
+    '''
+    accesses = {
+        _access_key(access): access
+        for access in _iter_accesses_to_resolve(
+            component_descriptor=component_descriptor,
+            component_descriptor_lookup=component_descriptor_lookup,
+            verify_digests=verify_digests,
+            normalisation=normalisation,
+            digest_memo=digest_memo,
+        )
+    }
+
+    if len(accesses) < 2:
+        return access_to_digest_lookup
+
+    with concurrent.futures.ThreadPoolExecutor(
+        max_workers=min(max_workers, len(accesses)),
+    ) as tpe:
+        futures = {
+            access_key: tpe.submit(access_to_digest_lookup, access)
+            for access_key, access in accesses.items()
+        }
+
+    def prefetched_access_to_digest_lookup(access: ocm.Access) -> ocm.DigestSpec:
+        if not (future := futures.get(_access_key(access))):
+            return access_to_digest_lookup(access)
+
+        return future.result()
+
+    return prefetched_access_to_digest_lookup
+
+
 def normalise_component_descriptor(
     component_descriptor: ocm.ComponentDescriptor,
     component_descriptor_lookup: collections.abc.Callable[[ocm.ComponentIdentity], ocm.ComponentDescriptor], # noqa: E501
     access_to_digest_lookup: collections.abc.Callable[[ocm.Access], ocm.DigestSpec],
     verify_digests: bool=False,
     normalisation: ocm.NormalisationAlgorithm=ocm.NormalisationAlgorithm.JSON_NORMALISATION,
+    digest_memo: DigestMemo | None=None,
+    max_workers: int=8,
 ) -> list[dict]:
     '''
     Returns a normalised version of the component descriptor by dropping signing-irrelevant
@@ -237,7 +415,30 @@ def normalise_component_descriptor(
         if set, verify already existing digests instead of assuming they are correct
     @param normalisation:
         the algorithm used to create a normalised representation of the component descriptor
+    @param digest_memo:
+        memo for digests of referenced component descriptors; if not passed, a memo is created
+        (and shared for all referenced component descriptors)
+    @param max_workers:
+        if greater than one, resource-digests of the whole component graph are resolved
+        concurrently before normalisation (see `prefetching_access_to_digest_lookup`)
     '''
+    if digest_memo is None:
+        digest_memo = DigestMemo()
+
+    if max_workers > 1:
+        # component descriptors are retrieved both for prefetching, and for normalisation
+        component_descriptor_lookup = functools.cache(component_descriptor_lookup)
+
+        access_to_digest_lookup = prefetching_access_to_digest_lookup(
+            component_descriptor=component_descriptor,
+            component_descriptor_lookup=component_descriptor_lookup,
+            access_to_digest_lookup=access_to_digest_lookup,
+            verify_digests=verify_digests,
+            normalisation=normalisation,
+            digest_memo=digest_memo,
+            max_workers=max_workers,
+        )
+
     component_descriptor_raw = dataclasses.asdict(component_descriptor)
 
     # drop properties not relevant for signing
@@ -250,6 +451,7 @@ def normalise_component_descriptor(
         access_to_digest_lookup=access_to_digest_lookup,
         verify_digests=verify_digests,
         normalisation=normalisation,
+        digest_memo=digest_memo,
     )
 
     return normalise_obj(component_descriptor_raw)
@@ -261,6 +463,8 @@ def component_descriptor_digest(
     access_to_digest_lookup: collections.abc.Callable[[ocm.Access], ocm.DigestSpec],
     verify_digests: bool=False,
     normalisation: ocm.NormalisationAlgorithm=ocm.NormalisationAlgorithm.JSON_NORMALISATION,
+    digest_memo: DigestMemo | None=None,
+    max_workers: int=8,
 ) -> str:
     '''
     Calculates the hexdigest of the recursively normalised component descriptor.
@@ -276,13 +480,32 @@ def component_descriptor_digest(
     @param normalisation:
         the algorithm used to create a normalised representation of the component descriptor as
         input for the digest calculation
+    @param digest_memo:
+        memo for digests of component descriptors; if not passed, a memo is created (and shared
+        for all referenced component descriptors)
+    @param max_workers:
+        if greater than one, resource-digests of the whole component graph are resolved
+        concurrently before normalisation (see `prefetching_access_to_digest_lookup`)
     '''
+    if digest_memo is None:
+        digest_memo = DigestMemo()
+
+    component_id = component_descriptor.component.identity()
+    if (digest := digest_memo.get(
+        component_id=component_id,
+        verify_digests=verify_digests,
+        normalisation=normalisation,
+    )):
+        return digest
+
     normalised_component_descriptor = normalise_component_descriptor(
         component_descriptor=component_descriptor,
         component_descriptor_lookup=component_descriptor_lookup,
         access_to_digest_lookup=access_to_digest_lookup,
         verify_digests=verify_digests,
         normalisation=normalisation,
+        digest_memo=digest_memo,
+        max_workers=max_workers,
     )
 
     serialised_component_descriptor = json.dumps(
@@ -290,4 +513,13 @@ def component_descriptor_digest(
         separators=(',', ':'), # remove spaces after separators (match OCM-cli)
     )
 
-    return hashlib.sha256(serialised_component_descriptor.encode()).hexdigest()
+    digest = hashlib.sha256(serialised_component_descriptor.encode()).hexdigest()
+
+    digest_memo.put(
+        component_id=component_id,
+        verify_digests=verify_digests,
+        normalisation=normalisation,
+        digest=digest,
+    )
+
+    return digest
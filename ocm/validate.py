@@ -1,4 +1,6 @@
+import collections
 import collections.abc
+import concurrent.futures
 import dataclasses
 import enum
 import json
@@ -8,7 +10,6 @@ import typing
 
 import dacite
 import jsonschema
-import yaml
 
 import ocm
 import ocm.iter as oi
@@ -114,11 +115,77 @@ class ValidationError(ValidationResult):
         return f'{node_id_path}: {self.error}'.removeprefix('/')
 
 
+def _image_exists(
+    oci_client: oci.client.Client,
+    image_reference: str | oci.model.OciImageReference,
+) -> bool:
+    return bool(oci_client.head_manifest(
+        image_reference=image_reference,
+        absent_ok=True,
+        accept=oci.model.MimeTypes.prefer_multiarch,
+    ))
+
+
+class _ConcurrentImageExistenceCheck:
+    '''
+    checks for existence of OCI images using a thread-pool. Checks are deduplicated by
+    image-reference, and are started upon `prefetch`; `__call__` blocks until the (possibly
+    already started) check for the given image-reference has finished.
+    '''
+    def __init__(
+        self,
+        oci_client: oci.client.Client,
+        pool: concurrent.futures.Executor,
+    ):
+        self.oci_client = oci_client
+        self.pool = pool
+        self._futures: dict[str, concurrent.futures.Future[bool]] = {}
+
+    def prefetch(self, image_reference: str | oci.model.OciImageReference):
+        if (key := str(image_reference)) in self._futures:
+            return self._futures[key]
+
+        future = self.pool.submit(
+            _image_exists,
+            oci_client=self.oci_client,
+            image_reference=image_reference,
+        )
+        self._futures[key] = future
+
+        return future
+
+    def __call__(self, image_reference: str | oci.model.OciImageReference) -> bool:
+        return self.prefetch(image_reference).result()
+
+
+def _oci_image_reference(node: oi.Node) -> str | oci.model.OciImageReference | None:
+    '''
+    returns the image-reference to check for existence for the given node (if any)
+    '''
+    if not isinstance(node, oi.ResourceNode):
+        return None
+
+    if node.resource.access.type is not ocm.AccessType.OCI_REGISTRY:
+        return None
+
+    image_reference = node.resource.access.imageReference
+    try:
+        return oci.model.OciImageReference.to_image_ref(image_reference)
+    except ValueError:
+        return image_reference
+
+
 def iter_results_for_resource_node(
     node: oi.Node,
     validation_cfg: ValidationCfg,
     oci_client: oci.client.Client=None,
+    image_exists: collections.abc.Callable[[str | oci.model.OciImageReference], bool]=None,
 ) -> collections.abc.Iterable[ValidationResult]:
+    '''
+    @param image_exists:
+        optional callable used to check for existence of OCI images; defaults to issuing a
+        HEAD-request using the given `oci_client`
+    '''
     if validation_cfg.access is ValidationMode.SKIP:
         return
 
@@ -155,11 +222,15 @@ def iter_results_for_resource_node(
             type=ValidationType.ACCESS,
         )
 
-    if not oci_client.head_manifest(
-        image_reference=image_reference,
-        absent_ok=True,
-        accept=oci.model.MimeTypes.prefer_multiarch,
-    ):
+    if image_exists:
+        exists = image_exists(image_reference)
+    else:
+        exists = _image_exists(
+            oci_client=oci_client,
+            image_reference=image_reference,
+        )
+
+    if not exists:
         yield ValidationError(
             passed=False,
             mode=validation_cfg.access,
@@ -174,9 +245,6 @@ def iter_results_for_component_node(
     validation_cfg: ValidationCfg,
 ) -> collections.abc.Iterable[ValidationResult]:
     if validation_cfg.schema is not ValidationMode.SKIP:
-        with open(ocm_jsonschema_path) as f:
-            ocm_schema = yaml.safe_load(f)
-
         if isinstance(node.component, ocm.Component):
             component_descriptor = ocm.ComponentDescriptor(
                 component=node.component,
@@ -194,9 +262,9 @@ def iter_results_for_component_node(
         component_descriptor = json.loads(component_descriptor)
 
         try:
-            jsonschema.validate(
+            ocm.validate_json_schema(
                 instance=component_descriptor,
-                schema=ocm_schema,
+                json_schema_file_path=ocm_jsonschema_path,
             )
             yield ValidationResult(
                 mode=validation_cfg.schema,
@@ -257,6 +325,7 @@ def iter_results_for_node(
     node: oi.Node,
     validation_cfg: ValidationCfg,
     oci_client: oci.client.Client=None,
+    image_exists: collections.abc.Callable[[str | oci.model.OciImageReference], bool]=None,
 ) -> collections.abc.Iterable[ValidationResult]:
     if isinstance(node, oi.ComponentNode):
         yield from iter_results_for_component_node(
@@ -270,6 +339,7 @@ def iter_results_for_node(
             node=node,
             validation_cfg=validation_cfg,
             oci_client=oci_client,
+            image_exists=image_exists,
         )
     else:
         raise ValueError(node)
@@ -279,24 +349,73 @@ def iter_results(
     nodes: collections.abc.Iterable[oi.Node],
     validation_cfg: ValidationCfg,
     oci_client: oci.client.Client=None,
+    max_workers: int=1,
+    lookahead: int=256,
 ) -> collections.abc.Iterable[ValidationResult]:
-    for node in nodes:
-        yield from iter_results_for_node(
-            node=node,
-            validation_cfg=validation_cfg,
+    '''
+    yields validation-results for the given nodes (in order of passed nodes).
+
+    @param max_workers:
+        if greater than one, access-checks (for OCI-resources) are done concurrently, using a
+        thread-pool of the given size. Checks are deduplicated by image-reference (also across
+        components). Results are still yielded in order of passed nodes.
+    @param lookahead:
+        count of nodes to read ahead of the node currently being validated (to start
+        access-checks early); only relevant if `max_workers` is greater than one
+    '''
+    if (
+        max_workers <= 1
+        or validation_cfg.access is ValidationMode.SKIP
+    ):
+        for node in nodes:
+            yield from iter_results_for_node(
+                node=node,
+                validation_cfg=validation_cfg,
+                oci_client=oci_client,
+            )
+        return
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as pool:
+        image_exists = _ConcurrentImageExistenceCheck(
             oci_client=oci_client,
+            pool=pool,
         )
+        pending_nodes = collections.deque()
+
+        def iter_results_for_next_node():
+            yield from iter_results_for_node(
+                node=pending_nodes.popleft(),
+                validation_cfg=validation_cfg,
+                oci_client=oci_client,
+                image_exists=image_exists,
+            )
+
+        try:
+            for node in nodes:
+                if (image_reference := _oci_image_reference(node)) is not None:
+                    image_exists.prefetch(image_reference)
+                pending_nodes.append(node)
+
+                if len(pending_nodes) > lookahead:
+                    yield from iter_results_for_next_node()
+
+            while pending_nodes:
+                yield from iter_results_for_next_node()
+        finally:
+            pool.shutdown(cancel_futures=True)
 
 
 def iter_violations(
     nodes: collections.abc.Iterable[oi.Node],
     oci_client: oci.client.Client,
     validation_cfg: ValidationCfg,
+    max_workers: int=1,
 ) -> collections.abc.Iterable[ValidationError]:
     for result in iter_results(
         nodes=nodes,
         validation_cfg=validation_cfg,
         oci_client=oci_client,
+        max_workers=max_workers,
     ):
         if isinstance(result, ValidationError):
             yield result
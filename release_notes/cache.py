@@ -0,0 +1,170 @@
+'''
+persistent cache for parsed release-notes source-blocks
+
+Parsing release-notes from commit-messages and pullrequest-bodies is done for all commits within
+the release-range. Consecutive (draft-)release-runs share most of their range, so parsed blocks
+are stored in a local sqlite-file, keyed by source (commit-digest, or pullrequest-url) and the
+source's revision (pullrequests may be edited; commits are immutable).
+
+As the cache outlives releases of this library, cached blocks are only valid for the format
+(parser-behaviour and `SourceBlock`-attributes) they were stored with. The format-version is
+stored in the cache; upon mismatch, cached blocks are discarded.
+'''
+
+import dataclasses
+import json
+import logging
+import sqlite3
+
+import git
+import github3.pulls
+
+import release_notes.model as rnm
+
+logger = logging.getLogger(__name__)
+
+
+'''
+must be incremented upon changes to `release_notes.model.iter_source_blocks` (or to the format of
+cached blocks); changes of `SourceBlock`-attributes are honoured implicitly. Also increment version
+in cache-key of `.github/actions/release-notes/action.yaml`.
+'''
+cache_format_version = 1
+
+_schema = '''
+CREATE TABLE IF NOT EXISTS source_blocks (
+    source_key TEXT PRIMARY KEY,
+    revision TEXT NOT NULL,
+    blocks TEXT NOT NULL
+)
+'''
+
+_meta_schema = '''
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+)
+'''
+
+# SourceBlock-attributes to persist (all but source, which is re-attached upon lookup)
+_block_attrs = tuple(
+    field.name
+    for field in dataclasses.fields(rnm.SourceBlock)
+    if field.name != 'source'
+)
+
+_format_version = f'{cache_format_version}/{",".join(_block_attrs)}'
+
+
+def _source_key_and_revision(source) -> tuple[str, str] | tuple[None, None]:
+    if isinstance(source, git.Commit):
+        return f'commit/{source.hexsha}', source.hexsha
+
+    if isinstance(source, github3.pulls.ShortPullRequest):
+        if not source.updated_at:
+            return None, None
+        return f'pull/{source.html_url}', source.updated_at.isoformat()
+
+    return None, None
+
+
+class SourceBlockCache:
+    '''
+    caches results of `release_notes.model.iter_source_blocks` (only valid blocks) in a sqlite-file
+    at the given path (which is created if absent). Sources w/o a stable revision (e.g.
+    pullrequests w/o `updated_at`) are always parsed.
+
+    Hit- and miss-counts are exposed as `hits` and `misses`.
+    '''
+    def __init__(self, path: str):
+        self.path = path
+        self.hits = 0
+        self.misses = 0
+
+        self._connection = sqlite3.connect(path)
+        with self._connection:
+            self._connection.execute(_meta_schema)
+            row = self._connection.execute(
+                'SELECT value FROM meta WHERE key = ?',
+                ('format_version',),
+            ).fetchone()
+
+            if not row or row[0] != _format_version:
+                if row:
+                    logger.info(
+                        f'source-block-cache: discarding blocks of format-version {row[0]}'
+                    )
+                self._connection.execute('DROP TABLE IF EXISTS source_blocks')
+                self._connection.execute(
+                    'INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)',
+                    ('format_version', _format_version),
+                )
+
+            self._connection.execute(_schema)
+
+    def close(self):
+        self._connection.close()
+        logger.info(f'source-block-cache: {self.hits=} {self.misses=}')
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args, **kwargs):
+        self.close()
+
+    def _lookup(self, source_key: str, revision: str) -> list[dict] | None:
+        row = self._connection.execute(
+            'SELECT blocks FROM source_blocks WHERE source_key = ? AND revision = ?',
+            (source_key, revision),
+        ).fetchone()
+
+        if not row:
+            return None
+
+        return json.loads(row[0])
+
+    def _store(self, source_key: str, revision: str, blocks: list[rnm.SourceBlock]):
+        raw_blocks = [
+            {
+                attr: getattr(block, attr)
+                for attr in _block_attrs
+            } for block in blocks
+        ]
+
+        with self._connection:
+            self._connection.execute(
+                'INSERT OR REPLACE INTO source_blocks (source_key, revision, blocks) '
+                'VALUES (?, ?, ?)',
+                (source_key, revision, json.dumps(raw_blocks)),
+            )
+
+    def source_blocks(
+        self,
+        source: git.Commit | github3.pulls.ShortPullRequest,
+        content: str,
+    ) -> list[rnm.SourceBlock]:
+        '''
+        returns valid source-blocks parsed from `content` (as `iter_source_blocks` would), either
+        from cache, or by parsing (and subsequently caching) them.
+        '''
+        source_key, revision = _source_key_and_revision(source)
+
+        if source_key and (raw_blocks := self._lookup(source_key, revision)) is not None:
+            self.hits += 1
+            return [
+                rnm.SourceBlock(
+                    source=source,
+                    **raw_block,
+                ) for raw_block in raw_blocks
+            ]
+
+        self.misses += 1
+        blocks, _ = rnm.iter_source_blocks(
+            source=source,
+            content=content,
+        )
+
+        if source_key:
+            self._store(source_key, revision, blocks)
+
+        return blocks
@@ -1,15 +1,16 @@
-import datetime
 import enum
 import logging
 import os
 
 import git
+import github3.pulls
 import github3.repos
 
 import cnudie.retrieve
 import gitutil
 import ocm
 import ocm.util
+import release_notes.cache as rnc
 import release_notes.model as rnm
 import release_notes.ocm as rno
 import release_notes.utils as rnu
@@ -153,6 +154,24 @@ def get_release_note_commits_tuple(
     )
 
 
+def _source_blocks(
+    source: git.Commit | github3.pulls.ShortPullRequest,
+    content: str,
+    source_block_cache: rnc.SourceBlockCache | None,
+) -> list[rnm.SourceBlock]:
+    if source_block_cache:
+        return source_block_cache.source_blocks(
+            source=source,
+            content=content,
+        )
+
+    blocks, _ = rnm.iter_source_blocks(
+        source=source,
+        content=content,
+    )
+    return blocks
+
+
 def _determine_blocks_to_include(
     filter_in_commits: tuple[git.Commit, ...],
     filter_out_commits: tuple[git.Commit, ...],
@@ -160,50 +179,24 @@ def _determine_blocks_to_include(
     git_helper: gitutil.GitHelper,
     github_api_lookup: rnu.GithubApiLookup,
     component: ocm.Component,
+    source_block_cache: rnc.SourceBlockCache | None=None,
 ) -> set[rnm.SourceBlock]:
     logger.info(
-        f'Found {(commit_count := len(filter_in_commits))} relevant commits for release notes '
+        f'Found {len(filter_in_commits)} relevant commits for release notes '
         f'({len(filter_out_commits)} filtered out).'
     )
     logger.info('the following commit-digests will be checked:')
     for commit in filter_in_commits:
         logger.info(f'{commit.hexsha}')
 
-    commit_processing_group_size = 200
-    processing_group_min_seconds = 200
-
-    if throttled := (commit_count > commit_processing_group_size):
-        logger.warning(
-            'A large amount of commits needs to be processed for this release. Processing will '
-            'be throttled to avoid hitting rate/quota limits.'
-        )
-        quotient, remainder = divmod(commit_count, commit_processing_group_size)
-        estimated_time = (
-            quotient * processing_group_min_seconds
-            + remainder * (processing_group_min_seconds/commit_processing_group_size)
-        )
-        logger.warning(
-            f'Estimated processing time: {datetime.timedelta(seconds=estimated_time)!s}.'
-        )
-        if estimated_time > 7200: # 2h, the current timeout for draft-/release steps
-            raise RuntimeError(
-                'Aborting release-note creation as it will not complete before reaching the '
-                'timeout of two hours. Please check whether the number of commits to be scanned '
-                'for this release is intentional.'
-            )
-
     # find associated pull requests for commits
     commit_pulls = rnu.request_pull_requests_from_api(
         git_helper=git_helper,
         github_api_lookup=github_api_lookup,
         github_access=github_access,
         commits=[*filter_in_commits, *filter_out_commits],
-        group_size=commit_processing_group_size,
-        min_seconds_per_group=processing_group_min_seconds,
         component=component,
     )
-    if throttled:
-        logger.info('Finished throttled processing.')
     if commit_pulls:
         logger.info(f'Found {len(commit_pulls)} commits with associated pull requests.')
         for sha, pr_list in commit_pulls.items():
@@ -213,17 +206,19 @@ def _determine_blocks_to_include(
 
     source_blocks_to_be_included: set[rnm.SourceBlock] = set()
     for filter_in_commit in filter_in_commits:
-        blocks, _ = rnm.iter_source_blocks(
+        blocks = _source_blocks(
             source=filter_in_commit,
             content=filter_in_commit.message,
+            source_block_cache=source_block_cache,
         )
         source_blocks_to_be_included.update(blocks)
         for pr in commit_pulls[filter_in_commit.hexsha]:
             if pr.body is None:
                 continue
-            blocks, _ = rnm.iter_source_blocks(
+            blocks = _source_blocks(
                 source=pr,
                 content=pr.body,
+                source_block_cache=source_block_cache,
             )
             source_blocks_to_be_included.update(blocks)
 
@@ -232,17 +227,19 @@ def _determine_blocks_to_include(
     # contains release notes which should be filtered out
     blacklisted_source_blocks: set[rnm.SourceBlock] = set()
     for filter_out_commit in filter_out_commits:
-        blocks, _ = rnm.iter_source_blocks(
+        blocks = _source_blocks(
             source=filter_out_commit,
             content=filter_out_commit.message,
+            source_block_cache=source_block_cache,
         )
         blacklisted_source_blocks.update(blocks)
         for pr in commit_pulls[filter_out_commit.hexsha]:
             if pr.body is None:
                 continue
-            blocks, _ = rnm.iter_source_blocks(
+            blocks = _source_blocks(
                 source=pr,
                 content=pr.body,
+                source_block_cache=source_block_cache,
             )
             blacklisted_source_blocks.update(blocks)
 
@@ -268,6 +265,7 @@ def fetch_release_notes(
     version_whence: str | None=None,
     version_whither_ref_commit: git.Commit | None=None,
     is_draft: bool=False,
+    source_block_cache: rnc.SourceBlockCache | None=None,
 ) -> rnm.ReleaseNotesDoc | None:
     '''
     Fetches and returns a set of release notes for the specified component.
@@ -277,6 +275,8 @@ def fetch_release_notes(
         If not given, the current `HEAD` is used.
     :param version_whence: Optional argument to retrieve release notes starting at a specific \
         version. If not given, the closest version to `version_whither` is used.
+    :param source_block_cache: Optional cache for parsed release-notes blocks. If given, only \
+        commits and pull requests not parsed in previous runs (or changed since) are parsed.
 
     :return: A set of ReleaseNotesDoc objects for the specified component.
     '''
@@ -362,6 +362,7 @@ def fetch_release_notes(
         git_helper=git_helper,
         github_api_lookup=github_api_lookup,
         component=component,
+        source_block_cache=source_block_cache,
     )
 
     release_notes = [
@@ -392,6 +393,7 @@ def collect_release_notes(
     github_api_lookup: rnu.GithubApiLookup,
     version_whither_ref_commit: git.Commit | None=None,
     is_draft: bool=False,
+    source_block_cache: rnc.SourceBlockCache | None=None,
 ) -> tuple[rnm.ReleaseNotesDoc | None, list[rnm.ReleaseNotesDoc]]:
     repo_path = git_helper.repo_path
     local_release_notes_path = os.path.join(repo_path, '.ocm/release-notes')
@@ -419,6 +421,7 @@ def collect_release_notes(
         version_whither=release_version,
         version_whither_ref_commit=version_whither_ref_commit,
         is_draft=is_draft,
+        source_block_cache=source_block_cache,
     ):
         release_notes_docs.append(fetched_release_notes_doc)
 
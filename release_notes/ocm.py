@@ -4,10 +4,13 @@ OCM-Component-Descriptors
 '''
 
 import collections.abc
+import concurrent.futures
 import enum
+import functools
 import logging
 import os
 import tarfile
+import threading
 import zlib
 
 import dacite
@@ -100,101 +103,410 @@ def find_release_notes_resource(
     raise ValueError(f'{component=} has no resource named `{resource_name}`')
 
 
-def release_notes_for_vector(
-    upgrade_vector: ocm.gardener.UpgradeVector,
+def _upgrade_vectors_for_subcomponents(
+    whence_component: ocm.Component,
+    whither_component: ocm.Component,
     component_descriptor_lookup: ocm.ComponentDescriptorLookup,
-    version_lookup: ocm.VersionLookup,
-    oci_client: oci.client.Client,
-    version_filter: collections.abc.Callable[[str], bool]=lambda _: True,
-    seen_component_ids: set[ocm.ComponentIdentity] | None=None,
-) -> collections.abc.Iterable[rnm.ReleaseNotesDoc]:
-    '''
-    Yields release-notes documents (pairs of OCM component-ids together with their release-notes)
-    for all (sub-)components within the provided `upgrade_vector`. If a component-id does not have
-    any release-notes, it may just be omitted.
+) -> list[ocm.gardener.UpgradeVector]:
+    component_diff = cnudie.retrieve.component_diff(
+        left_component=whence_component,
+        right_component=whither_component,
+        component_descriptor_lookup=component_descriptor_lookup,
+        recursion_depth=1, # only calculate diff of direct sub-components
+    )
 
-    If a component contains a "new" release-notes blob, it is retrieved and yielded and stopped
-    afterwards because it already contains the (modified) release-notes of all sub-components as
-    well.
-    If a component still only contains an "old" release-notes blob (or none), it is parsed and
-    yielded (if it exists) but this function will be invoked again for all direct sub-components.
-    '''
-    versions = [
-        version
-        for version in version_lookup(upgrade_vector.component_name)
-        if version_filter(version)
-    ]
+    upgrade_vectors = []
+    for whence, whither in component_diff.cpairs_version_changed:
+        if whither.identity() == whither_component.identity():
+            # we are only interested in the release-notes for sub-components here, not the root
+            continue
 
-    try:
-        versions_in_range = list(version_mod.iter_upgrade_path(
-            whence=upgrade_vector.whence_version,
-            whither=upgrade_vector.whither_version,
-            versions=versions,
-        ))
-    except ValueError as ve:
-        ve.add_note(f'{upgrade_vector=}')
-        logger.warn(f'{ve=} while collecting release-notes for {upgrade_vector=}')
-        raise
+        upgrade_vector = ocm.gardener.UpgradeVector(
+            whence=whence.identity(),
+            whither=whither.identity(),
+        )
+
+        if upgrade_vector.is_downgrade:
+            logger.warn(f'skipping downgrade: {upgrade_vector=}')
+            continue # ignore downgrades
+            # XXX: we could still fetch release-notes in that case, but should display them
+            # differently (so users will know those release-notes refer to removed contents).
+
+        upgrade_vectors.append(upgrade_vector)
+
+    return upgrade_vectors
 
-    if not seen_component_ids:
-        seen_component_ids = set()
 
-    for idx, version in enumerate(versions_in_range):
-        component_id = ocm.ComponentIdentity(
-            name=upgrade_vector.component_name,
-            version=version,
+class _ReleaseNotesNode:
+    '''
+    result of retrieving a single component-version during release-notes collection: the
+    component itself, plus the release-notes documents found for it (if any).
+    '''
+    def __init__(
+        self,
+        component: ocm.Component,
+        release_notes_docs: list[rnm.ReleaseNotesDoc],
+        has_archive: bool,
+    ):
+        self.component = component
+        self.release_notes_docs = release_notes_docs
+        # if True, the release-notes-archive already contains notes of all sub-components
+        self.has_archive = has_archive
+
+
+class _ReleaseNotesCollector:
+    '''
+    collects release-notes for upgrade-vectors, fanning out all (blocking) lookups to a shared
+    thread-pool, while yielding results in the same (deterministic) order as a depth-first
+    sequential traversal would.
+
+    All lookups (versions, component-descriptors, release-notes blobs, component-diffs) are
+    memoised as futures, keyed by their inputs, so each of them is done at most once per run.
+    While the caller consumes results, lookups for upcoming versions and sub-components are
+    prefetched (speculatively, each component-id is expanded at most once). Worker-threads only
+    ever run leaf-lookups, and never wait on other futures; only the consuming thread blocks.
+    Hence, a bounded pool cannot deadlock.
+
+    `seen_component_ids` is only ever read or modified by the consuming thread.
+    '''
+    def __init__(
+        self,
+        component_descriptor_lookup: ocm.ComponentDescriptorLookup,
+        version_lookup: ocm.VersionLookup,
+        oci_client: oci.client.Client,
+        version_filter: collections.abc.Callable[[str], bool],
+        max_workers: int,
+    ):
+        self.component_descriptor_lookup = component_descriptor_lookup
+        self.version_lookup = version_lookup
+        self.oci_client = oci_client
+        self.version_filter = version_filter
+
+        self._executor = concurrent.futures.ThreadPoolExecutor(max_workers=max_workers)
+        self._futures: dict[tuple, concurrent.futures.Future] = {}
+        self._prefetched_component_ids: set[ocm.ComponentIdentity] = set()
+        self._lock = threading.Lock()
+        self._closed = False
+
+    def close(self):
+        with self._lock:
+            self._closed = True
+        self._executor.shutdown(
+            wait=False,
+            cancel_futures=True,
         )
-        if component_id in seen_component_ids:
-            logger.info(f'skipping: {component_id=} (already seen before)')
-            continue
 
-        seen_component_ids.add(component_id)
+    def _submit(
+        self,
+        key: tuple,
+        fn: collections.abc.Callable,
+        *args,
+    ) -> concurrent.futures.Future | None:
+        with self._lock:
+            if (future := self._futures.get(key)):
+                return future
+
+            if self._closed:
+                return None
+
+            future = self._executor.submit(fn, *args)
+            self._futures[key] = future
+
+        return future
+
+    def _result(
+        self,
+        key: tuple,
+        fn: collections.abc.Callable,
+        *args,
+    ):
+        if not (future := self._submit(key, fn, *args)):
+            raise RuntimeError('release-notes collector was already closed')
+
+        return future.result()
+
+    def _versions(self, component_name: str) -> list[str]:
+        return [
+            version
+            for version in self.version_lookup(component_name)
+            if self.version_filter(version)
+        ]
+
+    def _component(self, component_id: ocm.ComponentIdentity) -> ocm.Component:
+        return self.component_descriptor_lookup(component_id).component
 
-        component = component_descriptor_lookup(component_id).component
+    def _node(self, component_id: ocm.ComponentIdentity) -> _ReleaseNotesNode:
+        component = self._component(component_id)
 
         if release_notes_resource := find_release_notes_resource(
             component=component,
         ):
             logger.info(f'found release-notes resource for {component_id=}')
-            yield from iter_parsed_release_notes(
+            return _ReleaseNotesNode(
                 component=component,
-                resource=release_notes_resource,
-                oci_client=oci_client,
+                release_notes_docs=list(iter_parsed_release_notes(
+                    component=component,
+                    resource=release_notes_resource,
+                    oci_client=self.oci_client,
+                )),
+                has_archive=True,
             )
-            continue
 
         if release_notes_resource := find_release_notes_resource(
             component=component,
             resource_name=release_notes_resource_name_old,
         ):
             logger.info(f'found "old" release-notes resource for {component_id=}')
-            yield from iter_parsed_release_notes(
+            release_notes_docs = list(iter_parsed_release_notes(
                 component=component,
                 resource=release_notes_resource,
-                oci_client=oci_client,
-            )
-
-        # get the predecessor version of the upgrade-path to build "whence" component for diff
-        if idx > 0:
-            predecessor_version = versions_in_range[idx - 1]
+                oci_client=self.oci_client,
+            ))
         else:
-            # the initial "whence" version is excluded in the upgrade-path
+            release_notes_docs = []
+
+        return _ReleaseNotesNode(
+            component=component,
+            release_notes_docs=release_notes_docs,
+            has_archive=False,
+        )
+
+    def _diff(
+        self,
+        whence_component_id: ocm.ComponentIdentity,
+        whither_component_id: ocm.ComponentIdentity,
+    ) -> list[ocm.gardener.UpgradeVector]:
+        return _upgrade_vectors_for_subcomponents(
+            whence_component=self._component(whence_component_id),
+            whither_component=self._component(whither_component_id),
+            component_descriptor_lookup=self.component_descriptor_lookup,
+        )
+
+    def versions_future(self, component_name: str) -> concurrent.futures.Future | None:
+        return self._submit(('versions', component_name), self._versions, component_name)
+
+    def node_future(
+        self,
+        component_id: ocm.ComponentIdentity,
+    ) -> concurrent.futures.Future | None:
+        return self._submit(('node', component_id), self._node, component_id)
+
+    def diff_future(
+        self,
+        whence_component_id: ocm.ComponentIdentity,
+        whither_component_id: ocm.ComponentIdentity,
+    ) -> concurrent.futures.Future | None:
+        return self._submit(
+            ('diff', whence_component_id, whither_component_id),
+            self._diff,
+            whence_component_id,
+            whither_component_id,
+        )
+
+    def versions_in_range(
+        self,
+        upgrade_vector: ocm.gardener.UpgradeVector,
+        versions: collections.abc.Iterable[str],
+    ) -> list[str]:
+        return list(version_mod.iter_upgrade_path(
+            whence=upgrade_vector.whence_version,
+            whither=upgrade_vector.whither_version,
+            versions=versions,
+        ))
+
+    def prefetch(
+        self,
+        upgrade_vector: ocm.gardener.UpgradeVector,
+    ):
+        '''
+        schedules (non-blocking) retrieval of all lookups which will be needed to collect
+        release-notes for the given upgrade-vector (including sub-components). Errors are
+        swallowed here; they will be raised to the consumer once it actually requires the
+        respective result.
+        '''
+        def on_versions(future: concurrent.futures.Future):
+            if future.exception():
+                return
+
+            try:
+                versions_in_range = self.versions_in_range(
+                    upgrade_vector=upgrade_vector,
+                    versions=future.result(),
+                )
+            except ValueError:
+                return
+
             predecessor_version = upgrade_vector.whence.version
+            for version in versions_in_range:
+                component_id = ocm.ComponentIdentity(
+                    name=upgrade_vector.component_name,
+                    version=version,
+                )
+                predecessor_id = ocm.ComponentIdentity(
+                    name=upgrade_vector.component_name,
+                    version=predecessor_version,
+                )
+                predecessor_version = version
+
+                with self._lock:
+                    if component_id in self._prefetched_component_ids:
+                        continue
+                    self._prefetched_component_ids.add(component_id)
+
+                if not (node_future := self.node_future(component_id)):
+                    return
+
+                node_future.add_done_callback(functools.partial(
+                    on_node,
+                    predecessor_id=predecessor_id,
+                    component_id=component_id,
+                ))
+
+        def on_node(
+            future: concurrent.futures.Future,
+            predecessor_id: ocm.ComponentIdentity,
+            component_id: ocm.ComponentIdentity,
+        ):
+            if future.exception() or future.result().has_archive:
+                return
+
+            if not (diff_future := self.diff_future(predecessor_id, component_id)):
+                return
+
+            diff_future.add_done_callback(on_diff)
+
+        def on_diff(future: concurrent.futures.Future):
+            if future.exception():
+                return
 
-        whence_component = component_descriptor_lookup(ocm.ComponentIdentity(
-            name=upgrade_vector.component_name,
-            version=predecessor_version,
-        )).component
-
-        yield from release_notes_for_subcomponents(
-            whence_component=whence_component,
-            whither_component=component,
-            component_descriptor_lookup=component_descriptor_lookup,
-            version_lookup=version_lookup,
-            oci_client=oci_client,
-            version_filter=version_filter,
+            for child_upgrade_vector in future.result():
+                self.prefetch(child_upgrade_vector)
+
+        if (versions_future := self.versions_future(upgrade_vector.component_name)):
+            versions_future.add_done_callback(on_versions)
+
+    def iter_release_notes(
+        self,
+        upgrade_vector: ocm.gardener.UpgradeVector,
+        seen_component_ids: set[ocm.ComponentIdentity],
+    ) -> collections.abc.Iterable[rnm.ReleaseNotesDoc]:
+        self.prefetch(upgrade_vector)
+
+        versions = self._result(
+            ('versions', upgrade_vector.component_name),
+            self._versions,
+            upgrade_vector.component_name,
+        )
+
+        try:
+            versions_in_range = self.versions_in_range(
+                upgrade_vector=upgrade_vector,
+                versions=versions,
+            )
+        except ValueError as ve:
+            ve.add_note(f'{upgrade_vector=}')
+            logger.warn(f'{ve=} while collecting release-notes for {upgrade_vector=}')
+            raise
+
+        for idx, version in enumerate(versions_in_range):
+            component_id = ocm.ComponentIdentity(
+                name=upgrade_vector.component_name,
+                version=version,
+            )
+            if component_id in seen_component_ids:
+                logger.info(f'skipping: {component_id=} (already seen before)')
+                continue
+
+            seen_component_ids.add(component_id)
+
+            node: _ReleaseNotesNode = self._result(('node', component_id), self._node, component_id)
+
+            yield from node.release_notes_docs
+
+            if node.has_archive:
+                continue
+
+            # get the predecessor version of the upgrade-path to build "whence" component for diff
+            if idx > 0:
+                predecessor_version = versions_in_range[idx - 1]
+            else:
+                # the initial "whence" version is excluded in the upgrade-path
+                predecessor_version = upgrade_vector.whence.version
+
+            predecessor_id = ocm.ComponentIdentity(
+                name=upgrade_vector.component_name,
+                version=predecessor_version,
+            )
+
+            yield from self.iter_release_notes_for_upgrade_vectors(
+                upgrade_vectors=self._result(
+                    ('diff', predecessor_id, component_id),
+                    self._diff,
+                    predecessor_id,
+                    component_id,
+                ),
+                seen_component_ids=seen_component_ids,
+            )
+
+    def iter_release_notes_for_upgrade_vectors(
+        self,
+        upgrade_vectors: collections.abc.Sequence[ocm.gardener.UpgradeVector],
+        seen_component_ids: set[ocm.ComponentIdentity],
+    ) -> collections.abc.Iterable[rnm.ReleaseNotesDoc]:
+        # start retrieval for all siblings early, as they will be consumed in order
+        for upgrade_vector in upgrade_vectors:
+            self.prefetch(upgrade_vector)
+
+        for upgrade_vector in upgrade_vectors:
+            yield from self.iter_release_notes(
+                upgrade_vector=upgrade_vector,
+                seen_component_ids=seen_component_ids,
+            )
+
+
+def release_notes_for_vector(
+    upgrade_vector: ocm.gardener.UpgradeVector,
+    component_descriptor_lookup: ocm.ComponentDescriptorLookup,
+    version_lookup: ocm.VersionLookup,
+    oci_client: oci.client.Client,
+    version_filter: collections.abc.Callable[[str], bool]=lambda _: True,
+    seen_component_ids: set[ocm.ComponentIdentity] | None=None,
+    max_workers: int=8,
+) -> collections.abc.Iterable[rnm.ReleaseNotesDoc]:
+    '''
+    Yields release-notes documents (pairs of OCM component-ids together with their release-notes)
+    for all (sub-)components within the provided `upgrade_vector`. If a component-id does not have
+    any release-notes, it may just be omitted.
+
+    If a component contains a "new" release-notes blob, it is retrieved and yielded and stopped
+    afterwards because it already contains the (modified) release-notes of all sub-components as
+    well.
+    If a component still only contains an "old" release-notes blob (or none), it is parsed and
+    yielded (if it exists) but this function will be invoked again for all direct sub-components.
+
+    Lookups of versions, component-descriptors, release-notes blobs and sub-component diffs are
+    done concurrently, using up to `max_workers` threads. Yielded documents (and their order) are
+    the same as for a sequential traversal. `component_descriptor_lookup`, `version_lookup` and
+    `oci_client` must thus be safe to be used from multiple threads.
+    '''
+    if not seen_component_ids:
+        seen_component_ids = set()
+
+    collector = _ReleaseNotesCollector(
+        component_descriptor_lookup=component_descriptor_lookup,
+        version_lookup=version_lookup,
+        oci_client=oci_client,
+        version_filter=version_filter,
+        max_workers=max_workers,
+    )
+
+    try:
+        yield from collector.iter_release_notes(
+            upgrade_vector=upgrade_vector,
             seen_component_ids=seen_component_ids,
         )
+    finally:
+        collector.close()
 
 
 def release_notes_for_subcomponents(
@@ -205,38 +517,30 @@ def release_notes_for_subcomponents(
     oci_client: oci.client.Client,
     version_filter: collections.abc.Callable[[str], bool]=lambda _: True,
     seen_component_ids: set[ocm.ComponentIdentity] | None=None,
+    max_workers: int=8,
 ) -> collections.abc.Iterable[rnm.ReleaseNotesDoc]:
-    component_diff = cnudie.retrieve.component_diff(
-        left_component=whence_component,
-        right_component=whither_component,
+    if not seen_component_ids:
+        seen_component_ids = set()
+
+    collector = _ReleaseNotesCollector(
         component_descriptor_lookup=component_descriptor_lookup,
-        recursion_depth=1, # only calculate diff of direct sub-components
+        version_lookup=version_lookup,
+        oci_client=oci_client,
+        version_filter=version_filter,
+        max_workers=max_workers,
     )
 
-    for whence, whither in component_diff.cpairs_version_changed:
-        if whither.identity() == whither_component.identity():
-            # we are only interested in the release-notes for sub-components here, not the root
-            continue
-
-        upgrade_vector = ocm.gardener.UpgradeVector(
-            whence=whence.identity(),
-            whither=whither.identity(),
-        )
-
-        if upgrade_vector.is_downgrade:
-            logger.warn(f'skipping downgrade: {upgrade_vector=}')
-            continue # ignore downgrades
-            # XXX: we could still fetch release-notes in that case, but should display them
-            # differently (so users will know those release-notes refer to removed contents).
-
-        yield from release_notes_for_vector(
-            upgrade_vector=upgrade_vector,
-            component_descriptor_lookup=component_descriptor_lookup,
-            version_lookup=version_lookup,
-            oci_client=oci_client,
-            version_filter=version_filter,
+    try:
+        yield from collector.iter_release_notes_for_upgrade_vectors(
+            upgrade_vectors=_upgrade_vectors_for_subcomponents(
+                whence_component=whence_component,
+                whither_component=whither_component,
+                component_descriptor_lookup=component_descriptor_lookup,
+            ),
             seen_component_ids=seen_component_ids,
         )
+    finally:
+        collector.close()
 
 
 def group_release_notes_docs(
@@ -1,16 +1,14 @@
 import collections
 import collections.abc
 import dataclasses
-import itertools
 import logging
 import time
 
 import git
 import git.exc as gitexc
 import github3
-import github3.exceptions as gh3e
 import github3.pulls as gh3p
-import github3.structs as gh3s
+import github3.users
 import yaml
 import yaml.scanner
 
@@ -27,51 +25,210 @@ RepoUrl = str
 GithubApiLookup = collections.abc.Callable[[RepoUrl], github3.GitHub]
 
 
+# pull-request-attributes retrieved via GraphQL. labels are limited to keep queries (which
+# resolve up to 100 commits w/ up to 100 pull requests each) below GitHub's node-limit (500k)
+_pull_request_fields = (
+    'number title body url state createdAt updatedAt closedAt mergedAt '
+    'author { login url } labels(first: 25) { nodes { name } }'
+)
+
+
+class GraphQLUser(github3.users.ShortUser):
+    '''
+    (subset of) a github-user, as retrieved via GitHub's GraphQL API
+    '''
+    def _update_attributes(self, user):
+        self.login = user['login']
+        self.html_url = user['url']
+        self.url = self._api = user['url']
+        self.id = self._uniq = user['url']
+
+    def _repr(self):
+        return f'<GraphQLUser [{self.login}]>'
+
+
+class GraphQLPullRequest(gh3p.ShortPullRequest):
+    '''
+    (subset of) a pull request, as retrieved via GitHub's GraphQL API
+
+    Available attributes are: number, title, body, html_url, state, created_at, updated_at,
+    closed_at, merged_at, user, and labels (in the format returned by GitHub's REST API).
+    '''
+    def _update_attributes(self, pull):
+        self._api = self.html_url = pull['url']
+        self.number = pull['number']
+        self.title = pull['title']
+        self.body = pull['body']
+        self.state = pull['state'].lower()
+        self.created_at = self._strptime(pull['createdAt'])
+        self.updated_at = self._strptime(pull['updatedAt'])
+        self.closed_at = self._strptime(pull['closedAt'])
+        self.merged_at = self._strptime(pull['mergedAt'])
+        # authors of deleted accounts are returned as `null` (REST API returns "ghost"-user)
+        self.user = GraphQLUser(
+            pull['author'] or {'login': 'ghost', 'url': 'https://github.com/ghost'},
+            self,
+        )
+        self.labels = [
+            {'name': label['name']}
+            for label in pull['labels']['nodes']
+        ]
+
+    def _repr(self):
+        return f'<GraphQLPullRequest [#{self.number}]>'
+
+
+def _graphql_url(gh: github3.GitHub) -> str:
+    base_url = gh.session.base_url.rstrip('/')
+
+    if base_url.endswith('/v3'):
+        # github-enterprise: https://<host>/api/v3 -> https://<host>/api/graphql
+        return base_url.removesuffix('/v3') + '/graphql'
+
+    return base_url + '/graphql'
+
+
 # pylint: disable=protected-access
 # noinspection PyProtectedMember
+def _query_repository(
+    gh: github3.GitHub,
+    owner: str,
+    repo: str,
+    aliases: collections.abc.Iterable[str],
+) -> dict:
+    '''
+    runs a GraphQL query for given aliased fields of the given repository, and returns the
+    (possibly partial) repository-object
+    '''
+    query = (
+        'query($owner: String!, $name: String!) { '
+        f'repository(owner: $owner, name: $name) {{ {" ".join(aliases)} }} '
+        '}'
+    )
+
+    res = gh._json(
+        gh._post(
+            _graphql_url(gh),
+            data={
+                'query': query,
+                'variables': {
+                    'owner': owner,
+                    'name': repo,
+                },
+            },
+        ),
+        200,
+    )
+
+    if errors := res.get('errors'):
+        # e.g. unknown commits are reported as errors, but do not prevent other results
+        logger.debug(f'errors while querying repository {owner}/{repo}: {errors}')
+
+    return (res.get('data') or {}).get('repository') or {}
+
+
 def list_associated_pulls(
     gh: github3.GitHub,
     owner: str,
     repo: str,
-    sha: str
-) -> tuple[gh3p.ShortPullRequest] | str:
-    ''' Returns a tuple with pull requests related to the specified commit.
+    shas: collections.abc.Sequence[str],
+    batch_size: int=100,
+) -> dict[str, list[GraphQLPullRequest]]:
+    ''' Returns a dict mapping commit SHAs to the pull requests related to the respective commit.
+
+    Pull requests are looked up using GitHub's GraphQL API, resolving up to `batch_size` commits
+    (including their pull requests' attributes) with one request (using aliases).
 
     :param gh: Instance of the GitHub v3 API
     :param owner: Owner of the repository (on GitHub)
     :param repo: Name of the repository (on GitHub)
-    :param sha: SHA of the commit
-    :return: a tuple with pull requests related to the specific commit
+    :param shas: SHAs of the commits
+    :return: a dict with (only) those commits that have associated pull requests
     '''
-    try:
-        url = gh._build_url('repos', owner, repo, 'commits', sha, 'pulls')
-        return tuple(gh._iter(-1, url, gh3p.ShortPullRequest))
-    except gh3e.UnprocessableEntity as e:
-        logger.debug(f'cannot find any pull request related to commit {sha}: {e}')
-        return None
+    result = {}
+
+    for offset in range(0, len(shas), batch_size):
+        batch = shas[offset:offset + batch_size]
+
+        repository = _query_repository(
+            gh=gh,
+            owner=owner,
+            repo=repo,
+            aliases=(
+                f'c{idx}: object(oid: "{sha}") {{ ... on Commit {{ '
+                f'associatedPullRequests(first: 100) {{ nodes {{ {_pull_request_fields} }} }} }} }}'
+                for idx, sha in enumerate(batch)
+            ),
+        )
+
+        for idx, sha in enumerate(batch):
+            if not (commit := repository.get(f'c{idx}')):
+                logger.debug(f'cannot find commit {sha}')
+                continue
 
+            if pulls := [
+                GraphQLPullRequest(node, gh)
+                for node in commit['associatedPullRequests']['nodes']
+            ]:
+                result[sha] = pulls
 
-# pylint: disable=protected-access
-# noinspection PyProtectedMember
-def list_pulls(
+    return result
+
+
+def get_pulls(
     gh: github3.GitHub,
     owner: str,
     repo: str,
-    state: str = 'closed'
-) -> gh3s.GitHubIterator[gh3p.ShortPullRequest]:
-    url = f'{gh._build_url("repos", owner, repo, "pulls")}?state={state}'
-    return gh._iter(-1, url, gh3p.ShortPullRequest)
+    numbers: collections.abc.Sequence[int],
+    batch_size: int=100,
+) -> dict[int, GraphQLPullRequest]:
+    ''' Returns a dict mapping the given pull request numbers to the respective pull requests.
+
+    Pull requests are retrieved using GitHub's GraphQL API, up to `batch_size` pull requests with
+    one request (using aliases). Pull requests that cannot be found are omitted.
+    '''
+    result = {}
 
+    for offset in range(0, len(numbers), batch_size):
+        batch = numbers[offset:offset + batch_size]
+
+        repository = _query_repository(
+            gh=gh,
+            owner=owner,
+            repo=repo,
+            aliases=(
+                f'p{idx}: pullRequest(number: {int(number)}) {{ {_pull_request_fields} }}'
+                for idx, number in enumerate(batch)
+            ),
+        )
+
+        for idx, number in enumerate(batch):
+            if pull := repository.get(f'p{idx}'):
+                result[number] = GraphQLPullRequest(pull, gh)
+
+    return result
 
-def _find_git_notes_for_commit(
+
+def _read_git_notes(
     repo: git.Repo,
-    commit: git.Commit
-) -> str | str:
+) -> dict[str, str]:
+    '''
+    returns all notes (of default notes-ref), as a dict mapping commit-digests to note-contents.
+    '''
     try:
-        return repo.git.notes('show', commit.hexsha)
+        notes_listing = repo.git.notes('list')
     except gitexc.GitCommandError as e:
-        logger.debug(f'commit {commit.hexsha} does not have a git note: {e}')
-        return None
+        logger.debug(f'cannot list git notes: {e}')
+        return {}
+
+    notes = {}
+    for line in notes_listing.splitlines():
+        note_digest, commit_digest = line.split()
+        notes[commit_digest] = repo.odb.stream(
+            bytes.fromhex(note_digest),
+        ).read().decode('utf-8').removesuffix('\n')
+
+    return notes
 
 
 def _is_meta_document(doc) -> bool:
@@ -119,132 +276,137 @@ def _upsert_document(
         documents.append(instance)
 
 
-# Taken from the itertools recipes
-# (https://docs.python.org/3/library/itertools.html#itertools-recipes)
-def _grouper(iterable, n, *, incomplete='fill', fillvalue=None):
-    "Collect data into non-overlapping fixed-length chunks or blocks"
-    args = [iter(iterable)] * n
-    if incomplete == 'fill':
-        return itertools.zip_longest(*args, fillvalue=fillvalue)
-    if incomplete == 'strict':
-        return zip(*args, strict=True)
-    if incomplete == 'ignore':
-        return zip(*args)
-    else:
-        raise ValueError('Expected fill, strict, or ignore')
-
-
 def request_pull_requests_from_api(
     git_helper: gitutil.GitHelper,
     github_api_lookup: GithubApiLookup,
     github_access: ocm.GithubAccess,
     commits: list[git.Commit],
     component: ocm.Component,
-    group_size: int = 200,
-    min_seconds_per_group: int = 300,
+    group_size: int = 100,
 ) -> dict[str, list[gh3p.ShortPullRequest]]:
     ''' This function requests pull requests from the GitHub API and returns a
     dictionary mapping commit SHA to a list of pull requests.
 
     We use notes to store the associated pull request numbers to reduce
     requests to GitHub (rate limiting).  The corresponding pull request number
-    is stored in a note.  We can then fetch a list of pull requests for a
-    repository and thus (theoretically) process 100 pull requests with one API
-    call in the best case.
+    is stored in a note.
+
+    If there is no note, associated pull requests (including their attributes)
+    are looked up using GitHub's GraphQL API (in groups of `group_size` commits
+    per request), and the pull-numbers are stored in the commit notes (all notes
+    are written at once).
 
-    If there is no note, request the "normal" API route to retrieve associated
-    pull requests and store the pull-numbers in the commit note.
+    Pull requests referenced from notes (and not yet retrieved) are retrieved
+    using GitHub's GraphQL API (in groups of `group_size` pull requests per request).
     '''
-    # pr_number -> [ list of commit sha ]
-    pending = collections.defaultdict(list)
+    owner = github_access.org_name()
+    repo_name = github_access.repository_name()
+
+    notes = _read_git_notes(git_helper.repo)
+
+    # commit_sha -> [ list of pr numbers ] (from notes)
+    noted_numbers = {}
+    # commit_sha -> ([ yaml documents ], note_content, is_yaml_content)
+    unresolved = {}
+
+    for commit in commits:
+        yaml_documents = []
+        is_yaml_content = True
+        if note_content := notes.get(commit.hexsha):
+            try:
+                yaml_documents = list(yaml.safe_load_all(note_content))
+            except yaml.scanner.ScannerError as e:  # YAML parsing error
+                logger.debug(
+                    f'the notes of commit {commit.hexsha} do not contain valid YAML: {e}'
+                )
+                is_yaml_content = False
+
+        # if there is already a ReleaseNotesMetadata
+        if nums_meta := _find_first_document(
+            documents=yaml_documents,
+            key=_meta_key,
+            ctor=rnm.ReleaseNotesMetadata,
+        ):
+            noted_numbers[commit.hexsha] = nums_meta.prs
+            continue
+
+        unresolved[commit.hexsha] = (yaml_documents, note_content, is_yaml_content)
+
+    # make sure to always use github-user with largest remaining quota
+    github_api = github_api_lookup(github_access.repoUrl)
+
+    # commit_sha -> [ list of pull requests ] (looked up, for commits w/o notes)
+    resolved_pulls = list_associated_pulls(
+        gh=github_api,
+        owner=owner,
+        repo=repo_name,
+        shas=list(unresolved),
+        batch_size=group_size,
+    )
+
+    pulls = {
+        pull.number: pull
+        for resolved in resolved_pulls.values()
+        for pull in resolved
+    }
+    noted_pull_numbers = sorted({
+        number
+        for numbers in noted_numbers.values()
+        for number in numbers
+        if number not in pulls
+    })
+    logger.info(f'retrieving {len(noted_pull_numbers)} pull requests referenced from notes')
+
+    pulls |= get_pulls(
+        gh=github_api,
+        owner=owner,
+        repo=repo_name,
+        numbers=noted_pull_numbers,
+        batch_size=group_size,
+    )
+    for number in noted_pull_numbers:
+        if number not in pulls:
+            logger.warning(f'associated pull request {number} cannot be found')
+
     # commit_sha -> [ list of pull requests ]
     result = collections.defaultdict(list)
 
-    # used to avoid waiting for the last group
-    break_early = False
-
-    for commit_group in _grouper(commits, group_size):
-        start_time = time.time()
-        for commit in commit_group:
-            if commit is None:
-                # groups shorter than group_size are filled with None - we can safely
-                # break if we encounter one.
-                break_early = True
-                break
-
-            yaml_documents = []
-            is_yaml_content = True
-            if note_content := _find_git_notes_for_commit(git_helper.repo, commit):
-                try:
-                    yaml_documents = list(yaml.safe_load_all(note_content))
-                except yaml.scanner.ScannerError as e:  # YAML parsing error
-                    logger.debug(
-                        f'the notes of commit {commit.hexsha} do not contain valid YAML: {e}'
-                    )
-                    is_yaml_content = False
-
-            # if there is already a ReleaseNotesMetadata
-            if nums_meta := _find_first_document(
-                documents=yaml_documents,
-                key=_meta_key,
-                ctor=rnm.ReleaseNotesMetadata,
+    for sha, numbers in noted_numbers.items():
+        for number in numbers:
+            if pull := pulls.get(number):
+                result[sha].append(pull)
+
+    note_bodies = {}
+    for sha, pullrequests in resolved_pulls.items():
+        # add all found pull requests to the result right away
+        for pullrequest in pullrequests:
+            if github.pullrequest.parse_pullrequest_title(
+                title=pullrequest.title,
+                invalid_ok=True,
+                reference_component=component
             ):
-                for num in nums_meta.prs:
-                    pending[num].append(commit.hexsha)
+                # we retrieve release-notes from sub-components using OCM; hence,
+                # we need to ignore upgrade-pullrequests that still have
+                # release-notes-blocks
                 continue
+            result[sha].append(pullrequest)
 
-            owner = github_access.org_name()
-            repo_name = github_access.repository_name()
-            github_api = github_api_lookup(github_access.repoUrl)
-
-            if prs := list_associated_pulls(github_api, owner, repo_name, commit.hexsha):
-                # add all found pull requests to the result right away
-                for pullrequest in prs:
-                    if github.pullrequest.parse_pullrequest_title(
-                        title=pullrequest.title,
-                        invalid_ok=True,
-                        reference_component=component
-                    ):
-                        # we retrieve release-notes from sub-components using OCM; hence,
-                        # we need to ignore upgrade-pullrequests that still have
-                        # release-notes-blocks
-                        continue
-                    result[commit.hexsha].append(pullrequest)
-                # only write notes to commit if there are no notes yet,
-                # or if the notes are in the YAML format already
-                if note_content or not is_yaml_content:
-                    continue
-                data = dataclasses.asdict(
-                    rnm.ReleaseNotesMetadata(round(time.time() * 1000), [z.number for z in prs])
-                )
-                meta = rnm.get_meta_obj(_meta_key, data)
-                _upsert_document(yaml_documents, _meta_key, meta)
-                git_helper.add_note(body=yaml.safe_dump_all(yaml_documents), commit=commit)
-
-        end_time = time.time()
-        time_elapsed = end_time - start_time # in seconds
-        if not break_early and time_elapsed < min_seconds_per_group:
-            wait_period = min_seconds_per_group - time_elapsed
-            logger.info(
-                f'Processed {group_size} commits in {int(time_elapsed)} seconds, will '
-                f'wait {int(wait_period)} seconds before continuing.'
+        yaml_documents, note_content, is_yaml_content = unresolved[sha]
+        # only write notes to commit if there are no notes yet,
+        # or if the notes are in the YAML format already
+        if note_content or not is_yaml_content:
+            continue
+        data = dataclasses.asdict(
+            rnm.ReleaseNotesMetadata(
+                round(time.time() * 1000),
+                [pullrequest.number for pullrequest in pullrequests],
             )
-            time.sleep(wait_period)
-
-        # make sure to always use github-user with largest remaining quota
-        github_api = github_api_lookup(github_access.repoUrl)
-
-    if pending:
-        for pull in list_pulls(github_api, owner, repo_name):
-            if pull.number in pending:
-                for sha in pending[pull.number]:
-                    result[sha].append(pull)
-                del pending[pull.number]
-            if len(pending) == 0:
-                break
-        else:
-            logger.warning('one or more associated pull requests for the commits ' +
-                           f'{pending.keys()} is/are either not closed or cannot be found')
+        )
+        meta = rnm.get_meta_obj(_meta_key, data)
+        _upsert_document(yaml_documents, _meta_key, meta)
+        note_bodies[sha] = yaml.safe_dump_all(yaml_documents)
+
+    git_helper.add_notes(bodies=note_bodies)
 
     return result
 
@@ -17,17 +17,16 @@ Scan admission mirrors a resource-aware approach:
 Minimum headroom: 2 GiB disk, 1 GiB memory.  At least one scan is always admitted.
 '''
 import concurrent.futures
-import gzip
 import hashlib
-import io
 import json
 import logging
 import os
 import subprocess
-import tarfile
 import tempfile
+import threading
 
 import oci.client as oc
+import oci.layerindex
 import oci.model as om
 import ocm
 import sbom.cbom as scbom
@@ -171,10 +170,65 @@ def _estimate_bytes(compressed_layer_bytes: int) -> tuple[int, int]:
     )
 
 
+class ScanAdmission:
+    '''
+    Resource-aware admission control for concurrent scans.
+
+    A scan is admitted if the minimum headroom (disk and memory) remains after subtracting its
+    estimated consumption, as well as the estimates reserved for scans already admitted. At least
+    one scan is always admitted. Thread-safe.
+    '''
+    def __init__(self, tmpdir: str):
+        self.tmpdir = tmpdir
+        self.reserved_disk = 0
+        self.reserved_mem = 0
+        self.running = 0
+        self._condition = threading.Condition()
+
+    def _can_admit(self, est_disk: int, est_mem: int) -> bool:
+        if not self.running:
+            return True
+        avail_disk = _available_disk_bytes(self.tmpdir) - self.reserved_disk
+        avail_mem = _available_mem_bytes() - self.reserved_mem
+        return (
+            avail_disk - est_disk >= _DISK_HEADROOM
+            and avail_mem - est_mem >= _MEM_HEADROOM
+        )
+
+    def try_admit(self, est_disk: int, est_mem: int) -> bool:
+        '''
+        admits (and reserves) a scan w/ the given estimates, if possible. Admitted scans must be
+        released using `release`.
+        '''
+        with self._condition:
+            if not self._can_admit(est_disk, est_mem):
+                return False
+            self.reserved_disk += est_disk
+            self.reserved_mem += est_mem
+            self.running += 1
+            return True
+
+    def admit(self, est_disk: int, est_mem: int, recheck_seconds: float = 5):
+        '''
+        blocks until a scan w/ the given estimates can be admitted (re-checking available
+        resources upon release of other scans, and every `recheck_seconds`).
+        '''
+        with self._condition:
+            while not self.try_admit(est_disk, est_mem):
+                self._condition.wait(timeout=recheck_seconds)
+
+    def release(self, est_disk: int, est_mem: int):
+        with self._condition:
+            self.reserved_disk -= est_disk
+            self.reserved_mem -= est_mem
+            self.running -= 1
+            self._condition.notify_all()
+
+
 def _compressed_layer_bytes(image_ref: str | om.OciImageReference, oci_client: oc.Client) -> int:
     '''
     Fetch the manifest (resolving multi-arch to linux/amd64) and return the sum of
-    compressed layer sizes.  Returns 0 on error (scan will still be admitted with force=True).
+    compressed layer sizes.  Returns 0 on error (scan will still be admitted).
     '''
     try:
         manifest = oci_client.manifest(
@@ -280,9 +334,10 @@ def _oci_file_reader(image_ref, oci_client):
     '''
     Return (read_file, cleanup) using OCI layer extraction.
 
-    Fetches image layers on demand and searches them for the requested path.
-    Layers are scanned top-to-bottom (most recent overlay first); results are
-    cached per layer so each blob is downloaded at most once.
+    Indexes image layers on demand and searches them for the requested path.
+    Layers are scanned top-to-bottom (most recent overlay first). Files are read
+    using range-requests (see oci.layerindex), so each blob is downloaded at most
+    once (for building its index).
 
     read_file(path: str) -> bytes | None
     cleanup() -> None  — no-op
@@ -303,52 +358,23 @@ def _oci_file_reader(image_ref, oci_client):
             if entry is None:
                 return None, lambda: None
             manifest = oci_client.manifest(f'{repo_ref}@{entry.digest}')
-        layers = list(reversed(manifest.layers))
     except Exception:
         logger.debug('CBOM enrichment: failed to fetch manifest for OCI file reader')
         return None, lambda: None
 
-    layer_cache = {}  # digest -> bytes | None  (decompressed tar content)
+    image_file_reader = oci.layerindex.ImageFileReader(
+        oci_client=oci_client,
+        image_reference=repo_ref,
+        manifest=manifest,
+        cache_dir=os.path.join(tempfile.gettempdir(), 'sbom-oci-layer-indices'),
+    )
 
-    def _load_layer(layer):
-        digest = layer.digest
-        if digest in layer_cache:
-            return layer_cache[digest]
+    def read_file(path):
         try:
-            resp = oci_client.blob(
-                image_reference=repo_ref,
-                digest=digest,
-                stream=False,
-            )
-            if resp is None:
-                layer_cache[digest] = None
-                return None
-            raw = resp.content
-            # detect gzip by magic bytes; also covers Docker manifest media types
-            if raw[:2] == b'\x1f\x8b':
-                data = gzip.decompress(raw)
-            else:
-                data = raw
-            layer_cache[digest] = data
+            return image_file_reader.read(path)
         except Exception:
-            layer_cache[digest] = None
-        return layer_cache[digest]
-
-    def read_file(path):
-        norm = path.lstrip('/')
-        for layer in layers:
-            data = _load_layer(layer)
-            if data is None:
-                continue
-            try:
-                with tarfile.open(fileobj=io.BytesIO(data)) as tf:
-                    for member in tf.getmembers():
-                        if member.name.lstrip('./') == norm and member.isfile():
-                            fobj = tf.extractfile(member)
-                            return fobj.read() if fobj else None
-            except Exception:  # nosec B112
-                continue
-        return None
+            logger.debug(f'CBOM enrichment: failed to read {path=} from {image_ref=}')
+            return None
 
     return read_file, lambda: None
 
@@ -526,8 +552,7 @@ def run_injections_resource_aware(
     where status is 'scanned' or 'failed'.  Failed entries have None for bytes/digests.
     '''
     results = []
-    reserved_disk = 0
-    reserved_mem = 0
+    admission = ScanAdmission(tmpdir=tmpdir)
 
     # pre-fetch layer sizes in parallel
     def _fetch_size(item):
@@ -537,16 +562,6 @@ def run_injections_resource_aware(
     with concurrent.futures.ThreadPoolExecutor() as executor:
         pending = list(executor.map(_fetch_size, items))
 
-    def _can_admit(est_disk: int, est_mem: int, force: bool) -> bool:
-        if force:
-            return True
-        avail_disk = _available_disk_bytes(tmpdir) - reserved_disk
-        avail_mem = _available_mem_bytes() - reserved_mem
-        return (
-            avail_disk - est_disk >= _DISK_HEADROOM
-            and avail_mem - est_mem >= _MEM_HEADROOM
-        )
-
     def _do_scan(name, ref, est_disk, est_mem):
         try:
             spdx, cdx, cbom, ver, cbom_ver, spdx_dig, cdx_dig, cbom_dig = scan_image(
@@ -567,12 +582,9 @@ def run_injections_resource_aware(
             while pending:
                 name, ref, clb = pending[0]
                 est_disk, est_mem = _estimate_bytes(clb)
-                force = not running
-                if not _can_admit(est_disk, est_mem, force):
+                if not admission.try_admit(est_disk, est_mem):
                     break
                 pending.pop(0)
-                reserved_disk += est_disk
-                reserved_mem += est_mem
                 f = executor.submit(_do_scan, name, ref, est_disk, est_mem)
                 running[f] = (est_disk, est_mem)
                 logger.info(
@@ -591,8 +603,7 @@ def run_injections_resource_aware(
             )
             for f in done:
                 est_disk, est_mem = running.pop(f)
-                reserved_disk -= est_disk
-                reserved_mem -= est_mem
+                admission.release(est_disk, est_mem)
                 results.append(f.result())
 
     return results
@@ -735,6 +746,21 @@ def _push_cbom_standalone(
     return manifest_digest
 
 
+def estimate_s3_scan_bytes(
+    access: 'ocm.S3Access | ocm.LegacyS3Access',
+) -> tuple[int, int]:
+    '''
+    Return (estimated_disk_bytes, estimated_mem_bytes) for scanning the given S3-backed
+    resource (see `scan_s3_resource`), based on the object's size (0 if it cannot be determined).
+    '''
+    if isinstance(access, ocm.LegacyS3Access):
+        bucket, key, region = access.bucketName, access.objectKey, access.region
+    else:
+        bucket, key, region = access.bucket, access.key, access.region
+
+    return _estimate_bytes(ss3.s3_object_size(bucket=bucket, key=key, region=region) or 0)
+
+
 def scan_s3_resource(
     access: 'ocm.S3Access | ocm.LegacyS3Access',
     oci_client: oc.Client,
@@ -39,6 +39,24 @@ def iter_s3_object(
             yield chunk
 
 
+def s3_object_size(
+    bucket: str,
+    key: str,
+    region: str | None = None,
+) -> int | None:
+    '''
+    Return the size (in bytes) of a public S3 object (using a HEAD-request), or None if it
+    cannot be determined.
+    '''
+    url = s3_url(bucket, key, region)
+    request = urllib.request.Request(url, method='HEAD')
+    try:
+        with urllib.request.urlopen(request) as resp:  # nosec B310
+            return int(resp.headers['Content-Length'])
+    except (urllib.error.URLError, KeyError, TypeError, ValueError):
+        return None
+
+
 def mangle_s3_path(s: str) -> str:
     '''
     Mangle an S3 bucket name or object key into a string safe for use in an OCI repository path.
@@ -2,6 +2,8 @@
 A client for Signing-Server
 '''
 
+import collections.abc
+import concurrent.futures
 import dataclasses
 import enum
 import hashlib
@@ -117,6 +119,12 @@ class SigningserverClient:
         cfg: SigningserverClientCfg,
     ):
         self.cfg = cfg
+        # re-use (keep-alive) connections, thus avoiding a (mutual) tls-handshake for each
+        # signing-request; note: connection-pool-size (10) limits useful concurrency
+        self._session = requests.Session()
+
+    def close(self):
+        self._session.close()
 
     def sign(
         self,
@@ -153,47 +161,62 @@ class SigningserverClient:
             kwargs['verify'] = False
             urllib3.disable_warnings()
 
-        try:
-            resp = requests.post(
-                url=url,
-                headers={
-                    'Accept': 'application/x-pem-file',
-                },
-                data=digest,
-                timeout=(self.cfg.connect_timeout, 31),
-                cert=(self.cfg.client_certificate, self.cfg.client_certificate_key,),
-                **kwargs,
-            )
-            resp.raise_for_status()
-        except requests.exceptions.HTTPError as e:
-            if remaining_retries == 0:
-                raise SigningserverException(e)
+        while True:
+            try:
+                resp = self._session.post(
+                    url=url,
+                    headers={
+                        'Accept': 'application/x-pem-file',
+                    },
+                    data=digest,
+                    timeout=(self.cfg.connect_timeout, 31),
+                    cert=(self.cfg.client_certificate, self.cfg.client_certificate_key,),
+                    **kwargs,
+                )
+                resp.raise_for_status()
+                break
+            except requests.exceptions.HTTPError as e:
+                if remaining_retries == 0:
+                    raise SigningserverException(e)
+
+                logger.warning(f'caught http error, going to retry... ({remaining_retries=}); {e}')
+            except Exception as e:
+                if remaining_retries == 0:
+                    raise SigningserverException(e)
+
+                logger.warning(
+                    f'caught connection error, going to retry... ({remaining_retries=}); {e}'
+                )
 
-            logger.warning(f'caught http error, going to retry... ({remaining_retries=}); {e}')
             time.sleep(2 ** (3 - remaining_retries))
-            return self.sign(
-                digest=digest,
-                hash_algorithm=hash_algorithm,
-                signing_algorithm=signing_algorithm,
-                remaining_retries=remaining_retries - 1,
-            )
-        except Exception as e:
-            if remaining_retries == 0:
-                raise SigningserverException(e)
+            remaining_retries -= 1
 
-            logger.warning(f'caught connection error, going to retry... ({remaining_retries=}); {e}')
-            time.sleep(2 ** (3 - remaining_retries))
+        return SigningResponse(
+            raw=resp.text,
+            signing_algorithm=signing_algorithm,
+        )
+
+    def sign_many(
+        self,
+        digests: collections.abc.Iterable[str | bytes],
+        hash_algorithm='sha256',
+        signing_algorithm: SigningAlgorithm | str = SigningAlgorithm.RSASSA_PSS,
+        max_workers: int=8,
+    ) -> list[SigningResponse]:
+        '''
+        signs the given digests concurrently (using at most `max_workers` concurrent requests);
+        returns signing-responses in the order of the given digests. If signing of any digest
+        fails (after retries), the (first) error is raised.
+        '''
+        def sign(digest: str | bytes) -> SigningResponse:
             return self.sign(
                 digest=digest,
                 hash_algorithm=hash_algorithm,
                 signing_algorithm=signing_algorithm,
-                remaining_retries=remaining_retries - 1,
             )
 
-        return SigningResponse(
-            raw=resp.text,
-            signing_algorithm=signing_algorithm,
-        )
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(sign, digests))
 
 
 @dataclasses.dataclass
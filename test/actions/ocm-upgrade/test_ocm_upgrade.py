@@ -292,3 +292,145 @@ def test_component_policy_upstream_override():
 
     assert len(created) == 1
     assert created[0].whither.version == '1.5.0'  # gated to alt-upstream, not latest (2.0.0)
+
+
+def test_prefetched_lookups():
+    looked_up_names = []
+
+    def version_lookup(component_name):
+        looked_up_names.append(component_name)
+        return iter(['1.0.0', '2.0.0-dev', '1.5.0'])
+
+    upstream_cd = ocm.ComponentDescriptor(
+        meta=ocm.Metadata(),
+        component=_make_component('example.com/upstream', '1.5.0', []),
+    )
+
+    def cd_lookup(cid, absent_ok=False):
+        if cid == ocm.ComponentIdentity(name='example.com/upstream', version='1.5.0'):
+            return upstream_cd
+        raise ValueError(f'unexpected lookup: {cid}')
+
+    lookups = ocm_upgrade.PrefetchedLookups(
+        component_descriptor_lookup=cd_lookup,
+        version_lookup=version_lookup,
+    )
+    lookups.prefetch(
+        component_names=['example.com/a', 'example.com/b'],
+        upstream_component_names=['example.com/upstream'],
+    )
+
+    assert sorted(looked_up_names) == ['example.com/a', 'example.com/b', 'example.com/upstream']
+
+    # prefetched results may be consumed repeatedly, w/o further lookups
+    assert lookups.version_lookup('example.com/a') == ['1.0.0', '2.0.0-dev', '1.5.0']
+    assert lookups.version_lookup('example.com/a') == ['1.0.0', '2.0.0-dev', '1.5.0']
+    assert lookups.component_descriptor_lookup(
+        ocm.ComponentIdentity(name='example.com/upstream', version='1.5.0'),
+    ) is upstream_cd
+    assert len(looked_up_names) == 3
+
+    # other lookups are delegated
+    lookups.version_lookup('example.com/c')
+    assert len(looked_up_names) == 4
+
+
+def test_open_upgrade_pullrequests_listed_once_per_creation():
+    component = _make_component(
+        'example.com/my-comp', '1.0.0',
+        [
+            _make_cref('dep1', 'example.com/dep1', '1.0.0'),
+            _make_cref('dep2', 'example.com/dep2', '1.0.0'),
+        ],
+    )
+
+    with unittest.mock.patch(
+        'github.pullrequest.iter_upgrade_pullrequests',
+        return_value=iter([]),
+    ) as iter_upgrade_pullrequests:
+        created = []
+
+        def fake_create_upgrade_pullrequest(upgrade_vector, **_kw):
+            created.append(upgrade_vector)
+            return unittest.mock.MagicMock()
+
+        with (
+            unittest.mock.patch.object(
+                ocm_upgrade, 'create_upgrade_pullrequest', fake_create_upgrade_pullrequest,
+            ),
+            unittest.mock.patch('github.pullrequest.reset_worktree'),
+            unittest.mock.patch('gitutil.GitHelper'),
+        ):
+            list(ocm_upgrade.create_upgrade_pullrequests(
+                component=component,
+                component_descriptor_lookup=None,
+                version_lookup=lambda _: ['1.0.0', '2.0.0'],
+                upgrade_pullrequests=[],
+                repo_dir='/tmp',
+                repo_url='https://github.com/example/repo',
+                repository=unittest.mock.MagicMock(),
+                merge_policy=ocm_upgrade.MergePolicy.MANUAL,
+                merge_method=ocm_upgrade.MergeMethod.MERGE,
+                merge_policy_configs=[],
+                branch='main',
+                oci_client=unittest.mock.MagicMock(),
+                pr_naming_pattern='component-name',
+            ))
+
+    assert len(created) == 2
+    # initial snapshot, plus one refresh per created pullrequest
+    assert iter_upgrade_pullrequests.call_count == 3
+
+
+def test_failed_refresh_does_not_abort_upgrades():
+    component = _make_component(
+        'example.com/my-comp', '1.0.0',
+        [
+            _make_cref('dep1', 'example.com/dep1', '1.0.0'),
+            _make_cref('dep2', 'example.com/dep2', '1.0.0'),
+        ],
+    )
+
+    def iter_upgrade_pullrequests(**kwargs):
+        if iter_upgrade_pullrequests.calls:
+            raise RuntimeError('rate-limit exceeded')
+        iter_upgrade_pullrequests.calls += 1
+        return iter([])
+    iter_upgrade_pullrequests.calls = 0
+
+    created = []
+
+    def fake_create_upgrade_pullrequest(upgrade_vector, **_kw):
+        created.append(upgrade_vector)
+        return unittest.mock.MagicMock()
+
+    with (
+        unittest.mock.patch(
+            'github.pullrequest.iter_upgrade_pullrequests',
+            iter_upgrade_pullrequests,
+        ),
+        unittest.mock.patch.object(
+            ocm_upgrade, 'create_upgrade_pullrequest', fake_create_upgrade_pullrequest,
+        ),
+        unittest.mock.patch('github.pullrequest.reset_worktree') as reset_worktree,
+        unittest.mock.patch('gitutil.GitHelper'),
+    ):
+        list(ocm_upgrade.create_upgrade_pullrequests(
+            component=component,
+            component_descriptor_lookup=None,
+            version_lookup=lambda _: ['1.0.0', '2.0.0'],
+            upgrade_pullrequests=[],
+            repo_dir='/tmp',
+            repo_url='https://github.com/example/repo',
+            repository=unittest.mock.MagicMock(),
+            merge_policy=ocm_upgrade.MergePolicy.MANUAL,
+            merge_method=ocm_upgrade.MergeMethod.MERGE,
+            merge_policy_configs=[],
+            branch='main',
+            oci_client=unittest.mock.MagicMock(),
+            pr_naming_pattern='component-name',
+        ))
+
+    # both upgrades are expected to be attempted, and worktree to be reset after each of them
+    assert len(created) == 2
+    assert reset_worktree.call_count == 2
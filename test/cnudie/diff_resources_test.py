@@ -0,0 +1,269 @@
+import collections.abc
+import random
+
+import pytest
+
+import cnudie.util
+import ocm
+
+
+# reference-implementation (as of before diffing was changed to run in linear time); kept for
+# checking that diffing semantics (including ordering and quirks) are unchanged
+
+def _reference_enumerate_group_pairs(
+    left_elements,
+    right_elements,
+    unique_name: bool = False,
+):
+    for element in left_elements:
+        right_elements_group = [e for e in right_elements if e.name == element.name]
+
+        if len(right_elements_group) == 0:
+            continue
+        else:
+            left_elements_group = [e for e in left_elements if e.name == element.name]
+
+            if unique_name:
+                if len(left_elements_group) == 1 and len(right_elements_group) == 1:
+                    yield (left_elements_group[0], right_elements_group[0])
+                else:
+                    raise RuntimeError(element.name)
+            else:
+                yield (left_elements_group, right_elements_group)
+
+
+def _reference_add_if_not_duplicate(list, res):
+    if (res.name, res.version) not in [(res.name, res.version) for res in list]:
+        list.append(res)
+
+
+def _reference_diff_resources(
+    left_component: ocm.Component,
+    right_component: ocm.Component,
+) -> cnudie.util.ResourceDiff:
+    left_resource_identities_to_resource = {
+        r.identity(left_component.resources + right_component.resources): r
+        for r in left_component.resources
+    }
+    right_resource_identities_to_resource = {
+        r.identity(left_component.resources + right_component.resources): r
+        for r in right_component.resources
+    }
+
+    resource_diff = cnudie.util.ResourceDiff(
+        left_component=left_component,
+        right_component=right_component,
+    )
+
+    if left_resource_identities_to_resource.keys() == right_resource_identities_to_resource.keys():
+        return resource_diff
+
+    left_names_to_resource = {r.name: r for r in left_component.resources}
+    right_names_to_resource = {r.name: r for r in right_component.resources}
+    for resource in left_resource_identities_to_resource.values():
+        if not resource.name in right_names_to_resource:
+            _reference_add_if_not_duplicate(resource_diff.resource_refs_only_left, resource)
+
+    for resource in right_resource_identities_to_resource.values():
+        if not resource.name in left_names_to_resource:
+            _reference_add_if_not_duplicate(resource_diff.resource_refs_only_right, resource)
+
+    def enumerate_group_pairs(left_resources, right_resources):
+        for name in left_names_to_resource.keys():
+            right_resource_group = [r for r in right_resources if r.name == name]
+
+            if len(right_resource_group) == 0:
+                continue
+            else:
+                left_resource_group = [r for r in left_resources if r.name == name]
+                yield (left_resource_group, right_resource_group)
+
+    for left_resource_group, right_resource_group in enumerate_group_pairs(
+        left_resources=left_component.resources,
+        right_resources=right_component.resources,
+    ):
+        if len(left_resource_group) == 1 and len(right_resource_group) == 1:
+            if left_resource_group[0].version != right_resource_group[0].version:
+                resource_diff.resourcepairs_version_changed.append(
+                    (left_resource_group[0], right_resource_group[0]),
+                )
+            continue
+
+        left_identities = {
+            r.identity(left_component.resources + right_component.resources): r
+            for r in left_resource_group
+        }
+        right_identities = {
+            r.identity(left_component.resources + right_component.resources): r
+            for r in right_resource_group
+        }
+
+        left_resource_ids = sorted(left_identities.keys())
+        right_resource_ids = sorted(right_identities.keys())
+
+        left_resources = [left_identities.get(id) for id in left_resource_ids]
+        right_resources = [right_identities.get(id) for id in right_resource_ids]
+
+        versions_in_both = {
+            r.version for r in left_resources
+        } & {
+            r.version for r in right_resources
+        }
+        left_resources = [
+            i for i in left_resources
+            if not i.version in versions_in_both
+        ]
+        right_resources = [
+            i for i in right_resources
+            if not i.version in versions_in_both
+        ]
+
+        i = 0
+        for i, left_resource in enumerate(left_resources):
+            if i >= len(right_resources):
+                _reference_add_if_not_duplicate(resource_diff.resource_refs_only_left, left_resource)
+
+            else:
+                right_resource = right_resources[i]
+                resource_diff.resourcepairs_version_changed.append((left_resource, right_resource))
+
+        left_resource = left_resources[i:]
+        right_resource = right_resources[i:]
+
+        for i in left_resource:
+            _reference_add_if_not_duplicate(resource_diff.resource_refs_only_left, i)
+
+        for i in right_resource:
+            _reference_add_if_not_duplicate(resource_diff.resource_refs_only_right, i)
+
+    return resource_diff
+
+
+def _resource(
+    name: str,
+    version: str,
+    extra_identity: dict[str, str] | None=None,
+) -> ocm.Resource:
+    return ocm.Resource(
+        name=name,
+        version=version,
+        access=None,
+        type=ocm.ArtefactType.OCI_IMAGE,
+        extraIdentity=extra_identity or {},
+        labels=[],
+        srcRefs=[],
+        relation=ocm.ResourceRelation.EXTERNAL,
+    )
+
+
+def _component(resources: list[ocm.Resource]) -> ocm.Component:
+    return ocm.Component(
+        name='example.org/component',
+        version='1.2.3',
+        provider='example',
+        repositoryContexts=[],
+        componentReferences=[],
+        sources=[],
+        resources=resources,
+        labels=[],
+    )
+
+
+def _random_components(rnd: random.Random) -> tuple[ocm.Component, ocm.Component]:
+    names = [f'res-{idx}' for idx in range(rnd.randint(1, 6))]
+    versions = [f'1.{idx}.0' for idx in range(rnd.randint(1, 4))]
+    platforms = (None, 'linux/amd64', 'linux/arm64')
+
+    def random_resource() -> ocm.Resource:
+        platform = rnd.choice(platforms)
+        return _resource(
+            name=rnd.choice(names),
+            version=rnd.choice(versions),
+            extra_identity={'platform': platform} if platform else None,
+        )
+
+    left_resources = [random_resource() for _ in range(rnd.randint(0, 10))]
+    right_resources = [random_resource() for _ in range(rnd.randint(0, 10))]
+
+    # share some resources (same objects, and equal objects) between both sides
+    for resource in rnd.sample(left_resources, k=min(len(left_resources), rnd.randint(0, 3))):
+        if rnd.random() < 0.5:
+            right_resources.append(resource)
+        else:
+            right_resources.append(_resource(
+                name=resource.name,
+                version=resource.version,
+                extra_identity=resource.extraIdentity,
+            ))
+    rnd.shuffle(right_resources)
+
+    return _component(left_resources), _component(right_resources)
+
+
+def _as_ids(resources: collections.abc.Iterable) -> list:
+    return [
+        tuple(id(r) for r in resource) if isinstance(resource, tuple) else id(resource)
+        for resource in resources
+    ]
+
+
+@pytest.mark.parametrize('seed', range(500))
+def test_diff_resources_matches_reference(seed):
+    left_component, right_component = _random_components(random.Random(seed))
+
+    resource_diff = cnudie.util.diff_resources(
+        left_component=left_component,
+        right_component=right_component,
+    )
+    reference_diff = _reference_diff_resources(
+        left_component=left_component,
+        right_component=right_component,
+    )
+
+    assert _as_ids(resource_diff.resource_refs_only_left) == \
+        _as_ids(reference_diff.resource_refs_only_left)
+    assert _as_ids(resource_diff.resource_refs_only_right) == \
+        _as_ids(reference_diff.resource_refs_only_right)
+    assert _as_ids(resource_diff.resourcepairs_version_changed) == \
+        _as_ids(reference_diff.resourcepairs_version_changed)
+
+
+@pytest.mark.parametrize('seed', range(200))
+def test_enumerate_group_pairs_matches_reference(seed):
+    left_component, right_component = _random_components(random.Random(seed))
+    left_resources = left_component.resources
+    right_resources = right_component.resources
+
+    assert [
+        (_as_ids(left_group), _as_ids(right_group))
+        for left_group, right_group in cnudie.util._enumerate_group_pairs(
+            left_elements=left_resources,
+            right_elements=right_resources,
+        )
+    ] == [
+        (_as_ids(left_group), _as_ids(right_group))
+        for left_group, right_group in _reference_enumerate_group_pairs(
+            left_elements=left_resources,
+            right_elements=right_resources,
+        )
+    ]
+
+
+def test_diff_resources_many_resources():
+    count = 5000
+    left_component = _component([
+        _resource(name=f'image-{idx}', version='1.0.0') for idx in range(count)
+    ])
+    right_component = _component([
+        _resource(name=f'image-{idx}', version='1.0.0' if idx % 2 else '1.1.0')
+        for idx in range(count)
+    ])
+
+    resource_diff = cnudie.util.diff_resources(
+        left_component=left_component,
+        right_component=right_component,
+    )
+
+    assert len(resource_diff.resourcepairs_version_changed) == count // 2
+    assert not resource_diff.resource_refs_only_left
+    assert not resource_diff.resource_refs_only_right
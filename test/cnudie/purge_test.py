@@ -0,0 +1,303 @@
+import threading
+import time
+
+import pytest
+
+import cnudie.purge
+import cnudie.util
+import oci.model as om
+import ocm
+import version
+
+
+class _FakeOciClient:
+    '''
+    stand-in for `oci.client.Client`, recording deleted manifests (and max. concurrent deletions)
+    '''
+    def __init__(
+        self,
+        failing_refs: tuple[str]=(),
+        repository_tags: dict[str, list[str]] | None=None,
+    ):
+        self.failing_refs = failing_refs
+        self.repository_tags = repository_tags or {}
+        self.deleted = []
+        self.lock = threading.Lock()
+        self.running = 0
+        self.max_running = 0
+
+    def tags(self, image_reference):
+        return self.repository_tags[image_reference]
+
+    def manifest(self, image_reference, absent_ok=False, accept=None):
+        return om.OciImageManifest(
+            config=om.OciBlobRef(digest='sha256:cfg', mediaType='application/json', size=2),
+            layers=[],
+        )
+
+    def delete_manifest(self, image_reference, purge=False, accept=None, absent_ok=False):
+        image_reference = str(image_reference)
+        with self.lock:
+            self.running += 1
+            self.max_running = max(self.max_running, self.running)
+
+        time.sleep(0.01)
+
+        with self.lock:
+            self.running -= 1
+            if image_reference in self.failing_refs:
+                raise RuntimeError(f'failed to delete {image_reference}')
+            self.deleted.append(image_reference)
+
+
+_ocm_repo = ocm.OciOcmRepository(baseUrl='registry.example.org/ocm')
+
+
+def _resource(name: str, image_reference: str) -> ocm.Resource:
+    return ocm.Resource(
+        name=name,
+        version='1.0.0',
+        type=ocm.ArtefactType.OCI_IMAGE,
+        access=ocm.OciAccess(imageReference=image_reference),
+        relation=ocm.ResourceRelation.LOCAL,
+    )
+
+
+def _component(
+    name: str,
+    resources: list[ocm.Resource],
+    component_references: list[ocm.ComponentReference]=(),
+    version: str='1.0.0',
+) -> ocm.Component:
+    return ocm.Component(
+        name=name,
+        version=version,
+        repositoryContexts=[_ocm_repo],
+        provider='example',
+        sources=[],
+        componentReferences=list(component_references),
+        resources=resources,
+    )
+
+
+@pytest.fixture
+def components() -> dict[ocm.ComponentIdentity, ocm.Component]:
+    shared = _resource('shared', 'registry.example.org/images/shared:1.0.0')
+
+    children = [
+        _component(
+            name=f'example.org/child-{idx}',
+            resources=[
+                _resource('image', f'registry.example.org/images/child-{idx}:1.0.0'),
+                shared,
+            ],
+        ) for idx in range(8)
+    ]
+    root = _component(
+        name='example.org/root',
+        resources=[
+            shared,
+            ocm.Resource(
+                name='external',
+                version='1.0.0',
+                type=ocm.ArtefactType.OCI_IMAGE,
+                access=ocm.OciAccess(imageReference='other.example.org/external:1.0.0'),
+                relation=ocm.ResourceRelation.EXTERNAL,
+            ),
+        ],
+        component_references=[
+            ocm.ComponentReference(
+                name=child.name,
+                componentName=child.name,
+                version=child.version,
+            ) for child in children
+        ],
+    )
+
+    return {
+        component.identity(): component
+        for component in (root, *children)
+    }
+
+
+def _lookup(components):
+    def lookup(component_id, *args, **kwargs):
+        component = components[ocm.ComponentIdentity(
+            name=component_id.name,
+            version=component_id.version,
+        )]
+        return ocm.ComponentDescriptor(meta=ocm.Metadata(), component=component, signatures=[])
+
+    return lookup
+
+
+def test_plan_purge_dedupes_shared_resources(components):
+    root = components[ocm.ComponentIdentity('example.org/root', '1.0.0')]
+
+    plan = cnudie.purge.plan_purge(
+        component=root,
+        lookup=_lookup(components),
+        recursive=True,
+    )
+
+    assert len(plan.components) == 9
+    # shared resource is expected once; external resources are not to be removed
+    assert len(plan.resources) == 9
+    assert plan.component_resources[root.identity()] == {
+        'registry.example.org/images/shared:1.0.0',
+    }
+
+
+def test_purge_removes_descriptors_after_resources(components):
+    root = components[ocm.ComponentIdentity('example.org/root', '1.0.0')]
+    oci_client = _FakeOciClient()
+
+    result = cnudie.purge.remove_component_descriptor_and_referenced_artefacts(
+        component=root,
+        oci_client=oci_client,
+        lookup=_lookup(components),
+        recursive=True,
+        max_workers=8,
+        max_workers_per_host=4,
+    )
+
+    assert result.ok
+    assert len(result.removed_resources) == 9
+    assert len(result.removed_components) == 9
+    assert len(oci_client.deleted) == len(set(oci_client.deleted)) == 18
+    assert 1 < oci_client.max_running <= 4
+
+    descriptor_refs = [ref for ref in oci_client.deleted if '/component-descriptors/' in ref]
+    assert oci_client.deleted[-len(descriptor_refs):] == descriptor_refs
+
+
+def test_purge_keeps_descriptors_of_failed_resources(components):
+    root = components[ocm.ComponentIdentity('example.org/root', '1.0.0')]
+    failing_ref = 'registry.example.org/images/child-3:1.0.0'
+
+    result = cnudie.purge.remove_component_descriptor_and_referenced_artefacts(
+        component=root,
+        oci_client=_FakeOciClient(failing_refs=(failing_ref,)),
+        lookup=_lookup(components),
+        recursive=True,
+        on_error='continue',
+    )
+
+    assert not result.ok
+    assert list(result.failed_resources) == [failing_ref]
+    assert result.skipped_components == [
+        ocm.ComponentIdentity('example.org/child-3', '1.0.0'),
+    ]
+    assert len(result.removed_components) == 8
+
+    with pytest.raises(RuntimeError):
+        cnudie.purge.remove_component_descriptor_and_referenced_artefacts(
+            component=root,
+            oci_client=_FakeOciClient(failing_refs=(failing_ref,)),
+            lookup=_lookup(components),
+            recursive=True,
+        )
+
+
+_retention_policy = version.VersionRetentionPolicies(
+    name='retention',
+    rules=[
+        version.VersionRetentionPolicy(
+            name='same-minor-snapshots',
+            keep=1,
+            match=version.VersionType.SNAPSHOT,
+            restrict=version.VersionRestriction.SAME_MINOR,
+        ),
+        version.VersionRetentionPolicy(
+            name='releases',
+            keep=2,
+            match=version.VersionType.RELEASE,
+        ),
+    ],
+)
+
+
+@pytest.fixture
+def versioned_components() -> dict[ocm.ComponentIdentity, ocm.Component]:
+    components = [
+        _component(
+            name=f'example.org/component-{idx}',
+            version=v,
+            resources=[
+                _resource('image', f'registry.example.org/images/component-{idx}:{v}'),
+                # shared resource (e.g. not rebuilt between versions)
+                _resource('shared', 'registry.example.org/images/shared:1.0.0'),
+            ],
+        )
+        for idx in range(4)
+        for v in ('1.0.0', '1.1.0', '1.2.0-dev', '1.2.0-dev-abc', '1.2.0')
+    ]
+
+    return {
+        component.identity(): component
+        for component in components
+    }
+
+
+def _repository_tags(components) -> dict[str, list[str]]:
+    repository_tags = {}
+    for component in components.values():
+        oci_ref = cnudie.util.oci_ref(component=component)
+        repository_tags.setdefault(oci_ref.ref_without_tag, ['sha256-abc.sig']).append(
+            component.version,
+        )
+    return repository_tags
+
+
+def test_componentversions_to_purge(versioned_components):
+    reference_components = [
+        component for component in versioned_components.values()
+        if component.version == '1.2.0'
+    ]
+
+    componentversions = cnudie.purge.componentversions_to_purge(
+        components=reference_components,
+        policy=_retention_policy,
+        oci_client=_FakeOciClient(repository_tags=_repository_tags(versioned_components)),
+    )
+
+    assert len(componentversions) == 4
+    for component, component_ids in componentversions:
+        assert sorted(component_id.version for component_id in component_ids) == [
+            '1.0.0', '1.2.0-dev',
+        ]
+        assert {component_id.name for component_id in component_ids} == {component.name}
+
+
+def test_purge_componentversions(versioned_components):
+    reference_components = [
+        component for component in versioned_components.values()
+        if component.version == '1.2.0'
+    ]
+    oci_client = _FakeOciClient(repository_tags=_repository_tags(versioned_components))
+
+    plan, result = cnudie.purge.purge_componentversions(
+        components=reference_components,
+        policy=_retention_policy,
+        oci_client=oci_client,
+        lookup=_lookup(versioned_components),
+    )
+
+    # policy defaults to dry-run
+    assert result is None
+    assert not oci_client.deleted
+    assert len(plan.components) == 8
+    assert len(plan.resources) == 9
+    assert 'registry.example.org: 8 component-descriptor(s), 9 resource(s)' in plan.cost_report()
+
+    plan, result = cnudie.purge.purge_componentversions(
+        components=reference_components,
+        policy=_retention_policy,
+        oci_client=oci_client,
+        lookup=_lookup(versioned_components),
+        dry_run=False,
+    )
+
+    assert result.ok
+    assert len(oci_client.deleted) == 17
+    assert not any(ref.endswith(':1.2.0') for ref in oci_client.deleted)
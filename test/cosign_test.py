@@ -6,9 +6,11 @@
 import dataclasses
 import hashlib
 import json
+import time
 
 import cryptography.hazmat.primitives.asymmetric.rsa as rsa
 import cryptography.hazmat.primitives.serialization as crypto_serialiation
+import dacite
 import pytest
 
 import cosign
@@ -281,3 +283,145 @@ def test_image_signing(
     assert signature_layer.digest == payload_without_annotations_digest
 
     json.dumps(manifest_different_key.as_dict()).encode('utf-8')
+
+
+class _FakeOciClient:
+    '''
+    in-memory oci-registry, recording uploads of blobs and manifests
+    '''
+    def __init__(self, manifest_delay: float=0):
+        self.manifest_delay = manifest_delay
+        self.blobs: set[tuple[str, str]] = set() # (repository, digest)
+        self.manifests: dict[str, bytes] = {} # image-reference -> manifest
+        self.blob_uploads: list[tuple[str, str]] = []
+        self.manifest_uploads: list[tuple[str, bytes]] = []
+
+    def to_digest_hash(self, image_reference):
+        return str(image_reference)
+
+    def _manifest_bytes(self, image_reference) -> bytes | None:
+        image_reference = oci.model.OciImageReference.to_image_ref(image_reference)
+        if image_reference.has_digest_tag:
+            return next((
+                manifest for manifest in self.manifests.values()
+                if f'sha256:{hashlib.sha256(manifest).hexdigest()}' == image_reference.tag
+            ), None)
+        return self.manifests.get(str(image_reference))
+
+    def head_manifest(self, image_reference, absent_ok=False):
+        return self._manifest_bytes(image_reference) is not None
+
+    def manifest(self, image_reference):
+        manifest = dacite.from_dict(
+            data_class=oci.model.OciImageManifest,
+            data=json.loads(self._manifest_bytes(image_reference)),
+        )
+        # widens window between reading and replacing a manifest (for lost-update-detection)
+        time.sleep(self.manifest_delay)
+        return manifest
+
+    def head_blob(self, image_reference, digest, absent_ok=True):
+        repository = oci.model.OciImageReference(image_reference).ref_without_tag
+        return (repository, digest) in self.blobs
+
+    def put_blob(self, image_reference, digest, octets_count, data):
+        repository = oci.model.OciImageReference(image_reference).ref_without_tag
+        self.blobs.add((repository, digest))
+        self.blob_uploads.append((repository, digest))
+
+    def put_manifest(self, image_reference, manifest):
+        self.manifests[str(image_reference)] = manifest
+        self.manifest_uploads.append((str(image_reference), manifest))
+
+
+def test_sign_images():
+    image_signatures = [
+        cosign.ImageSignature(
+            image_reference=f'eu.gcr.io/test/img-{idx % 4}@sha256:{idx % 4:064x}',
+            signature=f'signature-{idx % 4}',
+            signing_algorithm=signingserver.SigningAlgorithm.RSASSA_PSS,
+            public_key='public-key',
+            annotations={'key': 'val'} if idx % 2 else None,
+        ) for idx in range(8) # each image twice (deduplication is expected)
+    ]
+    # existing signature artefact w/ different signature (append-mode)
+    existing_signature = dataclasses.replace(
+        image_signatures[0],
+        signature='other-signature',
+        public_key=None,
+    )
+
+    def prepare_client():
+        oci_client = _FakeOciClient()
+        cosign.sign_image(
+            image_reference=existing_signature.image_reference,
+            signature=existing_signature.signature,
+            oci_client=oci_client,
+        )
+        oci_client.blob_uploads.clear()
+        oci_client.manifest_uploads.clear()
+        return oci_client
+
+    oci_client = prepare_client()
+    expected_results = [
+        cosign.sign_image(
+            image_reference=image_signature.image_reference,
+            signature=image_signature.signature,
+            signing_algorithm=image_signature.signing_algorithm,
+            public_key=image_signature.public_key,
+            annotations=image_signature.annotations,
+            oci_client=oci_client,
+        ) for image_signature in image_signatures
+    ]
+    expected_manifest_uploads = oci_client.manifest_uploads
+
+    oci_client = prepare_client()
+    results = cosign.sign_images(
+        image_signatures=image_signatures,
+        oci_client=oci_client,
+        max_workers=4,
+    )
+
+    assert [
+        (str(signature_ref), manifest) for signature_ref, manifest in results
+    ] == [
+        (str(signature_ref), manifest) for signature_ref, manifest in expected_results
+    ]
+    # signature manifests are expected to be byte-identical to those from single-image path
+    assert sorted(oci_client.manifest_uploads) == sorted(expected_manifest_uploads)
+    assert len(oci_client.manifest_uploads) == 4
+
+    # payload- and cfg-blobs are expected to be uploaded (at most) once, and not at all if present
+    assert len(set(oci_client.blob_uploads)) == len(oci_client.blob_uploads)
+    assert len(oci_client.blob_uploads) == 2 * 4 - 2
+
+
+def test_sign_images_same_image():
+    image_reference = f'eu.gcr.io/test/img@sha256:{0:064x}'
+    image_signatures = [
+        cosign.ImageSignature(
+            image_reference=image_reference,
+            signature=f'signature-{idx}',
+        ) for idx in range(4)
+    ] + [
+        cosign.ImageSignature(
+            image_reference=f'eu.gcr.io/test/img-{idx}@sha256:{idx:064x}',
+            signature='signature',
+        ) for idx in range(1, 4)
+    ]
+
+    oci_client = _FakeOciClient(manifest_delay=0.01)
+    results = cosign.sign_images(
+        image_signatures=image_signatures,
+        oci_client=oci_client,
+        max_workers=8,
+    )
+
+    # all signatures for same image are expected to be retained (no lost updates)
+    signature_image_reference, manifest = results[3]
+    assert str(signature_image_reference) == \
+        str(cosign.default_signature_image_reference(image_reference))
+    assert [
+        layer.annotations[cosign._cosign_signature_annotation_name]
+        for layer in oci_client.manifest(signature_image_reference).layers
+    ] == [f'signature-{idx}' for idx in range(4)]
@@ -0,0 +1,124 @@
+import collections
+import hashlib
+import http.server
+import json
+import threading
+
+import pytest
+import requests
+
+import github.cache
+
+
+class _GithubApiStandIn(http.server.ThreadingHTTPServer):
+    '''
+    in-process stand-in for github-api, serving json-documents w/ `ETag`, and honouring
+    `If-None-Match`; records response-status-codes
+    '''
+    def __init__(self, documents: dict[str, object]):
+        self.documents = documents
+        self.status_codes = collections.Counter()
+
+        server = self
+
+        class RequestHandler(http.server.BaseHTTPRequestHandler):
+            def do_GET(self):
+                body = json.dumps(server.documents[self.path]).encode('utf-8')
+                etag = f'"{hashlib.sha256(body).hexdigest()}"'
+
+                if self.headers.get('If-None-Match') == etag:
+                    server.status_codes[304] += 1
+                    self.send_response(304)
+                    self.send_header('ETag', etag)
+                    self.send_header('X-RateLimit-Remaining', '4999')
+                    self.end_headers()
+                    return
+
+                server.status_codes[200] += 1
+                self.send_response(200)
+                self.send_header('ETag', etag)
+                self.send_header('Content-Type', 'application/json; charset=utf-8')
+                self.send_header('Link', f'<{self.path}?page=2>; rel="next"')
+                self.send_header('X-RateLimit-Remaining', '4998')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args, **kwargs):
+                pass
+
+        super().__init__(('127.0.0.1', 0), RequestHandler)
+
+    @property
+    def url(self) -> str:
+        return f'http://127.0.0.1:{self.server_port}'
+
+
+@pytest.fixture
+def github_api_stand_in():
+    server = _GithubApiStandIn(documents={
+        '/repos/org/repo/releases': [{'tag_name': '1.0.0'}, {'tag_name': '1.1.0'}],
+        '/repos/org/repo/tags': [{'name': '1.0.0'}],
+    })
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+
+    yield server
+
+    server.shutdown()
+    server.server_close()
+
+
+def _session(
+    server: _GithubApiStandIn,
+    cache: github.cache.ConditionalRequestCache,
+) -> requests.Session:
+    session = requests.Session()
+    github.cache.mount(session=session, base_url=server.url, cache=cache)
+    return session
+
+
+def test_responses_are_revalidated(github_api_stand_in, tmp_path):
+    cache_path = str(tmp_path / 'github-responses.db')
+    releases_url = f'{github_api_stand_in.url}/repos/org/repo/releases'
+
+    # first run: responses are cached
+    with github.cache.ConditionalRequestCache(path=cache_path) as cache:
+        response = _session(server=github_api_stand_in, cache=cache).get(releases_url)
+
+        assert response.status_code == 200
+        assert (cache.hits, cache.misses) == (0, 1)
+        uncached_releases = response.json()
+
+    # consecutive run: responses are revalidated, and served from cache
+    with github.cache.ConditionalRequestCache(path=cache_path) as cache:
+        session = _session(server=github_api_stand_in, cache=cache)
+        response = session.get(releases_url)
+
+        assert response.status_code == 200
+        assert response.json() == uncached_releases
+        assert response.links['next']['url'].endswith('?page=2')
+        # headers are taken from actual (304-)response
+        assert response.headers['X-RateLimit-Remaining'] == '4999'
+
+        # documents absent from cache are retrieved
+        assert session.get(f'{github_api_stand_in.url}/repos/org/repo/tags').json()
+
+        assert (cache.hits, cache.misses) == (1, 1)
+
+    assert github_api_stand_in.status_codes == {200: 2, 304: 1}
+
+
+def test_modified_responses_are_updated(github_api_stand_in, tmp_path):
+    releases_url = f'{github_api_stand_in.url}/repos/org/repo/releases'
+
+    with github.cache.ConditionalRequestCache(path=str(tmp_path / 'cache.db')) as cache:
+        session = _session(server=github_api_stand_in, cache=cache)
+        session.get(releases_url)
+
+        github_api_stand_in.documents['/repos/org/repo/releases'].append({'tag_name': '1.2.0'})
+
+        assert len(session.get(releases_url).json()) == 3
+        assert len(session.get(releases_url).json()) == 3
+
+        assert (cache.hits, cache.misses) == (1, 2)
@@ -0,0 +1,175 @@
+import collections
+import threading
+import time
+import types
+
+import github3.exceptions
+import pytest
+
+import github.codeowners as gc
+
+
+class _NotFoundResponse:
+    status_code = 404
+    headers = {}
+    content = b''
+    url = ''
+
+    def json(self):
+        return {}
+
+
+class FakeGithubApi:
+    '''
+    stand-in for github3.GitHub, counting (and delaying) api-calls
+    '''
+    _github_url = 'https://api.github.example.org'
+
+    def __init__(self, teams: dict[str, list[str]], emails: dict[str, str]):
+        self.teams = teams # <org>/<team> -> member-logins
+        self.emails = emails # login -> email
+        self.calls = collections.Counter()
+        self.lock = threading.Lock()
+
+    def _call(self, name: str):
+        with self.lock:
+            self.calls[name] += 1
+        time.sleep(0.01)
+
+    def organization(self, org_name):
+        self._call('organization')
+
+        def team_by_name(team_name):
+            self._call('team_by_name')
+            if (members := self.teams.get(f'{org_name}/{team_name}')) is None:
+                raise github3.exceptions.NotFoundError(_NotFoundResponse())
+
+            def iter_members():
+                self._call('members')
+                for login in members:
+                    yield types.SimpleNamespace(login=login)
+
+            return types.SimpleNamespace(members=iter_members)
+
+        return types.SimpleNamespace(team_by_name=team_by_name)
+
+    def user(self, login):
+        self._call('user')
+        if login not in self.emails:
+            raise github3.exceptions.NotFoundError(_NotFoundResponse())
+        return types.SimpleNamespace(email=self.emails[login])
+
+    def search_users(self, query):
+        self._call('search_users')
+        email_address = query.split(' ')[0]
+        for login, email in self.emails.items():
+            if email == email_address:
+                yield types.SimpleNamespace(user=types.SimpleNamespace(login=login))
+
+
+@pytest.fixture
+def github_api():
+    return FakeGithubApi(
+        teams={
+            'org/team-a': ['alice', 'bob', 'carol'],
+            'org/team-b': ['bob', 'carol', 'dave'],
+        },
+        emails={
+            'alice': 'alice@example.org',
+            'bob': 'bob@example.org',
+            'carol': '',
+            'dave': 'dave@example.org',
+        },
+    )
+
+
+def _entries(*entries: str):
+    return [gc.parse_codeowner_entry(entry) for entry in entries]
+
+
+def test_resolve_email_addresses(github_api):
+    cache = gc.ResolutionCache()
+    codeowners_entries = _entries(
+        '@org/team-a',
+        '@org/team-b',
+        '@org/absent-team',
+        '@bob',
+        '@unknown-user',
+        'eve@example.org',
+    )
+
+    email_addresses = set(gc.resolve_email_addresses(
+        codeowners_entries=codeowners_entries,
+        github_api=github_api,
+        cache=cache,
+    ))
+
+    assert email_addresses == {
+        'alice@example.org',
+        'bob@example.org',
+        'dave@example.org',
+        'eve@example.org',
+    }
+    # each distinct principal is expected to be looked up only once
+    assert github_api.calls == {
+        'organization': 1,
+        'team_by_name': 3,
+        'members': 2,
+        'user': 5,
+    }
+
+    # cache is expected to be re-usable across resolutions (e.g. for multiple repositories)
+    assert set(gc.resolve_email_addresses(
+        codeowners_entries=codeowners_entries,
+        github_api=github_api,
+        cache=cache,
+    )) == email_addresses
+    assert sum(github_api.calls.values()) == 11
+
+
+def test_resolve_usernames(github_api):
+    cache = gc.ResolutionCache()
+
+    usernames = set(gc.resolve_usernames(
+        codeowners_entries=_entries(
+            '@org/team-a',
+            'dave@example.org',
+            'dave@example.org',
+            'nobody@example.org',
+        ),
+        github_api=github_api,
+        cache=cache,
+    ))
+
+    assert usernames == {'alice', 'bob', 'carol', 'dave'}
+    assert github_api.calls['search_users'] == 2
+
+
+def test_resolution_cache_deduplicates_concurrent_lookups():
+    cache = gc.ResolutionCache()
+    lookups = []
+
+    def lookup():
+        lookups.append(None)
+        time.sleep(0.05)
+        return 'value'
+
+    threads = [
+        threading.Thread(target=cache.get, kwargs={'key': ('k',), 'lookup': lookup})
+        for _ in range(8)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(lookups) == 1
+    assert cache.get(key=('k',), lookup=lookup) == 'value'
+
+    def failing_lookup():
+        raise RuntimeError()
+
+    # errors (other than NotFoundError) are not expected to be cached
+    with pytest.raises(RuntimeError):
+        cache.get(key=('other',), lookup=failing_lookup)
+    assert cache.get(key=('other',), lookup=lookup) == 'value'
@@ -0,0 +1,248 @@
+import http.server
+import io
+import json
+import threading
+import time
+
+import github3.exceptions
+import pytest
+import requests
+import requests.adapters
+
+import github
+import github.ratelimit
+import github.retry
+
+
+class _Clock:
+    '''
+    fake clock; sleeping advances time (instead of actually sleeping)
+    '''
+    def __init__(self):
+        self.now = time.time()
+        self.sleeps = []
+        self.lock = threading.Lock()
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float):
+        with self.lock:
+            self.sleeps.append(seconds)
+            self.now += seconds
+
+
+class _GithubApiStandIn(http.server.ThreadingHTTPServer):
+    '''
+    in-process stand-in for github-api, emitting rate-limit headers (budget of `limit` requests
+    per window of 60s, as per given clock). Requests exceeding the budget are rejected w/ http-403;
+    the first `secondary_limits` requests are rejected w/ http-429 and `Retry-After`.
+    '''
+    def __init__(self, clock: _Clock, limit: int, secondary_limits: int=0):
+        self.clock = clock
+        self.limit = limit
+        self.remaining = limit
+        self.reset = int(clock()) + 60
+        self.secondary_limits = secondary_limits
+        self.lock = threading.Lock()
+        self.served = 0
+        self.rejected = 0
+
+        server = self
+
+        class RequestHandler(http.server.BaseHTTPRequestHandler):
+            def do_GET(self):
+                with server.lock:
+                    status, headers = server._admit()
+
+                body = json.dumps({'message': 'ok' if status == 200 else 'API rate limit exceeded'})
+                body = body.encode('utf-8')
+
+                self.send_response(status)
+                for name, value in headers.items():
+                    self.send_header(name, value)
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args, **kwargs):
+                pass
+
+        super().__init__(('127.0.0.1', 0), RequestHandler)
+
+    def _admit(self) -> tuple[int, dict[str, str]]:
+        now = self.clock()
+        if now >= self.reset:
+            self.remaining = self.limit
+            self.reset = int(now) + 60
+
+        if self.secondary_limits > 0:
+            self.secondary_limits -= 1
+            self.rejected += 1
+            return 429, {'Retry-After': '3'}
+
+        if self.remaining <= 0:
+            status = 403
+            self.rejected += 1
+        else:
+            status = 200
+            self.remaining -= 1
+            self.served += 1
+
+        return status, {
+            'X-RateLimit-Limit': str(self.limit),
+            'X-RateLimit-Remaining': str(self.remaining),
+            'X-RateLimit-Reset': str(self.reset),
+            'X-RateLimit-Resource': 'core',
+        }
+
+    @property
+    def url(self) -> str:
+        return f'http://127.0.0.1:{self.server_port}'
+
+
+@pytest.fixture
+def clock():
+    return _Clock()
+
+
+@pytest.fixture
+def github_api_stand_in(request, clock):
+    server = _GithubApiStandIn(clock=clock, **getattr(request, 'param', {'limit': 10}))
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+
+    yield server
+
+    server.shutdown()
+    server.server_close()
+
+
+def _session(server: _GithubApiStandIn, clock: _Clock) -> requests.Session:
+    scheduler = github.ratelimit.RateLimitScheduler(clock=clock, sleep=clock.sleep)
+    session = requests.Session()
+    github.ratelimit.mount(session=session, base_url=server.url, scheduler=scheduler)
+    return session
+
+
+def test_requests_are_paced_until_reset(github_api_stand_in, clock):
+    session = _session(server=github_api_stand_in, clock=clock)
+
+    for idx in range(25):
+        assert session.get(f'{github_api_stand_in.url}/repos/org/repo-{idx}').status_code == 200
+
+    assert github_api_stand_in.served == 25
+    # budget is exhausted twice; requests are expected to be delayed only until the reset
+    # (instead of being rejected)
+    assert github_api_stand_in.rejected == 0
+    assert len(clock.sleeps) == 2
+    assert all(seconds <= 61 for seconds in clock.sleeps)
+
+
+@pytest.mark.parametrize(
+    'github_api_stand_in', [{'limit': 10, 'secondary_limits': 2}], indirect=True,
+)
+def test_secondary_limits_honour_retry_after(github_api_stand_in, clock):
+    session = _session(server=github_api_stand_in, clock=clock)
+
+    assert session.get(f'{github_api_stand_in.url}/repos/org/repo').status_code == 200
+
+    assert github_api_stand_in.rejected == 2
+    assert clock.sleeps == [3, 3]
+
+
+def test_retry_and_throttle_waits_until_reset(github_api_stand_in, clock, monkeypatch):
+    monkeypatch.setattr(github.retry.time, 'sleep', clock.sleep)
+    github_api_stand_in.remaining = 0
+
+    @github.retry.retry_and_throttle
+    def get_repo():
+        response = requests.get(f'{github_api_stand_in.url}/repos/org/repo')
+        if response.status_code == 403:
+            raise github3.exceptions.ForbiddenError(response)
+        return response
+
+    assert get_repo().status_code == 200
+    assert len(clock.sleeps) == 1
+    assert 0 < clock.sleeps[0] <= 61
+
+
+def test_github_api_is_rate_limited():
+    github_api = github.github_api(repo_url='github.com/org/repo', token='token')
+
+    adapter = github_api.session.get_adapter('https://api.github.com/repos/org/repo')
+    assert isinstance(adapter, github.ratelimit.RateLimitedAdapter)
+
+
+def _rate_limit_response(
+    url: str,
+    status_code: int=200,
+    headers: dict[str, str]={},
+) -> requests.Response:
+    response = requests.Response()
+    response.status_code = status_code
+    response.url = url
+    response.headers.update(headers)
+    response._content = b'{}'
+    response.raw = io.BytesIO(response._content)
+    return response
+
+
+def test_paced_requests_reserve_slots(clock):
+    scheduler = github.ratelimit.RateLimitScheduler(clock=clock, sleep=clock.sleep)
+    scheduler.update(_rate_limit_response(
+        url='https://api.github.com/repos/org/repo',
+        headers={
+            'X-RateLimit-Limit': '100',
+            'X-RateLimit-Remaining': '2',
+            'X-RateLimit-Reset': str(clock() + 10),
+        },
+    ))
+
+    # concurrent callers are expected to be spread (instead of being released at once)
+    delays = [scheduler.delay() for _ in range(3)]
+    assert delays == pytest.approx([0, 5, 10])
+
+
+def test_streamed_bodies_are_not_retried(monkeypatch, clock):
+    sent = []
+    responses = []
+
+    def send(self, request, *args, **kwargs):
+        sent.append(request)
+        response = _rate_limit_response(
+            url=request.url,
+            status_code=429,
+            headers={'Retry-After': '3'},
+        )
+        responses.append(response)
+        return response
+
+    monkeypatch.setattr(requests.adapters.HTTPAdapter, 'send', send)
+
+    scheduler = github.ratelimit.RateLimitScheduler(clock=clock, sleep=clock.sleep)
+    session = requests.Session()
+    github.ratelimit.mount(
+        session=session,
+        base_url='https://uploads.github.com',
+        scheduler=scheduler,
+    )
+
+    response = session.post(
+        'https://uploads.github.com/repos/org/repo/releases/1/assets',
+        data=(chunk for chunk in (b'a', b'b')),
+    )
+    assert response.status_code == 429
+    assert len(sent) == 1
+
+    sent.clear()
+    responses.clear()
+    response = session.post(
+        'https://uploads.github.com/repos/org/repo/releases/1/assets',
+        data=b'ab',
+    )
+    assert response.status_code == 429
+    assert len(sent) == 6 # initial attempt + 5 retries
+    # discarded responses are expected to be closed
+    assert all(response.raw.closed for response in responses[:-1])
+    assert not responses[-1].raw.closed
@@ -0,0 +1,135 @@
+import dataclasses
+import random
+
+import pytest
+
+import github.release
+import version
+
+
+@dataclasses.dataclass
+class _Release:
+    '''
+    stand-in for github3.repos.release.Release
+    '''
+    name: str | None
+    tag_name: str | None
+    draft: bool
+
+
+# reference-implementation (as of before release-names were parsed only once); kept for checking
+# that semantics are unchanged
+
+def _reference_outdated_draft_releases(draft_releases, greatest_release_version):
+    greatest_release_version_info = version.parse_to_semver(greatest_release_version)
+
+    def _has_semver_draft_prerelease_label(release_name):
+        return version.parse_to_semver(release_name).prerelease == 'draft'
+
+    autogenerated_draft_releases = [
+        release for release in draft_releases
+        if release.name
+        and version.is_semver_parseable(release.name)
+        and _has_semver_draft_prerelease_label(release.name)
+    ]
+
+    draft_release_version_infos = [
+        version.parse_to_semver(release.name)
+        for release in autogenerated_draft_releases
+    ]
+
+    def _yield_outdated_version_infos_from_partition(partition):
+        if len(partition) == 1:
+            version_info = partition.pop()
+            if version_info < greatest_release_version_info and version_info.patch == 0:
+                yield version_info
+        else:
+            yield from partition[1:]
+
+    outdated_version_infos = list()
+    for partition in version.partition_by_major_and_minor(draft_release_version_infos):
+        outdated_version_infos.extend(_yield_outdated_version_infos_from_partition(partition))
+
+    return [
+        release
+        for release in autogenerated_draft_releases
+        if version.parse_to_semver(release.name) in outdated_version_infos
+    ]
+
+
+def _reference_find_greatest_github_release_version(releases):
+    release_versions = [
+        release.name if release.name else release.tag_name
+        for release in releases
+    ]
+    release_versions = [
+        name for name in release_versions
+        if version.is_semver_parseable(name)
+    ]
+    greatest_version = version.greatest_version(
+        versions=[version.parse_to_semver(release_version) for release_version in release_versions],
+    )
+    return str(greatest_version) if greatest_version else None
+
+
+def _random_releases(rnd: random.Random, count: int) -> list[_Release]:
+    releases = []
+    for _ in range(count):
+        major, minor, patch = rnd.randint(0, 2), rnd.randint(0, 8), rnd.choice((0, 0, 1, 2))
+        release_version = f'{major}.{minor}.{patch}'
+
+        if rnd.random() < 0.3:
+            releases.append(_Release(
+                name=rnd.choice((f'{release_version}-draft', f'{release_version}-dev', 'draft')),
+                tag_name=None,
+                draft=True,
+            ))
+        else:
+            releases.append(_Release(
+                name=rnd.choice((None, f'v{release_version}', 'not-a-version')),
+                tag_name=release_version,
+                draft=False,
+            ))
+
+    return releases
+
+
+@pytest.mark.parametrize('seed', range(100))
+def test_outdated_draft_releases_matches_reference(seed):
+    releases = _random_releases(random.Random(seed), count=random.Random(seed).randint(0, 60))
+
+    non_draft_releases = [release for release in releases if not release.draft]
+    draft_releases = [release for release in releases if release.draft]
+
+    greatest_release_version = _reference_find_greatest_github_release_version(non_draft_releases)
+    assert github.release.find_greatest_github_release_version(
+        non_draft_releases,
+    ) == greatest_release_version
+
+    if not greatest_release_version:
+        return
+
+    reference = _reference_outdated_draft_releases(draft_releases, greatest_release_version)
+    assert github.release.outdated_draft_releases(
+        draft_releases=draft_releases,
+        greatest_release_version=greatest_release_version,
+    ) == reference
+
+
+def test_many_releases():
+    releases = _random_releases(random.Random(42), count=5000)
+    non_draft_releases = [release for release in releases if not release.draft]
+    draft_releases = [release for release in releases if release.draft]
+
+    greatest_release_version = github.release.find_greatest_github_release_version(
+        non_draft_releases,
+        warn_for_unparseable_releases=False,
+    )
+    assert greatest_release_version == '2.8.2'
+
+    outdated = github.release.outdated_draft_releases(
+        draft_releases=draft_releases,
+        greatest_release_version=greatest_release_version,
+    )
+    assert outdated
+    assert all(release.draft for release in outdated)
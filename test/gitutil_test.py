@@ -70,3 +70,32 @@ def test_index_to_commit(git_helper):
     )
 
     assert commit_with_another_file.parents == [original_head_commit]
+
+
+def test_add_notes(git_repo):
+    git_repo.create_remote('origin', url=git_repo.working_tree_dir)
+    git_helper = gitutil.GitHelper(
+        repo=git_repo,
+        git_cfg=gitutil.GitCfg(
+            user_name='test',
+            user_email='test@example.org',
+        ),
+    )
+
+    first_commit = git_repo.head.commit
+    second_commit = git_repo.index.commit('second commit')
+
+    git_helper.add_note(body='existing note', commit=first_commit)
+    git_helper.add_notes(bodies={
+        second_commit.hexsha: 'second note\nwith two lines',
+    })
+    git_helper.add_notes(bodies={
+        first_commit.hexsha: 'overwritten note',
+    })
+
+    assert git_repo.git.notes('show', first_commit.hexsha) == 'overwritten note'
+    assert git_repo.git.notes('show', second_commit.hexsha) == 'second note\nwith two lines'
+
+    # all notes are expected to be added w/ one commit per invocation
+    notes_ref = git_repo.git.notes('get-ref')
+    assert len(list(git_repo.iter_commits(notes_ref))) == 3
@@ -0,0 +1,72 @@
+import io
+import random
+import tarfile
+import zlib
+
+import pytest
+
+import gziputil
+
+
+def test_crc32_combine():
+    rnd = random.Random(42)
+
+    for _ in range(100):
+        a = rnd.randbytes(rnd.randint(0, 512))
+        b = rnd.randbytes(rnd.randint(0, 4096))
+
+        assert gziputil.crc32_combine(
+            zlib.crc32(a),
+            zlib.crc32(b),
+            len(b),
+        ) == zlib.crc32(a + b)
+
+
+def _tarfile_bytes(member_count: int) -> bytes:
+    rnd = random.Random(42)
+    words = [rnd.randbytes(rnd.randint(1, 8)).hex().encode() for _ in range(1000)]
+    buf = io.BytesIO()
+
+    with tarfile.open(fileobj=buf, mode='w') as tf:
+        for idx in range(member_count):
+            data = b' '.join(rnd.choices(words, k=rnd.randint(0, 5_000)))
+            tar_info = tarfile.TarInfo(name=f'file-{idx}')
+            tar_info.size = len(data)
+            tf.addfile(tar_info, io.BytesIO(data))
+
+    return buf.getvalue()
+
+
+@pytest.mark.parametrize('block_size', (1000, 32 * 1024, 128 * 1024))
+def test_parallel_gzip(block_size):
+    data = _tarfile_bytes(member_count=64)
+
+    compressed = b''.join(gziputil.parallel_gzip(
+        chunks=(data[idx:idx + 10_000] for idx in range(0, len(data), 10_000)),
+        fname=b'layer.tar',
+        block_size=block_size,
+        max_workers=4,
+    ))
+
+    # expect exactly one gzip-member
+    decompressor = zlib.decompressobj(wbits=31)
+    assert decompressor.decompress(compressed) == data
+    assert decompressor.eof
+    assert not decompressor.unused_data
+
+    with tarfile.open(fileobj=io.BytesIO(compressed), mode='r|gz') as tf:
+        assert len([tar_info for tar_info in tf]) == 64
+
+    if block_size >= 32 * 1024:
+        # priming w/ previous block's data should yield ratio close to single compressor
+        compressor = gziputil.zlib_compressobj()
+        single_compressed = compressor.compress(data) + compressor.flush()
+        assert len(compressed) < len(single_compressed) * 1.01 + 64
+
+
+def test_parallel_gzip_empty():
+    compressed = b''.join(gziputil.parallel_gzip(chunks=()))
+
+    decompressor = zlib.decompressobj(wbits=31)
+    assert decompressor.decompress(compressed) == b''
+    assert decompressor.eof
@@ -0,0 +1,82 @@
+import gzip
+import io
+import json
+import random
+import zlib
+
+import pytest
+
+import http_requests
+
+
+def test_encode_request_in_memory():
+    encoded, headers = http_requests.encode_request(
+        json={'foo': 'bar'},
+        headers={},
+    )
+
+    assert isinstance(encoded, bytes)
+    assert json.loads(gzip.decompress(encoded)) == {'foo': 'bar'}
+    assert headers['Content-Encoding'] == 'gzip'
+    assert headers['Content-Length'] == str(len(encoded))
+
+    assert gzip.decompress(http_requests.encode_request(data='foo')) == b'foo'
+
+    with pytest.raises(ValueError):
+        http_requests.encode_request(data=b'foo', json={'foo': 'bar'})
+
+    with pytest.raises(ValueError):
+        http_requests.encode_request(data=42)
+
+
+def test_encode_request_file_is_spooled():
+    data = b''.join(f'line {idx}\n'.encode('utf-8') for idx in range(100_000))
+
+    encoded, headers = http_requests.encode_request(
+        data=io.BytesIO(data),
+        headers={},
+        spool_max_size=1024,
+    )
+
+    # compressed data exceeds spool_max_size, thus it is expected to be written to disk
+    assert encoded._rolled
+    assert int(headers['Content-Length']) == len(encoded.read())
+    encoded.seek(0)
+    assert gzip.decompress(encoded.read()) == data
+
+
+def test_encode_request_chunked():
+    rnd = random.Random(42)
+    chunk_count = 0
+
+    def iter_chunks():
+        nonlocal chunk_count
+        for _ in range(256):
+            chunk_count += 1
+            yield rnd.randbytes(64 * 1024)
+
+    encoded, headers = http_requests.encode_request(
+        data=iter_chunks(),
+        headers={'Content-Length': '42'},
+        chunked=True,
+    )
+
+    assert headers == {'Content-Encoding': 'gzip'}
+    # data is expected to be consumed lazily
+    assert chunk_count == 0
+
+    decompressor = zlib.decompressobj(wbits=31)
+    decompressed_length = 0
+    max_octets_ahead = 0
+    for compressed_chunk in encoded:
+        decompressed_length += len(decompressor.decompress(compressed_chunk))
+        max_octets_ahead = max(
+            max_octets_ahead,
+            chunk_count * 64 * 1024 - decompressed_length,
+        )
+    decompressed_length += len(decompressor.flush())
+
+    assert chunk_count == 256
+    assert decompressed_length == 256 * 64 * 1024
+    # memory consumption is expected to be bounded independently of payload-size
+    assert max_octets_ahead <= 2 * 64 * 1024
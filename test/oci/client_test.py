@@ -132,3 +132,57 @@ def test_client_calls_throttle_on_429():
     # 4 → 2 from on_429, then 2 → 3 from on_success on the successful retry
     assert throttle._limit == 3
     assert call_count == 2
+
+
+def test_mount_blob_requests_source_scope_and_cancels_upload():
+    client = co.Client()
+
+    realm_urls = []
+
+    def fake_get(url, **kwargs):
+        if '/token' in url:
+            realm_urls.append(url)
+            res = _mock_response(200)
+            res.json = lambda: {'token': 'token', 'expires_in': 300}
+            return res
+        return _mock_response(401, headers={
+            'www-authenticate': 'Bearer realm="https://auth.example.com/token",'
+            'service="registry.example.com"',
+        })
+
+    requests_sent = []
+
+    def fake_request(method, url, **kwargs):
+        requests_sent.append((method, url))
+        if method == 'POST':
+            res = _mock_response(202, headers={'Location': '/v2/tgt/blobs/uploads/some-uuid'})
+            res.url = url
+            return res
+        return _mock_response(204)
+
+    with (
+        unittest.mock.patch.object(client.session, 'get', side_effect=fake_get),
+        unittest.mock.patch.object(client.session, 'request', side_effect=fake_request),
+    ):
+        assert not client.mount_blob(
+            image_reference='registry.example.com/tgt:1.0',
+            digest='sha256:abc',
+            from_reference='registry.example.com/src',
+        )
+
+    # pull-privileges for source repository are expected to be requested in addition
+    assert len(realm_urls) == 1
+    assert 'scope=repository%3Atgt%3Apush%2Cpull&scope=repository%3Asrc%3Apull' in realm_urls[0]
+
+    # upload-session opened by registry (instead of mounting) is expected to be cancelled
+    assert requests_sent[1] == (
+        'DELETE',
+        'https://registry.example.com/v2/tgt/blobs/uploads/some-uuid',
+    )
+
+
+def test_scope_actions():
+    assert co._scope_actions('repository:pusher:pull') == {'pull'}
+    assert co._scope_actions(
+        'repository:tgt:push,pull repository:src:pull',
+    ) == {'push', 'pull'}
@@ -0,0 +1,210 @@
+import dataclasses
+import gzip
+import io
+import os
+import random
+import tarfile
+
+import pytest
+import requests
+
+import oci.layerindex as ol
+import oci.model as om
+
+
+class FakeOciClient:
+    '''
+    serves a single blob, honouring (and recording) range-requests
+    '''
+    def __init__(self, blob: bytes, support_ranges: bool=True):
+        self._blob = blob
+        self.support_ranges = support_ranges
+        self.transferred_octets = 0
+
+    def blob(self, image_reference, digest, stream=True, byte_range=None):
+        if byte_range and self.support_ranges:
+            first, last = byte_range
+            if first >= len(self._blob):
+                # as `oci.client.Client.blob` (which raises for non-2xx status-codes)
+                res = requests.models.Response()
+                res.status_code = 416
+                raise requests.exceptions.HTTPError(response=res)
+            content = self._blob[first:last + 1]
+            status_code = 206
+        else:
+            content = self._blob
+            status_code = 200
+
+        return _FakeResponse(
+            oci_client=self,
+            status_code=status_code,
+            content=content,
+        )
+
+
+class _FakeResponse:
+    def __init__(self, oci_client: FakeOciClient, status_code: int, content: bytes):
+        self.oci_client = oci_client
+        self.status_code = status_code
+        self._content = content
+
+    @property
+    def content(self) -> bytes:
+        self.oci_client.transferred_octets += len(self._content)
+        return self._content
+
+    def iter_content(self, chunk_size: int):
+        for idx in range(0, len(self._content), chunk_size):
+            chunk = self._content[idx:idx + chunk_size]
+            self.oci_client.transferred_octets += len(chunk)
+            yield chunk
+
+    def close(self):
+        pass
+
+
+def _tar(files: dict[str, bytes]) -> bytes:
+    buf = io.BytesIO()
+    with tarfile.open(fileobj=buf, mode='w') as tf:
+        info = tarfile.TarInfo(name='./etc')
+        info.type = tarfile.DIRTYPE
+        tf.addfile(info)
+
+        for name, content in files.items():
+            info = tarfile.TarInfo(name=name)
+            info.size = len(content)
+            tf.addfile(info, io.BytesIO(content))
+
+    return buf.getvalue()
+
+
+@pytest.fixture
+def files():
+    rnd = random.Random(42)
+    # compressible, but not trivially compressible content (so we need many deflate-blocks)
+    words = [os.urandom(4).hex() for _ in range(256)]
+
+    def content(size):
+        return ' '.join(rnd.choice(words) for _ in range(size // 9)).encode('utf-8')
+
+    return {
+        f'./etc/file-{idx}': content(size)
+        for idx, size in enumerate((10, 300_000, 2_000_000, 0, 1_500_000, 5000))
+    }
+
+
+def test_build_layer_index(files):
+    blob = gzip.compress(_tar(files))
+    index = ol.build_layer_index(
+        digest='sha256:abc',
+        chunks=(blob[idx:idx + 4096] for idx in range(0, len(blob), 4096)),
+        span=256 * 1024,
+    )
+
+    assert index.compressed
+    assert len(index.checkpoints) > 4
+    assert index.checkpoints[0].uncompressed_offset == 0
+    assert [m.name for m in index.members] == ['etc'] + [
+        name.removeprefix('./') for name in files
+    ]
+    assert index.member('/etc/').isdir()
+
+    # index is expected to survive serialisation roundtrip
+    assert ol.LayerIndex.from_dict(dataclasses.asdict(index)) == index
+
+
+@pytest.mark.parametrize('compress', (True, False))
+@pytest.mark.parametrize('support_ranges', (True, False))
+def test_read_member(files, compress, support_ranges):
+    blob = _tar(files)
+    if compress:
+        blob = gzip.compress(blob)
+
+    oci_client = FakeOciClient(blob=blob, support_ranges=support_ranges)
+    index = ol.build_layer_index(
+        digest='sha256:abc',
+        chunks=(blob,),
+        span=256 * 1024,
+    )
+
+    for name, content in files.items():
+        oci_client.transferred_octets = 0
+
+        assert ol.read_member(
+            oci_client=oci_client,
+            image_reference='example.org/image:1.2.3',
+            index=index,
+            member=index.member(name),
+        ) == content
+
+        if support_ranges and len(content) < 10_000:
+            # at most one compressed span (plus first, small range-request) is expected to be read
+            assert oci_client.transferred_octets < 256 * 1024
+        elif not support_ranges:
+            # blob is expected to be retrieved (at most) once per member
+            assert oci_client.transferred_octets <= len(blob)
+
+
+def test_range_reader_eof():
+    blob = os.urandom(100_000)
+    oci_client = FakeOciClient(blob=blob)
+
+    with ol._RangeReader(
+        oci_client=oci_client,
+        image_reference='example.org/image:1.2.3',
+        digest='sha256:abc',
+        offset=10,
+    ) as reader:
+        data = bytearray()
+        while (chunk := reader.read()):
+            data += chunk
+
+    assert data == blob[10:]
+
+
+def test_image_file_reader(files, tmpdir):
+    lower = gzip.compress(_tar(files))
+    upper = gzip.compress(_tar({'etc/file-0': b'overwritten'}))
+    # zstd-compressed layers are not supported (and thus expected to be skipped)
+    unsupported = b'\x28\xb5\x2f\xfd' + os.urandom(1024)
+    blobs = {
+        'sha256:lower': FakeOciClient(lower),
+        'sha256:upper': FakeOciClient(upper),
+        'sha256:unsupported': FakeOciClient(unsupported),
+    }
+
+    class OciClient:
+        def blob(self, image_reference, digest, **kwargs):
+            return blobs[digest].blob(image_reference, digest, **kwargs)
+
+    manifest = om.OciImageManifest(
+        config=om.OciBlobRef(digest='sha256:cfg', mediaType='', size=0),
+        layers=[
+            om.OciBlobRef(digest='sha256:lower', mediaType='', size=len(lower)),
+            om.OciBlobRef(digest='sha256:upper', mediaType='', size=len(upper)),
+            om.OciBlobRef(digest='sha256:unsupported', mediaType='', size=len(unsupported)),
+        ],
+    )
+
+    reader = ol.ImageFileReader(
+        oci_client=OciClient(),
+        image_reference='example.org/image:1.2.3',
+        manifest=manifest,
+        cache_dir=tmpdir,
+    )
+
+    assert reader.read('/etc/file-0') == b'overwritten'
+    assert reader.read('etc/file-5') == files['./etc/file-5']
+    assert reader.read('etc') is None
+    assert reader.read('does/not/exist') is None
+
+    # indices are expected to be read from cache_dir
+    blobs['sha256:lower'].transferred_octets = 0
+    reader = ol.ImageFileReader(
+        oci_client=OciClient(),
+        image_reference='example.org/image:1.2.3',
+        manifest=manifest,
+        cache_dir=tmpdir,
+    )
+    assert reader.read('etc/file-5') == files['./etc/file-5']
+    assert blobs['sha256:lower'].transferred_octets < len(lower)
@@ -0,0 +1,247 @@
+import concurrent.futures
+import hashlib
+import json
+import threading
+
+import oci
+import oci.model as om
+import oci.mount
+
+
+def _digest(octets: bytes) -> str:
+    return f'sha256:{hashlib.sha256(octets).hexdigest()}'
+
+
+class _FakeResponse:
+    def __init__(self, content: bytes=b'', ok: bool=True, headers: dict | None=None):
+        self.content = content
+        self.text = content.decode('utf-8', errors='replace')
+        self.ok = ok
+        self.headers = headers or {'Content-Length': str(len(content))}
+
+    def __bool__(self):
+        return self.ok
+
+    def iter_content(self, chunk_size: int):
+        for idx in range(0, len(self.content), chunk_size):
+            yield self.content[idx:idx + chunk_size]
+
+
+class FakeRegistries:
+    '''
+    in-memory stand-in for (multiple) oci-registries, implementing the subset of
+    `oci.client.Client` required for replication; records uploaded and mounted blobs
+    '''
+    def __init__(self, support_mounts: bool=True, failing_mounts: int=0):
+        self.support_mounts = support_mounts
+        self.failing_mounts = failing_mounts # count of (initial) mount-attempts expected to fail
+        self.mount_attempts = 0
+        self._lock = threading.Lock()
+        self.blobs: dict[tuple[str, str], bytes] = {} # (repository, digest) -> blob
+        self.manifests: dict[str, bytes] = {} # image-reference -> manifest
+        self.uploads: list[tuple[str, str]] = [] # (repository, digest)
+        self.mounts: list[tuple[str, str, str]] = [] # (repository, digest, from-repository)
+
+    def add_image(self, image_reference: str, layers: list[bytes]) -> bytes:
+        repository = om.OciImageReference(image_reference).ref_without_tag
+        cfg = json.dumps({'rootfs': {'diff_ids': []}}).encode('utf-8')
+
+        for blob in (cfg, *layers):
+            self.blobs[(repository, _digest(blob))] = blob
+
+        manifest = json.dumps(om.OciImageManifest(
+            config=om.OciBlobRef(digest=_digest(cfg), mediaType='application/json', size=len(cfg)),
+            layers=[
+                om.OciBlobRef(
+                    digest=_digest(layer),
+                    mediaType='application/vnd.oci.image.layer.v1.tar+gzip',
+                    size=len(layer),
+                ) for layer in layers
+            ],
+        ).as_dict()).encode('utf-8')
+        self.manifests[image_reference] = manifest
+
+        return manifest
+
+    def manifest_raw(self, image_reference, accept=None, absent_ok=False):
+        return _FakeResponse(content=self.manifests[str(image_reference)])
+
+    def put_manifest(self, image_reference, manifest):
+        if isinstance(manifest, str):
+            manifest = manifest.encode('utf-8')
+        self.manifests[str(image_reference)] = manifest
+        return _FakeResponse()
+
+    def head_blob(self, image_reference, digest, absent_ok=False):
+        repository = om.OciImageReference(image_reference).ref_without_tag
+        return _FakeResponse(ok=(repository, digest) in self.blobs)
+
+    def blob(self, image_reference, digest, absent_ok=False, stream=True):
+        repository = om.OciImageReference(image_reference).ref_without_tag
+        return _FakeResponse(content=self.blobs[(repository, digest)])
+
+    def put_blob(self, image_reference, digest, octets_count, data):
+        repository = om.OciImageReference(image_reference).ref_without_tag
+        if isinstance(data, _FakeResponse):
+            data = data.content
+
+        assert _digest(data) == digest
+        assert len(data) == octets_count
+
+        with self._lock:
+            self.blobs[(repository, digest)] = data
+            self.uploads.append((repository, digest))
+
+    def mount_blob(self, image_reference, digest, from_reference):
+        image_reference = om.OciImageReference(image_reference)
+        from_reference = om.OciImageReference(from_reference)
+
+        if not self.support_mounts or image_reference.netloc != from_reference.netloc:
+            return False
+
+        with self._lock:
+            self.mount_attempts += 1
+            if self.mount_attempts <= self.failing_mounts:
+                return False
+            if not (blob := self.blobs.get((from_reference.ref_without_tag, digest))):
+                return False
+            self.blobs[(image_reference.ref_without_tag, digest)] = blob
+            self.mounts.append((image_reference.ref_without_tag, digest, from_reference.name))
+
+        return True
+
+
+_layers = [f'layer-{idx}'.encode('utf-8') * 1000 for idx in range(4)]
+_layer_octets = sum(len(layer) for layer in _layers)
+
+_targets = [
+    'registry-a.example.org/ocm-1/image:1.0',
+    'registry-a.example.org/ocm-2/image:1.0',
+    'registry-a.example.org/ocm-3/image:1.0',
+    'registry-b.example.org/ocm-1/image:1.0',
+]
+
+
+def _replicate_to_targets(
+    registries: FakeRegistries,
+    blob_mounts: oci.mount.BlobMountPlanner | None,
+):
+    src_ref = 'source.example.org/image:1.0'
+    registries.add_image(image_reference=src_ref, layers=_layers)
+
+    def replicate(tgt_ref: str):
+        return oci.replicate_artifact(
+            src_image_reference=src_ref,
+            tgt_image_reference=tgt_ref,
+            oci_client=registries,
+            blob_mounts=blob_mounts,
+        )
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=len(_targets)) as executor:
+        results = list(executor.map(replicate, _targets))
+
+    # all targets are expected to hold a full copy of the image
+    for tgt_ref, (_, _, manifest_bytes) in zip(_targets, results):
+        repository = om.OciImageReference(tgt_ref).ref_without_tag
+        manifest = json.loads(manifest_bytes)
+        for layer in manifest['layers']:
+            assert (repository, layer['digest']) in registries.blobs
+
+
+def test_replicate_to_multiple_targets_mounts_blobs():
+    registries = FakeRegistries()
+    blob_mounts = oci.mount.BlobMountPlanner()
+
+    _replicate_to_targets(registries=registries, blob_mounts=blob_mounts)
+
+    layer_digests = {_digest(layer) for layer in _layers}
+    uploaded_layers = [
+        (repository, digest) for repository, digest in registries.uploads
+        if digest in layer_digests
+    ]
+
+    # each layer is expected to be uploaded once per registry host
+    assert len(uploaded_layers) == 2 * len(_layers)
+    assert len(set(uploaded_layers)) == len(uploaded_layers)
+    # ... and mounted into the other repositories of the same host
+    assert len(registries.mounts) == 2 * len(_layers)
+    assert all(
+        repository.startswith('registry-a.example.org')
+        for repository, _, _ in registries.mounts
+    )
+
+    assert blob_mounts.mounted_octets == 2 * _layer_octets
+    assert blob_mounts.uploaded_octets == 2 * _layer_octets
+
+
+def test_replicate_to_multiple_targets_without_planner():
+    registries = FakeRegistries()
+
+    _replicate_to_targets(registries=registries, blob_mounts=None)
+
+    assert not registries.mounts
+    assert len(registries.uploads) == len(_targets) * (len(_layers) + 1)
+
+
+def test_replicate_to_multiple_targets_without_mount_support():
+    registries = FakeRegistries(support_mounts=False)
+    blob_mounts = oci.mount.BlobMountPlanner()
+
+    _replicate_to_targets(registries=registries, blob_mounts=blob_mounts)
+
+    # expect fallback to regular uploads
+    assert not registries.mounts
+    assert blob_mounts.mounted_octets == 0
+    assert blob_mounts.uploaded_octets == len(_targets) * _layer_octets
+
+
+def test_failed_mount_falls_back_to_upload_for_single_blob():
+    # first mount fails (e.g. missing pull-privileges); host must not be considered as lacking
+    # mount-support
+    registries = FakeRegistries(failing_mounts=1)
+    blob_mounts = oci.mount.BlobMountPlanner()
+
+    _replicate_to_targets(registries=registries, blob_mounts=blob_mounts)
+
+    assert len(registries.mounts) == 2 * len(_layers) - 1
+    assert blob_mounts.mounted_octets == 2 * _layer_octets - len(_layers[0])
+
+
+def test_mounts_are_no_longer_attempted_after_max_failures():
+    registries = FakeRegistries(failing_mounts=100)
+    blob_mounts = oci.mount.BlobMountPlanner(max_mount_failures=3)
+
+    _replicate_to_targets(registries=registries, blob_mounts=blob_mounts)
+
+    assert not registries.mounts
+    # (concurrent) attempts might exceed max_mount_failures, but w/o limit, there would be two
+    # attempts per blob (layers and cfg-blob) on registry-a
+    assert 3 <= registries.mount_attempts < 2 * (len(_layers) + 1)
+    assert blob_mounts.uploaded_octets == len(_targets) * _layer_octets
+
+
+def test_blob_present_is_used_as_upload_target():
+    registries = FakeRegistries()
+    blob_mounts = oci.mount.BlobMountPlanner()
+
+    blob = b'present-blob'
+    registries.blobs[('registry-a.example.org/existing', _digest(blob))] = blob
+    blob_mounts.blob_present(
+        image_reference='registry-a.example.org/existing:1.0',
+        digest=_digest(blob),
+    )
+
+    def upload():
+        raise AssertionError('blob is expected to be mounted')
+
+    assert blob_mounts.mount_or_upload(
+        oci_client=registries,
+        image_reference='registry-a.example.org/other:1.0',
+        digest=_digest(blob),
+        octets_count=len(blob),
+        upload=upload,
+    )
+    assert blob_mounts.upload_target(
+        image_reference='registry-a.example.org/other:1.0',
+        digest=_digest(blob),
+    ) == 'registry-a.example.org/existing'
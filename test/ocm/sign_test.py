@@ -0,0 +1,179 @@
+import collections
+
+import pytest
+
+import ocm
+import ocm.sign
+
+
+def _component_descriptor(
+    name: str,
+    version: str,
+    references: list[ocm.ComponentIdentity],
+) -> ocm.ComponentDescriptor:
+    return ocm.ComponentDescriptor(
+        component=ocm.Component(
+            name=name,
+            version=version,
+            repositoryContexts=[],
+            provider='acme.org',
+            sources=[],
+            componentReferences=[
+                ocm.ComponentReference(
+                    name=reference.name.replace('/', '-'),
+                    componentName=reference.name,
+                    version=reference.version,
+                ) for reference in references
+            ],
+            resources=[],
+            labels=[],
+            creationTime=None,
+        ),
+        meta=ocm.Metadata(),
+    )
+
+
+def _diamond_graph(depth: int, width: int=2) -> dict[ocm.ComponentIdentity, ocm.ComponentDescriptor]:
+    '''
+    returns component descriptors forming a diamond-shaped graph, where each component of a layer
+    references all components of the next layer (without memoisation, leaf-components are thus
+    visited `width ** depth` times)
+    '''
+    component_descriptors = {}
+    references = []
+
+    for layer in reversed(range(depth)):
+        layer_ids = []
+        for idx in range(width):
+            component_id = ocm.ComponentIdentity(name=f'acme.org/c-{layer}-{idx}', version='1.0.0')
+            component_descriptors[component_id] = _component_descriptor(
+                name=component_id.name,
+                version=component_id.version,
+                references=references,
+            )
+            layer_ids.append(component_id)
+        references = layer_ids
+
+    root_id = ocm.ComponentIdentity(name='acme.org/root', version='1.0.0')
+    component_descriptors[root_id] = _component_descriptor(
+        name=root_id.name,
+        version=root_id.version,
+        references=references,
+    )
+
+    return component_descriptors
+
+
+@pytest.mark.parametrize('verify_digests', (False, True))
+def test_component_descriptor_digest_is_memoised(verify_digests):
+    component_descriptors = _diamond_graph(depth=16)
+    lookups = collections.Counter()
+
+    def component_descriptor_lookup(component_id):
+        lookups[component_id] += 1
+        return component_descriptors[component_id]
+
+    root = component_descriptors[ocm.ComponentIdentity(name='acme.org/root', version='1.0.0')]
+
+    digest_memo = ocm.sign.DigestMemo()
+    digest = ocm.sign.component_descriptor_digest(
+        component_descriptor=root,
+        component_descriptor_lookup=component_descriptor_lookup,
+        access_to_digest_lookup=None,
+        verify_digests=verify_digests,
+        digest_memo=digest_memo,
+    )
+
+    # each (referenced) component is expected to be normalised only once
+    assert set(lookups.values()) == {1}
+    assert len(lookups) == len(component_descriptors) - 1
+    assert digest_memo.hits > 0
+
+    # passing a memo (or not) must not affect the digest
+    assert digest == ocm.sign.component_descriptor_digest(
+        component_descriptor=root,
+        component_descriptor_lookup=component_descriptor_lookup,
+        access_to_digest_lookup=None,
+        verify_digests=verify_digests,
+    )
+
+
+def test_memoised_digests_match_standalone_digests():
+    component_descriptors = _diamond_graph(depth=3)
+    root = component_descriptors[ocm.ComponentIdentity(name='acme.org/root', version='1.0.0')]
+
+    normalised = ocm.sign.normalise_component(
+        component=root.component,
+        component_descriptor_lookup=component_descriptors.__getitem__,
+        access_to_digest_lookup=None,
+        digest_memo=ocm.sign.DigestMemo(),
+    )
+    component_references = next(
+        attr['componentReferences'] for attr in normalised if 'componentReferences' in attr
+    )
+
+    for cref, normalised_cref in zip(root.component.componentReferences, component_references):
+        digest = next(attr['digest'] for attr in normalised_cref if 'digest' in attr)
+        digest_value = next(attr['value'] for attr in digest if 'value' in attr)
+
+        component_id = ocm.ComponentIdentity(name=cref.componentName, version=cref.version)
+        assert digest_value == ocm.sign.component_descriptor_digest(
+            component_descriptor=component_descriptors[component_id],
+            component_descriptor_lookup=component_descriptors.__getitem__,
+            access_to_digest_lookup=None,
+        )
+
+
+def test_prefetching_access_to_digest_lookup():
+    component_descriptors = _diamond_graph(depth=3)
+    for component_descriptor in component_descriptors.values():
+        component = component_descriptor.component
+        component.resources = [
+            ocm.Resource(
+                name=f'image-{idx}',
+                version='1.0.0',
+                type=ocm.ArtefactType.OCI_IMAGE,
+                # resources of all components in same layer share one access
+                access=ocm.OciAccess(imageReference=f'{component.name[:-2]}/image:{idx}'),
+            ) for idx in range(3)
+        ]
+    root = component_descriptors[ocm.ComponentIdentity(name='acme.org/root', version='1.0.0')]
+
+    resolved_accesses = collections.Counter()
+
+    def access_to_digest_lookup(access):
+        if access.imageReference.endswith(':2') and 'c-2' in access.imageReference:
+            raise ValueError(access.imageReference)
+        resolved_accesses[access.imageReference] += 1
+        return ocm.DigestSpec(
+            hashAlgorithm='SHA-256',
+            normalisationAlgorithm=ocm.NormalisationAlgorithm.OCI_ARTIFACT_DIGEST,
+            value=access.imageReference,
+        )
+
+    # errors are expected to be raised upon lookup of the respective access only
+    with pytest.raises(ValueError):
+        ocm.sign.component_descriptor_digest(
+            component_descriptor=root,
+            component_descriptor_lookup=component_descriptors.__getitem__,
+            access_to_digest_lookup=access_to_digest_lookup,
+        )
+
+    def digest(max_workers: int) -> str:
+        resolved_accesses.clear()
+        return ocm.sign.component_descriptor_digest(
+            component_descriptor=root,
+            component_descriptor_lookup=component_descriptors.__getitem__,
+            access_to_digest_lookup=access_to_digest_lookup,
+            max_workers=max_workers,
+        )
+
+    for component_descriptor in component_descriptors.values():
+        component_descriptor.component.resources.pop()
+
+    serial_digest = digest(max_workers=1)
+    assert digest(max_workers=4) == serial_digest
+
+    # each distinct access is expected to be resolved only once
+    assert set(resolved_accesses.values()) == {1}
+    assert len(resolved_accesses) == 4 * 2
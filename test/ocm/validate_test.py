@@ -1,4 +1,12 @@
+import collections
 import copy
+import dataclasses
+import json
+import random
+import threading
+import time
+
+import jsonschema
 import pytest
 
 import ocm
@@ -167,3 +175,108 @@ def test_ValidationError_as_error_message():
     assert 'something went wrong' in message
     assert valid_ocm_component_descriptor.component.name in message
     assert valid_ocm_component_descriptor.component.version in message
+
+
+def test_validate_json_schema():
+    raw = json.loads(json.dumps(
+        dataclasses.asdict(valid_ocm_component_descriptor),
+        cls=ocm.EnumJSONEncoder,
+    ))
+    schema = ocm._read_schema_file(ocm.default_json_schema_path)
+
+    # validator is expected to be created only once
+    assert ocm.json_schema_validator() is ocm.json_schema_validator()
+
+    ocm.validate_json_schema(instance=raw)
+
+    raw['component']['name'] = 'invalid-cname'
+    with pytest.raises(jsonschema.ValidationError) as cached_validator_error:
+        ocm.validate_json_schema(instance=raw)
+
+    # errors are expected to match those of jsonschema.validate
+    with pytest.raises(jsonschema.ValidationError) as error:
+        jsonschema.validate(instance=raw, schema=schema)
+
+    assert cached_validator_error.value.message == error.value.message
+    assert cached_validator_error.value.path == error.value.path
+
+
+class FakeOciClient:
+    '''
+    fake for `oci.client.Client.head_manifest`, injecting latency
+    '''
+    def __init__(self, existing_image_references: set[str], latency_seconds: float=0.01):
+        self.existing_image_references = existing_image_references
+        self.latency_seconds = latency_seconds
+        self.requested_image_references = collections.Counter()
+        self._lock = threading.Lock()
+
+    def head_manifest(self, image_reference, absent_ok, accept):
+        with self._lock:
+            self.requested_image_references[str(image_reference)] += 1
+        time.sleep(self.latency_seconds * random.random())
+
+        return str(image_reference) in self.existing_image_references
+
+
+def test_iter_results_concurrent_access_checks():
+    components = []
+    for idx in range(20):
+        component = copy.deepcopy(valid_ocm_component_descriptor.component)
+        component.name = f'acme.org/component-{idx}'
+        component.resources = [
+            ocm.Resource(
+                name=f'image-{resource_idx}',
+                version='1.2.3',
+                type=ocm.ArtefactType.OCI_IMAGE,
+                # image-references are shared between components
+                access=ocm.OciAccess(
+                    imageReference=f'example.org/image-{(idx + resource_idx) % 7}:1.2.3',
+                ),
+            ) for resource_idx in range(5)
+        ]
+        components.append(component)
+
+    def nodes():
+        for component in components:
+            yield from ocm.iter.iter(
+                component=component,
+                lookup=None,
+                recursion_depth=0,
+            )
+
+    validation_cfg = ocm.validate.ValidationCfg(
+        schema=ocm.validate.ValidationMode.SKIP,
+        access=ocm.validate.ValidationMode.FAIL,
+        artefact_uniqueness=ocm.validate.ValidationMode.SKIP,
+    )
+    existing_image_references = {f'example.org/image-{idx}:1.2.3' for idx in range(7) if idx % 3}
+
+    def results(max_workers: int, lookahead: int=256):
+        oci_client = FakeOciClient(existing_image_references=existing_image_references)
+        results = [
+            (str(result.node), result.passed)
+            for result in ocm.validate.iter_results(
+                nodes=nodes(),
+                validation_cfg=validation_cfg,
+                oci_client=oci_client,
+                max_workers=max_workers,
+                lookahead=lookahead,
+            )
+        ]
+        return results, oci_client.requested_image_references
+
+    serial_results, _ = results(max_workers=1)
+    # only absent images are expected to be reported
+    assert serial_results
+    assert not any(passed for _, passed in serial_results)
+
+    for lookahead in (0, 3, 256):
+        concurrent_results, requested_image_references = results(
+            max_workers=8,
+            lookahead=lookahead,
+        )
+        # results are expected in traversal order, and each image to be checked only once
+        assert concurrent_results == serial_results
+        assert set(requested_image_references.values()) == {1}
+        assert len(requested_image_references) == 7
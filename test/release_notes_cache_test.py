@@ -0,0 +1,56 @@
+import os
+
+import git
+
+import release_notes.cache as rnc
+
+
+def test_source_block_cache(tmpdir):
+    repo = git.Repo.init(tmpdir)
+    commit = repo.index.commit(
+        'a commit\n\n```feature user\nadded a feature\n```\n'
+    )
+    cache_path = os.path.join(tmpdir, 'cache.db')
+
+    with rnc.SourceBlockCache(path=cache_path) as cache:
+        blocks = cache.source_blocks(source=commit, content=commit.message)
+        assert (cache.hits, cache.misses) == (0, 1)
+
+    assert len(blocks) == 1
+    block = blocks[0]
+    assert block.category == 'feature'
+    assert block.target_group == 'user'
+    assert block.note_message == 'added a feature'
+
+    # cache is expected to persist across instances
+    with rnc.SourceBlockCache(path=cache_path) as cache:
+        # pass differing content to ensure it is not parsed again
+        cached_blocks = cache.source_blocks(source=commit, content='')
+        assert (cache.hits, cache.misses) == (1, 0)
+
+    assert cached_blocks == blocks
+    assert cached_blocks[0].source == commit
+    assert cached_blocks[0].author == block.author
+    assert cached_blocks[0].reference_identifier == block.reference_identifier
+
+
+def test_source_block_cache_format_version(tmpdir, monkeypatch):
+    repo = git.Repo.init(tmpdir)
+    commit = repo.index.commit(
+        'a commit\n\n```feature user\nadded a feature\n```\n'
+    )
+    cache_path = os.path.join(tmpdir, 'cache.db')
+
+    with rnc.SourceBlockCache(path=cache_path) as cache:
+        cache.source_blocks(source=commit, content=commit.message)
+
+    # blocks cached w/ different format-version are expected to be discarded
+    monkeypatch.setattr(rnc, '_format_version', 'changed')
+    with rnc.SourceBlockCache(path=cache_path) as cache:
+        blocks = cache.source_blocks(source=commit, content='')
+        assert (cache.hits, cache.misses) == (0, 1)
+        assert blocks == []
+
+    with rnc.SourceBlockCache(path=cache_path) as cache:
+        cache.source_blocks(source=commit, content='')
+        assert (cache.hits, cache.misses) == (1, 0)
@@ -0,0 +1,123 @@
+import random
+import time
+
+import ocm
+import ocm.gardener
+import release_notes.ocm as rno
+
+
+class _Blob:
+    def __init__(self, content: bytes):
+        self.content = content
+
+
+class FakeOciClient:
+    def blob(self, image_reference, digest, **kwargs):
+        time.sleep(random.random() / 100)
+        return _Blob(content=digest.encode('utf-8'))
+
+
+def comp(
+    name: str,
+    version: str,
+    refs: dict[str, str]={},
+) -> ocm.Component:
+    return ocm.Component(
+        name=name,
+        version=version,
+        provider={
+            'name': 'some company',
+        },
+        repositoryContexts=[
+            ocm.OciOcmRepository(baseUrl='example.org/ocm'),
+        ],
+        componentReferences=[
+            ocm.ComponentReference(
+                name=ref_name,
+                componentName=ref_name,
+                version=ref_version,
+            ) for ref_name, ref_version in refs.items()
+        ],
+        sources=[],
+        resources=[
+            ocm.Resource(
+                name=rno.release_notes_resource_name_old,
+                version=version,
+                type='text',
+                access=ocm.LocalBlobAccess(
+                    localReference=f'{name}:{version}',
+                    mediaType='text/markdown',
+                ),
+            ),
+        ],
+        labels=[],
+    )
+
+
+def components() -> list[ocm.Component]:
+    # root -> a, b; a -> c; b -> c (diamond)
+    return [
+        comp('root', '1.0.0', {'a': '1.0.0', 'b': '1.0.0'}),
+        comp('root', '1.1.0', {'a': '1.1.0', 'b': '1.1.0'}),
+        comp('root', '1.2.0', {'a': '1.2.0', 'b': '1.1.0'}),
+        comp('a', '1.0.0', {'c': '1.0.0'}),
+        comp('a', '1.1.0', {'c': '1.1.0'}),
+        comp('a', '1.2.0', {'c': '1.2.0'}),
+        comp('b', '1.0.0', {'c': '1.0.0'}),
+        comp('b', '1.1.0', {'c': '1.2.0'}),
+        comp('c', '1.0.0'),
+        comp('c', '1.1.0'),
+        comp('c', '1.2.0'),
+    ]
+
+
+def test_release_notes_for_vector():
+    components_by_id = {
+        component.identity(): component
+        for component in components()
+    }
+
+    def component_descriptor_lookup(component_id: ocm.ComponentIdentity):
+        time.sleep(random.random() / 100)
+        return ocm.ComponentDescriptor(
+            meta=ocm.Metadata(),
+            component=components_by_id[component_id],
+        )
+
+    def version_lookup(component_name: str):
+        time.sleep(random.random() / 100)
+        return [
+            component_id.version
+            for component_id in components_by_id
+            if component_id.name == component_name
+        ]
+
+    upgrade_vector = ocm.gardener.UpgradeVector(
+        whence=ocm.ComponentIdentity(name='root', version='1.0.0'),
+        whither=ocm.ComponentIdentity(name='root', version='1.2.0'),
+    )
+
+    def release_notes(max_workers: int):
+        return [
+            release_notes_doc.release_notes[0].contents
+            for release_notes_doc in rno.release_notes_for_vector(
+                upgrade_vector=upgrade_vector,
+                component_descriptor_lookup=component_descriptor_lookup,
+                version_lookup=version_lookup,
+                oci_client=FakeOciClient(),
+                max_workers=max_workers,
+            )
+        ]
+
+    expected = [
+        'root:1.1.0',
+        'a:1.1.0',
+        'c:1.1.0',
+        'b:1.1.0',
+        'c:1.2.0',
+        'root:1.2.0',
+        'a:1.2.0',
+    ]
+
+    assert release_notes(max_workers=1) == expected
+    assert release_notes(max_workers=16) == expected
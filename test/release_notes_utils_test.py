@@ -0,0 +1,166 @@
+import json
+import re
+import types
+
+import git
+import github3.pulls
+import pytest
+
+import gitutil
+import ocm
+import release_notes.utils as rnu
+
+
+def _pull_request_node(number: int) -> dict:
+    return {
+        'number': number,
+        'title': f'pull request {number}',
+        'body': f'body {number}',
+        'url': f'https://github.com/acme/repo/pull/{number}',
+        'state': 'MERGED',
+        'createdAt': '2024-01-01T00:00:00Z',
+        'updatedAt': '2024-01-02T00:00:00Z',
+        'closedAt': '2024-01-02T00:00:00Z',
+        'mergedAt': '2024-01-02T00:00:00Z',
+        'author': {'login': 'author', 'url': 'https://github.com/author'},
+        'labels': {'nodes': [{'name': 'kind/bug'}]},
+    }
+
+
+class FakeGithub:
+    '''
+    implements the subset of github3.GitHub used to look up (associated) pull requests via GraphQL
+    '''
+    def __init__(self, pull_numbers: dict[str, list[int]]):
+        self.pull_numbers = pull_numbers
+        self.session = types.SimpleNamespace(base_url='https://api.github.com')
+        self.posted_urls = []
+        self.queried_numbers = []
+
+    def _post(self, url, data):
+        self.posted_urls.append(url)
+        query = data['query']
+
+        repository = {}
+        for alias, sha in _iter_commit_aliases(query):
+            if (numbers := self.pull_numbers.get(sha)) is None:
+                continue
+            repository[alias] = {
+                'associatedPullRequests': {
+                    'nodes': [_pull_request_node(number) for number in numbers],
+                },
+            }
+
+        for alias, number in _iter_pull_aliases(query):
+            self.queried_numbers.append(int(number))
+            repository[alias] = _pull_request_node(int(number))
+
+        return json.dumps({'data': {'repository': repository}})
+
+    def _json(self, response, status_code):
+        return json.loads(response)
+
+
+def _iter_commit_aliases(query: str):
+    yield from re.findall(r'(c\d+): object\(oid: "([0-9a-f]+)"\)', query)
+
+
+def _iter_pull_aliases(query: str):
+    yield from re.findall(r'(p\d+): pullRequest\(number: (\d+)\)', query)
+
+
+@pytest.fixture
+def git_helper(tmpdir):
+    repo = git.Repo.init(tmpdir)
+    repo.index.commit('first commit')
+    repo.create_remote('origin', url=repo.working_tree_dir)
+
+    return gitutil.GitHelper(
+        repo=repo,
+        git_cfg=gitutil.GitCfg(
+            user_name='test',
+            user_email='test@example.org',
+        ),
+    )
+
+
+def test_list_associated_pulls():
+    shas = [f'{idx:040x}' for idx in range(250)]
+    gh = FakeGithub(pull_numbers={
+        shas[0]: [1],
+        shas[120]: [2, 3],
+        shas[249]: [],
+    })
+
+    pulls = rnu.list_associated_pulls(
+        gh=gh,
+        owner='acme',
+        repo='repo',
+        shas=shas,
+    )
+
+    assert {sha: [pull.number for pull in sha_pulls] for sha, sha_pulls in pulls.items()} == {
+        shas[0]: [1],
+        shas[120]: [2, 3],
+    }
+    assert gh.posted_urls == ['https://api.github.com/graphql'] * 3
+
+    pull = pulls[shas[0]][0]
+    assert isinstance(pull, github3.pulls.ShortPullRequest)
+    assert pull.title == 'pull request 1'
+    assert pull.body == 'body 1'
+    assert pull.html_url == 'https://github.com/acme/repo/pull/1'
+    assert pull.user.login == 'author'
+    assert pull.labels == [{'name': 'kind/bug'}]
+    assert pull.updated_at.isoformat() == '2024-01-02T00:00:00+00:00'
+
+
+def test_graphql_url():
+    gh = types.SimpleNamespace(
+        session=types.SimpleNamespace(base_url='https://github.example.org/api/v3'),
+    )
+    assert rnu._graphql_url(gh) == 'https://github.example.org/api/graphql'
+
+
+def test_request_pull_requests_from_api(git_helper, monkeypatch):
+    repo = git_helper.repo
+    commits = [repo.index.commit(f'commit {idx}') for idx in range(3)]
+
+    gh = FakeGithub(pull_numbers={
+        commits[0].hexsha: [1],
+        commits[1].hexsha: [1, 2],
+    })
+
+    github_access = ocm.GithubAccess(repoUrl='github.com/acme/repo')
+
+    def request_pull_requests():
+        return rnu.request_pull_requests_from_api(
+            git_helper=git_helper,
+            github_api_lookup=lambda repo_url: gh,
+            github_access=github_access,
+            commits=commits,
+            component=None,
+        )
+
+    result = request_pull_requests()
+
+    assert {sha: [pr.number for pr in prs] for sha, prs in result.items()} == {
+        commits[0].hexsha: [1],
+        commits[1].hexsha: [1, 2],
+    }
+    # pull requests are expected to be retrieved along w/ associated commits
+    assert not gh.queried_numbers
+    assert len(gh.posted_urls) == 1
+
+    # pull request numbers are expected to be read from notes, subsequently
+    gh.pull_numbers = {}
+    result = request_pull_requests()
+
+    assert {sha: [pr.number for pr in prs] for sha, prs in result.items()} == {
+        commits[0].hexsha: [1],
+        commits[1].hexsha: [1, 2],
+    }
+    # pull requests referenced from notes are expected to be retrieved (once) in a single batch;
+    # commit w/o associated pull requests (and thus w/o notes) is expected to be looked up again
+    assert sorted(gh.queried_numbers) == [1, 2]
+    assert len(gh.posted_urls) == 3
@@ -3,6 +3,18 @@
 # SPDX-License-Identifier: Apache-2.0
 
 
+import datetime
+import hashlib
+import http.server
+import ipaddress
+import ssl
+import threading
+
+import cryptography.hazmat.primitives.asymmetric.ec
+import cryptography.hazmat.primitives.hashes
+import cryptography.hazmat.primitives.serialization as crypto_serialisation
+import cryptography.x509
+import cryptography.x509.oid
 import pytest
 
 import signingserver
@@ -28,3 +40,169 @@ def test_distinguished_name():
 
     with pytest.raises(ValueError):
         signingserver.DistinguishedName.parse('Y=wrong-attribute')
+
+
+def _certificate(
+    common_name: str,
+    issuer_name: cryptography.x509.Name | None=None,
+    issuer_key=None,
+    is_ca: bool=False,
+):
+    key = cryptography.hazmat.primitives.asymmetric.ec.generate_private_key(
+        cryptography.hazmat.primitives.asymmetric.ec.SECP256R1(),
+    )
+    name = cryptography.x509.Name([
+        cryptography.x509.NameAttribute(cryptography.x509.oid.NameOID.COMMON_NAME, common_name),
+    ])
+    now = datetime.datetime.now(tz=datetime.timezone.utc)
+
+    builder = cryptography.x509.CertificateBuilder(
+        subject_name=name,
+        issuer_name=issuer_name or name,
+        public_key=key.public_key(),
+        serial_number=cryptography.x509.random_serial_number(),
+        not_valid_before=now - datetime.timedelta(minutes=1),
+        not_valid_after=now + datetime.timedelta(hours=1),
+    ).add_extension(
+        cryptography.x509.BasicConstraints(ca=is_ca, path_length=None),
+        critical=True,
+    )
+    if not is_ca:
+        builder = builder.add_extension(
+            cryptography.x509.SubjectAlternativeName([
+                cryptography.x509.IPAddress(ipaddress.ip_address('127.0.0.1')),
+            ]),
+            critical=False,
+        )
+
+    certificate = builder.sign(
+        private_key=issuer_key or key,
+        algorithm=cryptography.hazmat.primitives.hashes.SHA256(),
+    )
+
+    return certificate, key
+
+
+def _write_pem(path, certificate, key) -> tuple[str, str]:
+    cert_path = str(path.join(f'{path.basename}.crt'))
+    key_path = str(path.join(f'{path.basename}.key'))
+
+    with open(cert_path, 'wb') as f:
+        f.write(certificate.public_bytes(crypto_serialisation.Encoding.PEM))
+    with open(key_path, 'wb') as f:
+        f.write(key.private_bytes(
+            encoding=crypto_serialisation.Encoding.PEM,
+            format=crypto_serialisation.PrivateFormat.PKCS8,
+            encryption_algorithm=crypto_serialisation.NoEncryption(),
+        ))
+
+    return cert_path, key_path
+
+
+class _SigningserverStub(http.server.ThreadingHTTPServer):
+    '''
+    local https-server requiring client-certificates (mutual tls), echoing digests as signatures;
+    records number of established connections
+    '''
+    def __init__(self, server_cert: tuple[str, str], ca_cert: str):
+        self.connections = 0
+        self.lock = threading.Lock()
+        server = self
+
+        class RequestHandler(http.server.BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1' # keep-alive
+            disable_nagle_algorithm = True
+
+            def setup(self):
+                super().setup()
+                with server.lock:
+                    server.connections += 1
+
+            def do_POST(self):
+                digest = self.rfile.read(int(self.headers['Content-Length']))
+                body = (
+                    '-----BEGIN SIGNATURE-----\n'
+                    'Signature Algorithm: rsassa-pss\n'
+                    '\n'
+                    f'{digest.hex()}\n'
+                    '-----END SIGNATURE-----\n'
+                ).encode('utf-8')
+
+                self.send_response(200)
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args, **kwargs):
+                pass
+
+        super().__init__(('127.0.0.1', 0), RequestHandler)
+
+        ssl_context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+        ssl_context.load_cert_chain(*server_cert)
+        ssl_context.load_verify_locations(cafile=ca_cert)
+        ssl_context.verify_mode = ssl.CERT_REQUIRED
+        self.socket = ssl_context.wrap_socket(self.socket, server_side=True)
+
+
+@pytest.fixture
+def signingserver_stub(tmpdir):
+    ca_certificate, ca_key = _certificate(common_name='ca', is_ca=True)
+    ca_cert_path, _ = _write_pem(tmpdir.mkdir('ca'), ca_certificate, ca_key)
+
+    server_cert = _write_pem(
+        tmpdir.mkdir('server'),
+        *_certificate(
+            common_name='server',
+            issuer_name=ca_certificate.subject,
+            issuer_key=ca_key,
+        ),
+    )
+    client_cert = _write_pem(
+        tmpdir.mkdir('client'),
+        *_certificate(
+            common_name='client',
+            issuer_name=ca_certificate.subject,
+            issuer_key=ca_key,
+        ),
+    )
+
+    server = _SigningserverStub(server_cert=server_cert, ca_cert=ca_cert_path)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+
+    client = signingserver.SigningserverClient(
+        cfg=signingserver.SigningserverClientCfg(
+            base_url=f'https://127.0.0.1:{server.server_port}',
+            client_certificate=client_cert[0],
+            client_certificate_key=client_cert[1],
+            server_certificate_ca=ca_cert_path,
+        ),
+    )
+
+    yield server, client
+
+    client.close()
+    server.shutdown()
+    server.server_close()
+
+
+def test_sign_reuses_connections(signingserver_stub):
+    server, client = signingserver_stub
+    digests = [hashlib.sha256(f'content-{idx}'.encode()).hexdigest() for idx in range(20)]
+
+    for digest in digests:
+        assert client.sign(digest=digest).signature == digest
+
+    assert server.connections == 1
+
+
+def test_sign_many(signingserver_stub):
+    server, client = signingserver_stub
+    digests = [hashlib.sha256(f'content-{idx}'.encode()).hexdigest() for idx in range(100)]
+
+    signing_responses = client.sign_many(digests=digests, max_workers=4)
+
+    # results are expected in order of passed digests
+    assert [signing_response.signature for signing_response in signing_responses] == digests
+    assert server.connections <= 4
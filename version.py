@@ -63,7 +63,7 @@ class VersionRetentionPolicy:
         if self.restrict is VersionRestriction.NONE:
             return True
         elif self.restrict is VersionRestriction.SAME_MINOR:
-            ref_version = version.parse_to_semver(ref_version)
+            ref_version = parse_to_semver(ref_version)
             return ref_version.minor == version.minor
         else:
             raise RuntimeError(f'not implemented: {self.restrict}')